@@ -0,0 +1,205 @@
+# benchmarks/bench_ad_stats.py
+"""
+Write-behind ad counters: how many events one worker can count, and how
+many statements it takes to get them into ad_stats.
+
+    python -m benchmarks.bench_ad_stats --ads 2000 --events 1000000
+
+  recorder        AdStatsRecorder.add from one thread, and from `--threads`
+                  threads at once (a threadpool full of sync handlers)
+  endpoint        POST /public/advertisements/impressions with
+                  `--batch` ad ids per request, through the whole app
+  flush           statements and time to write every pending count, vs the
+                  one UPDATE per event a direct write would cost
+  totals          ad_stats matches the events sent; unknown ids are dropped
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+
+from benchmarks.common import configure_env, summarize, time_calls
+
+configure_env("ad_stats")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import func, insert, select, update  # noqa: E402
+
+from benchmarks.load_sync_vs_async import seed  # noqa: E402
+from core.ad_stats import CLICKS, IMPRESSIONS, AdStatsRecorder  # noqa: E402
+from core.ad_stats import ad_stats  # noqa: E402
+from core.database import SessionLocal  # noqa: E402
+from core.ids import uuid7  # noqa: E402
+from core.request_metrics import queries_total  # noqa: E402
+from models.ad_stat import AdStat  # noqa: E402
+from models.advertisement import Advertisement  # noqa: E402
+from models.trip import Trip  # noqa: E402
+
+
+def seed_ads(count: int) -> list[uuid.UUID]:
+    with SessionLocal() as db:
+        trip_ids = db.scalars(select(Trip.id)).all()
+        ad_ids = [uuid7() for _ in range(count)]
+        db.execute(insert(Advertisement), [
+            {
+                "id": ad_id,
+                "title": f"Ad {n}",
+                "image_url": f"https://cdn.example.com/{n}.jpg",
+                "trip_id": trip_ids[n % len(trip_ids)],
+                "is_active": True,
+            }
+            for n, ad_id in enumerate(ad_ids)
+        ])
+        db.commit()
+    return ad_ids
+
+
+def totals() -> tuple[int, int, int]:
+    with SessionLocal() as db:
+        return tuple(db.execute(select(
+            func.count(),
+            func.coalesce(func.sum(AdStat.impressions), 0),
+            func.coalesce(func.sum(AdStat.clicks), 0),
+        )).one())
+
+
+def events_per_second(recorder, events: list, threads: int) -> dict:
+    """Feed `events` to `recorder`, split across `threads` threads."""
+    chunks = [events[n::threads] for n in range(threads)]
+
+    def work(chunk):
+        add = recorder.add
+        for ad_id, event in chunk:
+            add(ad_id, event)
+
+    workers = [
+        threading.Thread(target=work, args=(chunk,)) for chunk in chunks
+    ]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    return {
+        "threads": threads,
+        "events": len(events),
+        "seconds": round(elapsed, 3),
+        "events_per_second": round(len(events) / elapsed),
+    }
+
+
+def flush(recorder) -> dict:
+    pending = recorder.pending()
+    queries = queries_total.value()
+    started = time.perf_counter()
+    written = recorder.flush()
+    return {
+        "ads": pending,
+        "written": written,
+        "statements": int(queries_total.value() - queries),
+        "ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def per_event_updates(events: list, sample: int) -> dict:
+    """The direct alternative: one UPDATE and commit per event."""
+    columns = {IMPRESSIONS: AdStat.impressions, CLICKS: AdStat.clicks}
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        for ad_id, event in events[:sample]:
+            db.execute(
+                update(AdStat)
+                .where(AdStat.ad_id == ad_id)
+                .values({columns[event]: columns[event] + 1})
+            )
+            db.commit()
+    elapsed = time.perf_counter() - started
+    return {
+        "events": sample,
+        "events_per_second": round(sample / elapsed),
+        "statements_for_all_events": len(events),
+    }
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trips", type=int, default=200)
+    parser.add_argument("--ads", type=int, default=2_000)
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args(argv)
+
+    seed(args.trips)
+    ad_ids = seed_ads(args.ads)
+    rng = random.Random(7)
+    # Roughly one click per fifty impressions, skewed towards a few ads.
+    events = [
+        (ad_ids[min(int(rng.paretovariate(1.2)) - 1, args.ads - 1)],
+         CLICKS if rng.random() < 0.02 else IMPRESSIONS)
+        for _ in range(args.events)
+    ]
+    clicks = sum(event == CLICKS for _, event in events)
+
+    # Thresholds out of the way: every flush below is explicit.
+    recorder = AdStatsRecorder(flush_keys=10**9, max_keys=10**9)
+    results = {
+        "recorder_single": events_per_second(recorder, events, 1),
+        "flush_single": flush(recorder),
+    }
+    results["recorder_threads"] = events_per_second(
+        recorder, events, args.threads
+    )
+    results["flush_threads"] = flush(recorder)
+
+    # Two passes of every event, plus ids that match no advertisement.
+    for _ in range(100):
+        recorder.add(uuid7(), IMPRESSIONS)
+    results["flush_unknown"] = flush(recorder)
+    assert results["flush_unknown"]["written"] == 0
+    results["totals"] = dict(zip(("ads", "impressions", "clicks"), totals()))
+    assert results["totals"]["impressions"] == 2 * (args.events - clicks)
+    assert results["totals"]["clicks"] == 2 * clicks
+
+    results["per_event_updates"] = per_event_updates(events, 2_000)
+
+    from main import app
+
+    before = totals()[1]
+    with TestClient(app) as client:
+        batches = iter(
+            rng.sample(ad_ids, args.batch) for _ in range(args.requests)
+        )
+        started = time.perf_counter()
+        samples = time_calls(
+            lambda: client.post(
+                "/public/advertisements/impressions",
+                json={"ad_ids": [str(ad_id) for ad_id in next(batches)]},
+            ).raise_for_status(),
+            args.requests,
+        )
+        elapsed = time.perf_counter() - started
+        pending = ad_stats.pending()
+    # Shutdown flushed what the interval had not yet written.
+    sent = args.requests * args.batch
+    assert ad_stats.pending() == 0
+    assert totals()[1] == before + sent
+    results["endpoint"] = {
+        **summarize(samples),
+        "events_per_second": round(sent / elapsed),
+        "pending_at_shutdown": pending,
+        "flushes": ad_stats.flushes,
+    }
+
+    print(json.dumps({
+        "ads": args.ads, "events": args.events, "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main_()
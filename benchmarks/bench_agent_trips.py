@@ -0,0 +1,173 @@
+# benchmarks/bench_agent_trips.py
+"""
+Latency and query plan of the agent "assigned trips" page as agents,
+trips, assignments and bookings grow:
+
+    python -m benchmarks.bench_agent_trips --scales 1000 10000 --agents 2000
+
+Each scale is a number of trips; every trip gets --agents-per-trip random
+agents and --bookings-per-trip bookings. The plan is printed for the
+largest scale; the run fails if any table is read by a full scan or if
+the plan is not driven from the agent's slice of trip_agents.
+"""
+
+import argparse
+import json
+import random
+import uuid
+from datetime import date, timedelta
+
+from benchmarks.common import (
+    configure_env,
+    migrate_database,
+    summarize,
+    time_calls,
+)
+
+configure_env("agent_trips")
+
+from sqlalchemy import insert, text  # noqa: E402
+
+from core.database import SessionLocal, engine  # noqa: E402
+from core.ids import uuid7  # noqa: E402
+from models.booking import Booking, BookingStatus  # noqa: E402
+from models.enums import UserRole  # noqa: E402
+from models.location import Location  # noqa: E402
+from models.trip import Trip, TripStatus  # noqa: E402
+from models.trip_agent import TripAgent  # noqa: E402
+from models.user import User  # noqa: E402
+from routers.agent import assigned_trips_query  # noqa: E402
+
+BATCH_SIZE = 10_000
+
+
+def insert_batched(db, model, rows: list[dict]):
+    for offset in range(0, len(rows), BATCH_SIZE):
+        db.execute(insert(model), rows[offset:offset + BATCH_SIZE])
+
+
+def seed_agents(count: int) -> list[uuid.UUID]:
+    agent_ids = [uuid7() for _ in range(count)]
+    with SessionLocal() as db:
+        insert_batched(db, User, [
+            {
+                "id": agent_id,
+                "name": "Agent",
+                "email": f"{agent_id}@bench.local",
+                "password_hash": "x",
+                "role": UserRole.AGENT,
+                "is_active": True,
+            }
+            for agent_id in agent_ids
+        ])
+        db.commit()
+    return agent_ids
+
+
+def seed_trips(count: int, agent_ids, args, rng: random.Random):
+    today = date.today()
+    with SessionLocal() as db:
+        location = Location(name=f"Bench {uuid7()}")
+        db.add(location)
+        db.flush()
+
+        trips = [
+            {
+                "id": uuid7(),
+                "title": "Bench trip",
+                "description": "Bench",
+                "location_id": location.id,
+                "start_date": today + timedelta(days=rng.randrange(-180, 365)),
+                "end_date": today + timedelta(days=400),
+                "price": 1_000,
+                "capacity": 50,
+                "status": TripStatus.PUBLISHED,
+                "is_active": True,
+            }
+            for _ in range(count)
+        ]
+        insert_batched(db, Trip, trips)
+
+        insert_batched(db, TripAgent, [
+            {
+                "trip_id": trip["id"],
+                "agent_id": agent_id,
+                "trip_start_date": trip["start_date"],
+            }
+            for trip in trips
+            for agent_id in rng.sample(agent_ids, args.agents_per_trip)
+        ])
+
+        insert_batched(db, Booking, [
+            {
+                "id": uuid7(),
+                "trip_id": trip["id"],
+                "user_id": rng.choice(agent_ids),
+                "seats": rng.randint(1, 3),
+                "status": rng.choice(list(BookingStatus)),
+            }
+            for trip in trips
+            for _ in range(args.bookings_per_trip)
+        ])
+        db.commit()
+
+
+def query_plan(agent_id) -> list[str]:
+    statement = assigned_trips_query(agent_id, None).limit(51)
+    compiled = statement.compile(
+        engine, compile_kwargs={"literal_binds": True}
+    )
+    with engine.connect() as connection:
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+        return [row[-1] for row in rows]
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=[1_000, 10_000]
+    )
+    parser.add_argument("--agents", type=int, default=2_000)
+    parser.add_argument("--agents-per-trip", type=int, default=3)
+    parser.add_argument("--bookings-per-trip", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=1_000)
+    args = parser.parse_args(argv)
+
+    if engine.dialect.name != "sqlite":
+        parser.error("the plan check reads SQLite's EXPLAIN QUERY PLAN")
+
+    migrate_database()
+    rng = random.Random(5)
+    agent_ids = seed_agents(args.agents)
+
+    results = {}
+    seeded = 0
+    for scale in sorted(args.scales):
+        seed_trips(scale - seeded, agent_ids, args, rng)
+        seeded = scale
+
+        with SessionLocal() as db:
+            samples = time_calls(
+                lambda: db.execute(
+                    assigned_trips_query(rng.choice(agent_ids), None)
+                    .limit(51)
+                ).all(),
+                args.repeat,
+            )
+        results[scale] = summarize(samples)
+
+    plan = query_plan(agent_ids[0])
+    results["plan"] = plan
+    print(json.dumps(results, indent=2))
+
+    full_scans = [
+        step for step in plan
+        if step.startswith("SCAN ") and " USING " not in step
+    ]
+    assert not full_scans, full_scans
+    assert plan[0].startswith("SEARCH trip_agents"), plan
+    print("assigned trips query is index-backed")
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,90 @@
+# benchmarks/bench_bulk_trips.py
+"""
+Bulk trip import throughput and streaming export memory.
+
+Imports generated CSV files of increasing size through the same code path
+as POST /admin/trips/import, then drains the export stream for the whole
+table while tracing allocations: the export peak should stay flat as the
+table grows.
+
+    python -m benchmarks.bench_bulk_trips --scales 10000 100000
+"""
+
+import argparse
+import io
+import json
+import time
+import tracemalloc
+
+from benchmarks.common import configure_env, migrate_database
+
+configure_env("bulk_trips")
+
+from sqlalchemy import select  # noqa: E402
+
+from core.database import SessionLocal  # noqa: E402
+from models.location import Location  # noqa: E402
+from models.trip import Trip  # noqa: E402
+from routers.admin import (  # noqa: E402
+    import_records,
+    import_trips,
+    stream_export,
+)
+from schemas.trip import TripFileFormat  # noqa: E402
+
+HEADER = "title,description,location_id,start_date,end_date,price,capacity\n"
+
+
+def csv_upload(rows: int, location_id) -> io.BytesIO:
+    lines = [HEADER] + [
+        f"Trip {i},Bulk,{location_id},2026-{i % 12 + 1:02d}-01,"
+        f"2026-{i % 12 + 1:02d}-08,{1_000 + i % 500},40\n"
+        for i in range(rows)
+    ]
+    return io.BytesIO("".join(lines).encode())
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=[10_000, 100_000]
+    )
+    args = parser.parse_args(argv)
+
+    migrate_database()
+    with SessionLocal() as db:
+        location = Location(name="Bulk import")
+        db.add(location)
+        db.commit()
+        location_id = location.id
+
+    results = {}
+    for scale in args.scales:
+        upload = csv_upload(scale, location_id)
+        started = time.perf_counter()
+        with SessionLocal() as db:
+            report = import_trips(
+                db, import_records(upload, TripFileFormat.CSV)
+            )
+        elapsed = time.perf_counter() - started
+
+        tracemalloc.start()
+        exported = sum(
+            chunk.count("\n")
+            for chunk in stream_export(select(Trip), TripFileFormat.CSV)
+        ) - 1
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[scale] = {
+            "inserted": report["inserted"],
+            "import_rows_per_second": round(scale / elapsed),
+            "exported_rows": exported,
+            "export_peak_kib": round(peak / 1024),
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main_()
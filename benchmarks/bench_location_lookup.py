@@ -0,0 +1,105 @@
+# benchmarks/bench_location_lookup.py
+"""
+Location duplicate checks and prefix autocomplete: in-process registry
+versus the equivalent SQL on every call, plus the cost of a full reload:
+
+    python -m benchmarks.bench_location_lookup --locations 5000
+"""
+
+import argparse
+import json
+import random
+
+from benchmarks.common import (
+    configure_env,
+    migrate_database,
+    summarize,
+    time_calls,
+)
+
+configure_env("location_lookup")
+
+from sqlalchemy import func, insert, select  # noqa: E402
+
+from core.database import SessionLocal  # noqa: E402
+from core.ids import uuid7  # noqa: E402
+from core.locations import location_registry  # noqa: E402
+from models.location import Location  # noqa: E402
+
+SYLLABLES = ["ka", "sol", "ma", "na", "li", "spi", "ti", "ri", "shi", "kesh",
+             "var", "an", "to", "sh", "gar", "pur", "dha", "ram", "la"]
+SUFFIXES = ["", " Valley", " Hills", " Lake", " Fort", " Camp"]
+
+
+def seed(count: int, rng: random.Random) -> list[str]:
+    names = set()
+    while len(names) < count:
+        stem = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).title()
+        names.add(stem + rng.choice(SUFFIXES))
+
+    with SessionLocal() as db:
+        db.execute(insert(Location), [
+            {"id": uuid7(), "name": name} for name in names
+        ])
+        db.commit()
+    return sorted(names)
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--locations", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=2_000)
+    args = parser.parse_args(argv)
+
+    migrate_database()
+    rng = random.Random(15)
+    names = seed(args.locations, rng)
+    prefixes = [name[:rng.randint(1, 4)] for name in rng.sample(names, 100)]
+
+    with SessionLocal() as db:
+        reload = time_calls(lambda: location_registry.load(db), 20)
+
+        duplicate_sql = time_calls(
+            lambda: db.scalar(
+                select(Location.id).where(
+                    func.lower(Location.name) == rng.choice(names).lower()
+                )
+            ),
+            args.repeat,
+        )
+        complete_sql = time_calls(
+            lambda: db.execute(
+                select(Location.id, Location.name)
+                .where(func.lower(Location.name).like(
+                    rng.choice(prefixes).lower() + "%"
+                ))
+                .order_by(func.lower(Location.name))
+                .limit(10)
+            ).all(),
+            args.repeat,
+        )
+
+    duplicate_registry = time_calls(
+        lambda: location_registry.find(rng.choice(names)), args.repeat
+    )
+    complete_registry = time_calls(
+        lambda: location_registry.complete(rng.choice(prefixes), 10),
+        args.repeat,
+    )
+
+    print(json.dumps({
+        "locations": args.locations,
+        "reload": summarize(reload),
+        "duplicate_check": {
+            "sql": summarize(duplicate_sql),
+            "registry": summarize(duplicate_registry),
+        },
+        "autocomplete": {
+            "sql": summarize(complete_sql),
+            "registry": summarize(complete_registry),
+        },
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main_()
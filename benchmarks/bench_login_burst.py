@@ -0,0 +1,129 @@
+# benchmarks/bench_login_burst.py
+"""
+Latency of an unrelated route while `/auth/login` is being hammered.
+
+Runs the server with bcrypt inline (HASH_POOL_WORKERS=0), with the
+process pool, and with the pool plus the login rate limits, measuring
+`GET /admin/trips` first idle and then during a burst of concurrent
+logins:
+
+    python -m benchmarks.bench_login_burst --logins 200 --burst-concurrency 32
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from benchmarks.common import (
+    configure_env,
+    free_port,
+    migrate_database,
+    start_server,
+    summarize,
+)
+
+configure_env("login_burst")
+
+from core.config import (  # noqa: E402
+    DEFAULT_ADMIN_EMAIL,
+    DEFAULT_ADMIN_PASSWORD,
+)
+
+CREDENTIALS = {
+    "username": DEFAULT_ADMIN_EMAIL,
+    "password": DEFAULT_ADMIN_PASSWORD,
+}
+
+
+async def probe(client, headers, stop: asyncio.Event) -> list[float]:
+    samples = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/admin/trips", params={"limit": 5}, headers=headers)
+        samples.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.01)
+    return samples
+
+
+async def run(base_url: str, logins: int, concurrency: int, idle: float):
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        token = (await client.post("/auth/login", data=CREDENTIALS)).json()
+        headers = {"Authorization": f"Bearer {token['access_token']}"}
+
+        stop = asyncio.Event()
+        idle_task = asyncio.create_task(probe(client, headers, stop))
+        await asyncio.sleep(idle)
+        stop.set()
+        idle_samples = await idle_task
+
+        statuses = {}
+        remaining = logins
+
+        async def login_worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.post("/auth/login", data=CREDENTIALS)
+                statuses[response.status_code] = (
+                    statuses.get(response.status_code, 0) + 1
+                )
+
+        stop = asyncio.Event()
+        burst_task = asyncio.create_task(probe(client, headers, stop))
+        started = time.monotonic()
+        await asyncio.gather(*(login_worker() for _ in range(concurrency)))
+        elapsed = time.monotonic() - started
+        stop.set()
+        burst_samples = await burst_task
+
+    return {
+        "unrelated_idle": summarize(idle_samples),
+        "unrelated_during_burst": summarize(burst_samples),
+        "logins_per_sec": round(logins / elapsed, 1),
+        "login_statuses": statuses,
+    }
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--burst-concurrency", type=int, default=32)
+    parser.add_argument("--pool-workers", type=int, default=2)
+    parser.add_argument("--idle-seconds", type=float, default=3.0)
+    parser.add_argument("--login-limit", default="20/60")
+    args = parser.parse_args(argv)
+
+    migrate_database(seed_admin=True)
+    workers = str(args.pool_workers)
+    modes = {
+        "inline": {"HASH_POOL_WORKERS": "0"},
+        "process_pool": {"HASH_POOL_WORKERS": workers},
+        "rate_limited": {
+            "HASH_POOL_WORKERS": workers,
+            "RATE_LIMIT_LOGIN_IP": args.login_limit,
+            "RATE_LIMIT_LOGIN_ACCOUNT": args.login_limit,
+        },
+    }
+    results = {}
+    for name, env in modes.items():
+        port = free_port()
+        server = start_server(port, **env)
+        try:
+            results[name] = asyncio.run(run(
+                f"http://127.0.0.1:{port}",
+                args.logins,
+                args.burst_concurrency,
+                args.idle_seconds,
+            ))
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main_()
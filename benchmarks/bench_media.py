@@ -0,0 +1,195 @@
+# benchmarks/bench_media.py
+"""
+Ad image uploads and variant serving, against a real server (uvicorn)
+with `--workers` render processes:
+
+    python -m benchmarks.bench_media --uploads 16 --megapixels 12
+
+  upload          POST /admin/media of distinct camera-sized JPEGs streamed
+                  in 64 KiB chunks, `--concurrency` at a time; the server's
+                  peak RSS growth against the bytes uploaded
+  inline_render   what rendering the variants would add to each upload
+                  request if it were done inline
+  render          time until every upload is READY, rendered by the pool
+  serve           GET of a card variant, and its If-None-Match revalidation
+  bytes           original vs variant sizes sent to a client
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.common import (
+    configure_env,
+    free_port,
+    migrate_database,
+    start_server,
+    summarize,
+    time_calls,
+)
+
+configure_env("media")
+
+MEDIA_ROOT = tempfile.mkdtemp(prefix="anand_bench_media_")
+os.environ["MEDIA_ROOT"] = MEDIA_ROOT
+
+from PIL import Image  # noqa: E402
+
+from core.config import DEFAULT_ADMIN_EMAIL, DEFAULT_ADMIN_PASSWORD  # noqa: E402
+from core.media import (  # noqa: E402
+    MediaVariant,
+    asset_directory,
+    render_variants,
+)
+
+CHUNK = 64 * 1024
+
+
+def photo(megapixels: float, seed: int) -> bytes:
+    """A noisy gradient: compresses about as badly as a real photo."""
+    width = int((megapixels * 1_000_000 * 4 / 3) ** 0.5)
+    height = int(width * 3 / 4)
+    noise = Image.effect_noise((width, height), 40 + seed % 20)
+    gradient = Image.linear_gradient("L").resize((width, height))
+    image = Image.merge("RGB", (noise, gradient, noise.transpose(0)))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def peak_rss_kib(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def upload_all(base_url, headers, images, concurrency) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def chunks(body: bytes):
+        for start in range(0, len(body), CHUNK):
+            yield body[start:start + CHUNK]
+
+    async def upload(client, body):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(
+                "/admin/media",
+                content=chunks(body),
+                headers={**headers, "Content-Type": "image/jpeg"},
+            )
+            response.raise_for_status()
+            return (time.perf_counter() - started) * 1000, response.json()
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        return await asyncio.gather(
+            *(upload(client, body) for body in images)
+        )
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uploads", type=int, default=16)
+    parser.add_argument("--megapixels", type=float, default=12)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    migrate_database(seed_admin=True)
+    images = [photo(args.megapixels, seed) for seed in range(args.uploads)]
+
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_server(port, MEDIA_POOL_WORKERS=str(args.workers))
+    try:
+        token = httpx.post(f"{base_url}/auth/login", data={
+            "username": DEFAULT_ADMIN_EMAIL,
+            "password": DEFAULT_ADMIN_PASSWORD,
+        }).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        rss_before = peak_rss_kib(server.pid)
+        started = time.perf_counter()
+        uploads = asyncio.run(
+            upload_all(base_url, headers, images, args.concurrency)
+        )
+        uploaded = time.perf_counter() - started
+        rss_growth = peak_rss_kib(server.pid) - rss_before
+
+        assets = [asset for _, asset in uploads]
+        with httpx.Client(base_url=base_url, headers=headers) as client:
+            while any(
+                client.get(f"/admin/media/{asset['id']}").json()["status"]
+                == "PENDING"
+                for asset in assets
+            ):
+                time.sleep(0.05)
+            rendered = time.perf_counter() - started
+            statuses = {
+                client.get(f"/admin/media/{asset['id']}").json()["status"]
+                for asset in assets
+            }
+        assert statuses == {"READY"}, statuses
+
+        digest = assets[0]["id"]
+        inline_render = summarize(time_calls(
+            lambda: render_variants(asset_directory(digest), 10**9), 5
+        ))
+
+        card = f"{base_url}/public/media/{digest}/card"
+        with httpx.Client() as client:
+            etag = client.get(card).headers["etag"]
+            serve = {
+                "get": summarize(time_calls(
+                    lambda: client.get(card).raise_for_status(), args.repeat
+                )),
+                "not_modified": summarize(time_calls(
+                    lambda: client.get(
+                        card, headers={"If-None-Match": etag}
+                    ),
+                    args.repeat,
+                )),
+            }
+            sizes = {"original": len(images[0])}
+            for variant in MediaVariant:
+                sizes[variant.value] = len(client.get(
+                    f"{base_url}/public/media/{digest}/{variant.value}"
+                ).content)
+    finally:
+        server.terminate()
+        server.wait()
+
+    total_bytes = sum(map(len, images))
+    print(json.dumps({
+        "uploads": args.uploads,
+        "megapixels": args.megapixels,
+        "workers": args.workers,
+        "results": {
+            "upload": {
+                **summarize([ms for ms, _ in uploads]),
+                "mib_uploaded": round(total_bytes / 2**20, 1),
+                "seconds": round(uploaded, 3),
+                "server_peak_rss_growth_mib": round(rss_growth / 1024, 1),
+            },
+            "inline_render": inline_render,
+            "render": {
+                "seconds_until_all_ready": round(rendered, 3),
+                "images_per_second": round(args.uploads / rendered, 1),
+            },
+            "serve": serve,
+            "bytes": sizes,
+        },
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,70 @@
+# benchmarks/bench_metrics_overhead.py
+"""
+Per-request overhead of MetricsMiddleware.
+
+Calls a trivial ASGI app directly, with and without the middleware, so the
+difference is the instrumentation alone (no HTTP client or server):
+
+    python -m benchmarks.bench_metrics_overhead --requests 200000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from benchmarks.common import configure_env
+
+configure_env("metrics_overhead")
+
+from core.request_metrics import MetricsMiddleware  # noqa: E402
+
+
+class _Route:
+    path = "/admin/trips/{trip_id}"
+
+
+async def endpoint(scope, receive, send):
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def per_request_us(app, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(
+            {"type": "http", "method": "GET", "path": "/admin/trips/1"},
+            receive,
+            send,
+        )
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    bare = asyncio.run(per_request_us(endpoint, args.requests))
+    instrumented = asyncio.run(
+        per_request_us(MetricsMiddleware(endpoint), args.requests)
+    )
+
+    print(json.dumps({
+        "bare_us_per_request": round(bare, 3),
+        "instrumented_us_per_request": round(instrumented, 3),
+        "overhead_us_per_request": round(instrumented - bare, 3),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,51 @@
+# benchmarks/bench_otp_hashing.py
+"""
+Micro-benchmark of the OTP hashing backends: legacy bcrypt vs keyed HMAC.
+
+    python -m benchmarks.bench_otp_hashing --repeat 20
+"""
+
+import argparse
+import json
+
+from benchmarks.common import configure_env, summarize, time_calls
+
+configure_env("otp_hashing")
+
+from core import otp  # noqa: E402
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--hmac-repeat", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    code = otp.generate_otp()
+    bcrypt_hash = otp.legacy_context.hash(code)
+    hmac_hash = otp.hash_otp(code)
+
+    results = {
+        "bcrypt": {
+            "hash": summarize(time_calls(
+                lambda: otp.legacy_context.hash(code), args.repeat
+            )),
+            "verify": summarize(time_calls(
+                lambda: otp.verify_otp(code, bcrypt_hash), args.repeat
+            )),
+        },
+        "hmac_sha256": {
+            "hash": summarize(time_calls(
+                lambda: otp.hash_otp(code), args.hmac_repeat
+            )),
+            "verify": summarize(time_calls(
+                lambda: otp.verify_otp(code, hmac_hash), args.hmac_repeat
+            )),
+        },
+    }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,120 @@
+# benchmarks/bench_otp_lookup.py
+"""
+Latency of the "latest unused OTP for a user" lookup as
+`password_reset_otps` grows, plus the cost of one purge pass.
+
+    python -m benchmarks.bench_otp_lookup --scales 10000 100000 1000000
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import (
+    configure_env,
+    migrate_database,
+    summarize,
+    time_calls,
+)
+
+configure_env("otp_lookup")
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from core.database import SessionLocal  # noqa: E402
+from core.ids import uuid7  # noqa: E402
+from core.maintenance import purge_password_reset_otps  # noqa: E402
+from models.enums import UserRole  # noqa: E402
+from models.password_reset import PasswordResetOTP  # noqa: E402
+from models.user import User  # noqa: E402
+
+BATCH_SIZE = 10_000
+OTPS_PER_USER = 10
+
+
+def seed(count: int, user_ids: list, rng: random.Random):
+    now = datetime.utcnow()
+    with SessionLocal() as db:
+        new_users = count // OTPS_PER_USER - len(user_ids)
+        users = [uuid7() for _ in range(max(new_users, 1))]
+        for offset in range(0, len(users), BATCH_SIZE):
+            db.execute(insert(User), [
+                {
+                    "id": user_id,
+                    "name": "Bench",
+                    "email": f"{user_id}@bench.local",
+                    "password_hash": "x",
+                    "role": UserRole.USER,
+                    "is_active": True,
+                }
+                for user_id in users[offset:offset + BATCH_SIZE]
+            ])
+        user_ids.extend(users)
+
+        for offset in range(0, count, BATCH_SIZE):
+            db.execute(insert(PasswordResetOTP), [
+                {
+                    "id": uuid7(),
+                    "user_id": rng.choice(user_ids),
+                    "otp_hash": "hmac-sha256$00$00",
+                    "expires_at": now + timedelta(
+                        minutes=rng.randrange(-10_000, 5)
+                    ),
+                    "is_used": rng.random() < 0.8,
+                    "attempts": 0,
+                }
+                for _ in range(min(BATCH_SIZE, count - offset))
+            ])
+            db.commit()
+
+
+def lookup(db, user_id):
+    return db.scalars(
+        select(PasswordResetOTP)
+        .where(
+            PasswordResetOTP.user_id == user_id,
+            PasswordResetOTP.is_used == False,
+        )
+        .order_by(PasswordResetOTP.expires_at.desc())
+        .limit(1)
+    ).first()
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=2_000)
+    args = parser.parse_args(argv)
+
+    migrate_database()
+    rng = random.Random(1)
+    user_ids: list = []
+    results = {}
+    seeded = 0
+
+    for scale in sorted(args.scales):
+        seed(scale - seeded, user_ids, rng)
+        seeded = scale
+
+        with SessionLocal() as db:
+            samples = time_calls(
+                lambda: lookup(db, rng.choice(user_ids)), args.repeat
+            )
+        results[scale] = {"lookup": summarize(samples)}
+
+    started = time.perf_counter()
+    purged = purge_password_reset_otps()
+    results["purge"] = {
+        "rows_deleted": purged,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,174 @@
+# benchmarks/bench_otp_outbox.py
+"""
+OTP delivery through the outbox, against a local SMTP stub that adds
+`--rtt-ms` of latency to every reply (a remote mail server):
+
+    python -m benchmarks.bench_otp_outbox --messages 500 --rtt-ms 5
+
+  endpoint        POST /user/forgot-password: the OTP and its outbox row
+                  in one commit, no SMTP on the request
+  inline_send     what the request would add by sending inline: connect,
+                  EHLO, send, QUIT on a fresh connection
+  dispatch        dispatch_outbox draining `--messages` rows over one
+                  reused connection, vs reconnecting for every message
+  retries         the same with the stub refusing every third MAIL FROM
+                  with a 451: every message still arrives exactly once
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+
+from benchmarks.common import (
+    configure_env,
+    free_port,
+    migrate_database,
+    summarize,
+    time_calls,
+)
+
+configure_env("otp_outbox")
+
+SMTP_PORT = free_port()
+os.environ["OUTBOX_EMAIL_URL"] = f"smtp://127.0.0.1:{SMTP_PORT}?starttls=false"
+os.environ["OUTBOX_POLL_SECONDS"] = "0"
+os.environ["OUTBOX_BACKOFF_BASE_SECONDS"] = "0.01"
+os.environ["OUTBOX_BACKOFF_MAX_SECONDS"] = "0.05"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import func, insert, select  # noqa: E402
+
+from core import outbox  # noqa: E402
+from core.database import SessionLocal  # noqa: E402
+from core.ids import uuid7  # noqa: E402
+from models.enums import UserRole  # noqa: E402
+from models.outbox import (  # noqa: E402
+    OutboxChannel,
+    OutboxMessage,
+    OutboxStatus,
+)
+from models.user import User  # noqa: E402
+from tests.smtp_stub import SmtpStub  # noqa: E402
+
+
+# =====================================================
+# SCENARIOS
+# =====================================================
+
+def seed_users(count: int) -> list[str]:
+    emails = [f"outbox{n}@bench.example.com" for n in range(count)]
+    with SessionLocal() as db:
+        db.execute(insert(User), [
+            {
+                "id": uuid7(), "name": f"User {n}", "email": email,
+                "password_hash": "x", "role": UserRole.USER,
+                "is_active": True,
+            }
+            for n, email in enumerate(emails)
+        ])
+        db.commit()
+    return emails
+
+
+def pending() -> int:
+    with SessionLocal() as db:
+        return db.scalar(
+            select(func.count())
+            .where(OutboxMessage.status == OutboxStatus.PENDING)
+        )
+
+
+class Reconnecting(outbox.SmtpTransport):
+    """A fresh connection per message, as an inline send would use."""
+
+    def send(self, message):
+        try:
+            super().send(message)
+        finally:
+            self.close()
+
+
+def drain(stub: SmtpStub, transport) -> dict:
+    outbox.transports[OutboxChannel.EMAIL] = transport
+    stub.delivered.clear()
+    stub.connections = 0
+    expected = pending()
+
+    started = time.perf_counter()
+    while pending():
+        outbox.dispatch_outbox()
+        time.sleep(0.01)  # let backed-off messages fall due
+    elapsed = time.perf_counter() - started
+    transport.close()
+
+    assert len(stub.delivered) == expected, (len(stub.delivered), expected)
+    assert len(set(stub.delivered)) == expected
+    return {
+        "messages": expected,
+        "seconds": round(elapsed, 3),
+        "messages_per_second": round(expected / elapsed, 1),
+        "connections": stub.connections,
+    }
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--rtt-ms", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    migrate_database()
+    emails = seed_users(args.messages)
+    stub = SmtpStub(SMTP_PORT, args.rtt_ms / 1000)
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+
+    import main
+
+    client = TestClient(main.app)
+    requests = iter(emails)
+    endpoint = summarize(time_calls(
+        lambda: client.post(
+            "/user/forgot-password", json={"email": next(requests)}
+        ).raise_for_status(),
+        len(emails),
+    ))
+    assert pending() == len(emails)
+
+    smtp_url = os.environ["OUTBOX_EMAIL_URL"]
+    fresh = Reconnecting(smtp_url, "bench@example.com", 10)
+    probe = OutboxMessage(
+        channel=OutboxChannel.EMAIL, recipient="probe@example.com",
+        subject="probe", body="probe",
+    )
+    inline_send = summarize(time_calls(lambda: fresh.send(probe), 50))
+
+    def transport():
+        return outbox.SmtpTransport(smtp_url, "bench@example.com", 10)
+
+    results = {"endpoint": endpoint, "inline_send": inline_send}
+    results["dispatch_reused"] = drain(stub, transport())
+
+    for email in emails:
+        client.post("/user/forgot-password", json={"email": email})
+    results["dispatch_reconnecting"] = drain(
+        stub, Reconnecting(smtp_url, "bench@example.com", 10)
+    )
+
+    for email in emails:
+        client.post("/user/forgot-password", json={"email": email})
+    stub.fail_every = 3
+    retries = outbox.outbox_messages.value(channel="EMAIL", outcome="retried")
+    results["retries"] = drain(stub, transport())
+    results["retries"]["retried"] = int(
+        outbox.outbox_messages.value(channel="EMAIL", outcome="retried")
+        - retries
+    )
+
+    stub.shutdown()
+    print(json.dumps({"rtt_ms": args.rtt_ms, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main_()
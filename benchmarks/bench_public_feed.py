@@ -0,0 +1,85 @@
+# benchmarks/bench_public_feed.py
+"""
+Public feed latency: rebuilt from the DB (cache invalidated before every
+call), served from cache, and revalidated with If-None-Match (304).
+
+    python -m benchmarks.bench_public_feed --trips 5000 --ads-per-trip 2
+"""
+
+import argparse
+import json
+
+from benchmarks.common import configure_env, summarize, time_calls
+
+configure_env("public_feed")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+from benchmarks.load_sync_vs_async import seed  # noqa: E402
+from core.database import SessionLocal  # noqa: E402
+from core.feed_cache import feed_cache  # noqa: E402
+from core.ids import uuid7  # noqa: E402
+from models.advertisement import Advertisement  # noqa: E402
+from models.trip import Trip  # noqa: E402
+
+
+def seed_ads(per_trip: int):
+    with SessionLocal() as db:
+        trip_ids = db.scalars(select(Trip.id)).all()
+        db.execute(insert(Advertisement), [
+            {
+                "id": uuid7(),
+                "title": f"Ad {n}",
+                "image_url": f"https://cdn.example.com/{trip_id}/{n}.jpg",
+                "trip_id": trip_id,
+                "is_active": True,
+            }
+            for trip_id in trip_ids
+            for n in range(per_trip)
+        ])
+        db.commit()
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trips", type=int, default=5_000)
+    parser.add_argument("--ads-per-trip", type=int, default=2)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    seed(args.trips)
+    seed_ads(args.ads_per_trip)
+
+    from main import app
+
+    params = {"limit": args.limit}
+    with TestClient(app) as client:
+        etag = client.get("/public/feed", params=params).headers["etag"]
+
+        def rebuilt():
+            feed_cache.invalidate()
+            client.get("/public/feed", params=params)
+
+        results = {
+            "rebuilt": summarize(time_calls(rebuilt, args.repeat)),
+            "cached": summarize(time_calls(
+                lambda: client.get("/public/feed", params=params), args.repeat
+            )),
+            "not_modified": summarize(time_calls(
+                lambda: client.get(
+                    "/public/feed",
+                    params=params,
+                    headers={"If-None-Match": etag},
+                ),
+                args.repeat,
+            )),
+            "cache": feed_cache.stats(),
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,86 @@
+# benchmarks/bench_startup.py
+"""
+Cold start: `import main` in a fresh interpreter, run the lifespan and
+serve the first request, for both the sync and async stacks.
+
+    python -m benchmarks.bench_startup --runs 5 --target-ms 2000
+
+The database is migrated once up front, as a deploy would, so the timing
+covers only what every worker pays. The run fails if the median
+import + first response exceeds `--target-ms`.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from benchmarks.common import configure_env, migrate_database
+
+configure_env("startup")
+
+# Runs in the child interpreter; prints one JSON line of timings.
+CHILD = """
+import json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(main.app) as client:
+    ready = time.perf_counter()
+    status = client.get("/public/feed").status_code
+    served = time.perf_counter()
+assert status == 200, status
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "lifespan_ms": (ready - imported) * 1000,
+    "first_request_ms": (served - ready) * 1000,
+    "total_ms": (served - started) * 1000,
+}))
+"""
+
+
+def cold_start(db_async: bool) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        env=dict(os.environ, DB_ASYNC=str(db_async).lower()),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=2_000)
+    args = parser.parse_args(argv)
+
+    migrate_database(seed_admin=True)
+
+    results = {}
+    for name, db_async in (("sync", False), ("async", True)):
+        runs = [cold_start(db_async) for _ in range(args.runs)]
+        results[name] = {
+            key: round(statistics.median(run[key] for run in runs), 1)
+            for key in runs[0]
+        }
+
+    print(json.dumps(results, indent=2))
+
+    failures = [
+        name
+        for name, stats in results.items()
+        if stats["total_ms"] > args.target_ms
+    ]
+    if failures:
+        raise SystemExit(
+            f"cold start over {args.target_ms} ms: {failures}"
+        )
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,136 @@
+# benchmarks/bench_trip_catalog.py
+"""
+Latency of `GET /admin/trips` as the trips table grows.
+
+    python -m benchmarks.bench_trip_catalog --scales 1000 10000 100000 1000000
+
+Every filter scenario, including a page deep into the keyset, should keep
+a flat p99 across scales. The run fails if the largest scale's p99 is more
+than `--max-growth` times the smallest one.
+"""
+
+import argparse
+import json
+import random
+import uuid
+from datetime import date, timedelta
+
+from benchmarks.common import (
+    configure_env,
+    migrate_database,
+    summarize,
+    time_calls,
+)
+
+configure_env("trip_catalog")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+import main  # noqa: E402
+from core.database import SessionLocal  # noqa: E402
+from core.dependencies import require_admin  # noqa: E402
+from core.ids import uuid7  # noqa: E402
+from models.location import Location  # noqa: E402
+from models.trip import Trip, TripStatus  # noqa: E402
+
+BATCH_SIZE = 10_000
+STATUSES = list(TripStatus)
+
+
+def seed_trips(location_ids: list[uuid.UUID], count: int, rng: random.Random):
+    base = date(2025, 1, 1)
+    with SessionLocal() as db:
+        for offset in range(0, count, BATCH_SIZE):
+            rows = []
+            for _ in range(min(BATCH_SIZE, count - offset)):
+                start = base + timedelta(days=rng.randrange(730))
+                rows.append({
+                    "id": uuid7(),
+                    "title": "Benchmark trip",
+                    "description": "Synthetic row",
+                    "location_id": rng.choice(location_ids),
+                    "start_date": start,
+                    "end_date": start + timedelta(days=5),
+                    "price": rng.randrange(1_000, 100_000),
+                    "capacity": 40,
+                    "status": rng.choice(STATUSES),
+                    "is_active": rng.random() < 0.9,
+                })
+            db.execute(insert(Trip), rows)
+            db.commit()
+
+
+def scenarios(client: TestClient, location_id: uuid.UUID) -> dict:
+    def deep_cursor():
+        response = client.get(
+            "/admin/trips",
+            params={"start_from": "2026-01-01", "limit": 1},
+        )
+        return response.json()["next_cursor"]
+
+    cursor = deep_cursor()
+    return {
+        "first_page": {},
+        "location": {"location_id": str(location_id)},
+        "status": {"status": "PUBLISHED"},
+        "active_published": {"is_active": True, "status": "PUBLISHED"},
+        "price_and_window": {
+            "min_price": 20_000,
+            "max_price": 40_000,
+            "start_from": "2025-06-01",
+            "start_to": "2025-09-01",
+        },
+        "deep_page": {"cursor": cursor},
+    }
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--max-growth", type=float, default=3.0)
+    args = parser.parse_args(argv)
+
+    migrate_database()
+    rng = random.Random(42)
+    main.app.dependency_overrides[require_admin] = lambda: None
+    client = TestClient(main.app)
+
+    with SessionLocal() as db:
+        locations = [Location(name=f"Bench location {i}") for i in range(50)]
+        db.add_all(locations)
+        db.commit()
+        location_ids = [loc.id for loc in locations]
+
+    results = {}
+    seeded = 0
+    for scale in sorted(args.scales):
+        seed_trips(location_ids, scale - seeded, rng)
+        seeded = scale
+
+        results[scale] = {}
+        for name, params in scenarios(client, location_ids[0]).items():
+            samples = time_calls(
+                lambda: client.get("/admin/trips", params=params),
+                args.repeat,
+            )
+            results[scale][name] = summarize(samples)
+
+    print(json.dumps(results, indent=2))
+
+    smallest, largest = min(results), max(results)
+    failures = [
+        name
+        for name, stats in results[largest].items()
+        if stats["p99_ms"]
+        > args.max_growth * max(results[smallest][name]["p99_ms"], 1.0)
+    ]
+    if failures:
+        raise SystemExit(f"p99 grew more than {args.max_growth}x: {failures}")
+
+
+if __name__ == "__main__":
+    main_()
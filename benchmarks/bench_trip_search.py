@@ -0,0 +1,207 @@
+# benchmarks/bench_trip_search.py
+"""
+Trip search over a synthetic catalog: full rebuild throughput, query
+latency for exact, prefix, multi-word and misspelled queries, the cost of
+keeping the index in sync on a trip update, and a LIKE '%term%' scan for
+comparison:
+
+    python -m benchmarks.bench_trip_search --trips 500000
+
+Titles and descriptions are drawn from a fixed vocabulary of destinations
+and trip words so every query below has matches at any scale.
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import date, timedelta
+
+from benchmarks.common import (
+    configure_env,
+    migrate_database,
+    summarize,
+    time_calls,
+)
+
+configure_env("trip_search")
+
+from sqlalchemy import insert, or_, select, update  # noqa: E402
+
+from core.database import SessionLocal  # noqa: E402
+from core.ids import uuid7  # noqa: E402
+from core.search import (  # noqa: E402
+    rebuild_search_index,
+    search_trips,
+    sync_trips,
+)
+from models.location import Location  # noqa: E402
+from models.trip import Trip, TripStatus  # noqa: E402
+from routers.public import search_query  # noqa: E402
+
+BATCH_SIZE = 10_000
+
+DESTINATIONS = [
+    "Kasol", "Manali", "Shimla", "Rishikesh", "Varanasi", "Leh", "Ladakh",
+    "Spiti", "Kedarnath", "Badrinath", "Auli", "Munnar", "Coorg", "Ooty",
+    "Hampi", "Gokarna", "Goa", "Udaipur", "Jaisalmer", "Pushkar", "Darjeeling",
+    "Gangtok", "Tawang", "Shillong", "Kaziranga", "Andaman", "Pondicherry",
+    "Kodaikanal", "Wayanad", "Alleppey", "Mcleodganj", "Dharamshala",
+    "Nainital", "Mussoorie", "Chopta", "Tosh", "Kheerganga", "Bir",
+]
+TITLE_WORDS = [
+    "trek", "camping", "weekend", "expedition", "retreat", "pilgrimage",
+    "backpacking", "roadtrip", "rafting", "yoga", "heritage", "wildlife",
+    "sunrise", "valley", "glacier", "lake", "desert", "safari", "houseboat",
+    "monastery", "waterfall", "summit", "caves", "festival",
+]
+DESCRIPTION_WORDS = TITLE_WORDS + [
+    "guided", "meals", "included", "transport", "stay", "homestay", "hotel",
+    "bonfire", "river", "forest", "snow", "views", "local", "cuisine", "group",
+    "friendly", "beginner", "moderate", "difficult", "photography", "culture",
+    "temple", "market", "sunset", "stargazing", "tea", "gardens", "spiritual",
+]
+
+QUERIES = {
+    "exact_location": "manali",
+    "exact_title_word": "glacier",
+    "prefix": "kas",
+    "prefix_long": "kedarn",
+    "two_words": "spiti expedition",
+    "typo_location": "manaly",
+    "typo_two_words": "rishiksh raftng",
+    "no_match": "zanzibar",
+}
+
+
+def seed(count: int, rng: random.Random):
+    today = date.today()
+    with SessionLocal() as db:
+        locations = {name: uuid7() for name in DESTINATIONS}
+        db.execute(insert(Location), [
+            {"id": location_id, "name": name}
+            for name, location_id in locations.items()
+        ])
+
+        for offset in range(0, count, BATCH_SIZE):
+            rows = []
+            for _ in range(min(BATCH_SIZE, count - offset)):
+                destination = rng.choice(DESTINATIONS)
+                title = f"{destination} {' '.join(rng.sample(TITLE_WORDS, 2))}"
+                rows.append({
+                    "id": uuid7(),
+                    "title": title.title(),
+                    "description": " ".join(rng.choices(DESCRIPTION_WORDS, k=20)),
+                    "location_id": locations[rng.choice(DESTINATIONS)],
+                    "start_date": today + timedelta(days=rng.randrange(365)),
+                    "end_date": today + timedelta(days=400),
+                    "price": 1_000,
+                    "capacity": 20,
+                    "status": (
+                        TripStatus.PUBLISHED if rng.random() < 0.9
+                        else TripStatus.DRAFT
+                    ),
+                    "is_active": True,
+                })
+            db.execute(insert(Trip), rows)
+        db.commit()
+
+
+def search_page(db, query: str, limit: int = 20):
+    hits = search_trips(db, query, limit + 1)
+    if hits:
+        db.scalars(search_query([trip_id for trip_id, _ in hits])).all()
+    return hits
+
+
+def like_scan(db, query: str, limit: int = 20):
+    pattern = f"%{query}%"
+    return db.scalars(
+        select(Trip.id)
+        .join(Location, Location.id == Trip.location_id)
+        .where(or_(
+            Trip.title.ilike(pattern),
+            Trip.description.ilike(pattern),
+            Location.name.ilike(pattern),
+        ))
+        .limit(limit + 1)
+    ).all()
+
+
+def reindex_one(db, rng: random.Random, trip_ids: list[str]):
+    trip_id = rng.choice(trip_ids)
+    db.execute(
+        update(Trip)
+        .where(Trip.id == trip_id)
+        .values(title=f"Auli {rng.choice(TITLE_WORDS)} retreat")
+    )
+    sync_trips(db, [trip_id])
+    db.commit()
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trips", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--like-repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    migrate_database()
+    rng = random.Random(14)
+
+    started = time.perf_counter()
+    seed(args.trips, rng)
+    seeded = time.perf_counter() - started
+
+    started = time.perf_counter()
+    indexed = rebuild_search_index()
+    rebuild = time.perf_counter() - started
+
+    results = {
+        "trips": args.trips,
+        "seed_seconds": round(seeded, 2),
+        "rebuild": {
+            "indexed": indexed,
+            "seconds": round(rebuild, 2),
+            "trips_per_second": round(indexed / rebuild),
+        },
+        "search": {},
+        "like_scan": {},
+    }
+
+    with SessionLocal() as db:
+        for name, query in QUERIES.items():
+            hits = search_page(db, query)
+            samples = time_calls(lambda: search_page(db, query), args.repeat)
+            results["search"][name] = {
+                "query": query,
+                "hits": len(hits),
+                "fuzzy_hits": sum(fuzzy for _, fuzzy in hits),
+                **summarize(samples),
+            }
+
+        for name in ("exact_location", "typo_location", "no_match"):
+            query = QUERIES[name]
+            samples = time_calls(
+                lambda: like_scan(db, query), args.like_repeat
+            )
+            results["like_scan"][name] = {"query": query, **summarize(samples)}
+
+        trip_ids = db.scalars(
+            select(Trip.id)
+            .where(Trip.status == TripStatus.PUBLISHED)
+            .limit(10_000)
+        ).all()
+        samples = time_calls(
+            lambda: reindex_one(db, rng, trip_ids), args.repeat
+        )
+        results["sync_on_update"] = summarize(samples)
+
+    print(json.dumps(results, indent=2))
+
+    assert results["search"]["typo_location"]["fuzzy_hits"] > 0
+    assert results["search"]["no_match"]["hits"] == 0
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,179 @@
+# benchmarks/bench_user_directory.py
+"""
+Latency and query plans of the admin user directory (GET /admin/users)
+for every filter combination, over a large synthetic user table:
+
+    python -m benchmarks.bench_user_directory --users 1000000 --budget-ms 25
+
+Combinations are role (any / each role) x is_active (any / true / false)
+x search (none / name prefix / email prefix). Each sample fetches a first
+page and the page after it. The run fails if any combination's p95
+exceeds `--budget-ms`, or if its plan scans the table or sorts instead of
+reading an index in page order.
+"""
+
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import random
+
+from benchmarks.common import (
+    configure_env,
+    migrate_database,
+    summarize,
+    time_calls,
+)
+
+configure_env("user_directory")
+
+from sqlalchemy import insert, text  # noqa: E402
+
+from core.database import SessionLocal, engine  # noqa: E402
+from core.ids import uuid7  # noqa: E402
+from models.enums import UserRole  # noqa: E402
+from models.user import User  # noqa: E402
+from routers.admin import user_directory_query, user_page  # noqa: E402
+
+BATCH_SIZE = 20_000
+PAGE_SIZE = 50
+
+FIRST_NAMES = (
+    "Aarav", "Aditi", "Akash", "Ananya", "Arjun", "Bhavna", "Chetan",
+    "Deepa", "Dev", "Divya", "Farhan", "Gauri", "Harsh", "Isha", "Jay",
+    "Kabir", "Kavya", "Lakshmi", "Manav", "Meera", "Neha", "Nikhil", "Ojas",
+    "Pooja", "Priya", "Rahul", "Riya", "Rohan", "Sana", "Shreya", "Tanvi",
+    "Uday", "Varun", "Vikram", "Yash", "Zara", "Émile", "Ølivia",
+)
+LAST_NAMES = (
+    "Sharma", "Verma", "Iyer", "Nair", "Reddy", "Gupta", "Mehta", "Joshi",
+    "Kapoor", "Bose", "Das", "Khan", "Patel", "Rao", "Singh", "Menon",
+)
+DOMAINS = ("gmail.com", "yahoo.co.in", "outlook.com", "example.com")
+
+# role share of accounts; 1 in 10 deactivated
+ROLES = ((UserRole.USER, 0.97), (UserRole.AGENT, 0.025), (UserRole.ADMIN, 0.005))
+INACTIVE_SHARE = 0.1
+
+
+def seed_users(count: int, rng: random.Random):
+    roles, weights = zip(*ROLES)
+    with SessionLocal() as db:
+        for offset in range(0, count, BATCH_SIZE):
+            rows = []
+            for n in range(offset, min(offset + BATCH_SIZE, count)):
+                first = rng.choice(FIRST_NAMES)
+                last = rng.choice(LAST_NAMES)
+                rows.append({
+                    "id": uuid7(),
+                    "name": f"{first} {last}",
+                    "email": f"{first}.{last}{n}@{rng.choice(DOMAINS)}",
+                    "password_hash": "x",
+                    "role": rng.choices(roles, weights)[0],
+                    "is_active": rng.random() >= INACTIVE_SHARE,
+                })
+            db.execute(insert(User), rows)
+        db.commit()
+        db.execute(text("ANALYZE"))
+        db.commit()
+
+
+def statement(filters: dict, cursor: str | None = None):
+    return asyncio.run(user_directory_query(cursor=cursor, **filters))
+
+
+def prefix(rng: random.Random) -> str:
+    word = rng.choice(FIRST_NAMES)
+    return word[:rng.randint(1, 3)].lower()
+
+
+def combinations():
+    roles = (None, *UserRole)
+    actives = (None, True, False)
+    searches = (None, "name", "email")
+    for role, is_active, search in itertools.product(roles, actives, searches):
+        label = "/".join([
+            f"role={role.value if role else 'any'}",
+            f"active={'any' if is_active is None else is_active}",
+            f"search={search or 'none'}",
+        ])
+        yield label, role, is_active, search
+
+
+def query_plan(filters: dict) -> list[str]:
+    compiled = statement(filters).limit(PAGE_SIZE + 1).compile(
+        engine, compile_kwargs={"literal_binds": True}
+    )
+    with engine.connect() as connection:
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+        return [row[-1] for row in rows]
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--budget-ms", type=float, default=25.0)
+    args = parser.parse_args(argv)
+
+    if engine.dialect.name != "sqlite":
+        parser.error("the plan check reads SQLite's EXPLAIN QUERY PLAN")
+
+    migrate_database()
+    rng = random.Random(22)
+    seed_users(args.users, rng)
+    # Otherwise a full collection of the seed rows lands in some sample.
+    gc.collect()
+    gc.freeze()
+
+    results, failures = {}, []
+    with SessionLocal() as db:
+        for label, role, is_active, search in combinations():
+            def filters():
+                values = {
+                    "role": role, "is_active": is_active,
+                    "name": None, "email": None,
+                }
+                if search:
+                    values[search] = prefix(rng)
+                return values
+
+            def two_pages():
+                current = filters()
+                page = user_page(
+                    db.execute(
+                        statement(current).limit(PAGE_SIZE + 1)
+                    ).all(),
+                    PAGE_SIZE,
+                )
+                if page["next_cursor"]:
+                    following = db.execute(
+                        statement(current, page["next_cursor"])
+                        .limit(PAGE_SIZE + 1)
+                    ).all()
+                    # Resumes strictly after the cursor row.
+                    assert following[0].User.id not in {
+                        user.id for user in page["items"]
+                    }
+
+            stats = summarize(time_calls(two_pages, args.repeat))
+            plan = query_plan(filters())
+            results[label] = {**stats, "plan": plan}
+
+            if stats["p95_ms"] > args.budget_ms:
+                failures.append(f"{label}: p95 {stats['p95_ms']} ms")
+            for step in plan:
+                if (
+                    step.startswith("SCAN users") and " INDEX " not in step
+                ) or "TEMP B-TREE" in step:
+                    failures.append(f"{label}: {step}")
+
+    print(json.dumps(results, indent=2))
+    if failures:
+        raise SystemExit("\n".join(failures))
+    print(f"every combination within {args.budget_ms} ms, index-ordered")
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,172 @@
+# benchmarks/bench_uuid_keys.py
+"""
+Key storage layouts for a trips / bookings pair of tables: 36-char text
+UUIDv4 (the old trips.id), native UUIDv4 and native UUIDv7 (core.ids):
+
+    python -m benchmarks.bench_uuid_keys --trips 100000 --bookings-per-trip 5
+
+Reports index bytes per table (dbstat on SQLite, pg_indexes_size on
+PostgreSQL), bulk insert time, primary key lookups, a join from a few
+trips to their bookings, and a full join over every booking (key
+comparisons only, no Python in the loop).
+"""
+
+import argparse
+import json
+import random
+import time
+import uuid
+
+from benchmarks.common import configure_env, summarize, time_calls
+
+configure_env("uuid_keys")
+
+from sqlalchemy import (  # noqa: E402
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    insert,
+    select,
+    text,
+)
+
+from core.database import engine  # noqa: E402
+from core.ids import GUID, uuid7  # noqa: E402
+
+BATCH_SIZE = 10_000
+
+LAYOUTS = {
+    "text_uuid4": (String(36), lambda: str(uuid.uuid4())),
+    "native_uuid4": (GUID(), uuid.uuid4),
+    "native_uuid7": (GUID(), uuid7),
+}
+
+
+def tables(metadata: MetaData, name: str, key_type) -> tuple[Table, Table]:
+    trips = Table(
+        f"bench_{name}_trips",
+        metadata,
+        Column("id", key_type, primary_key=True),
+        Column("price", Integer, nullable=False),
+    )
+    bookings = Table(
+        f"bench_{name}_bookings",
+        metadata,
+        Column("id", key_type, primary_key=True),
+        Column("trip_id", key_type, ForeignKey(trips.c.id), nullable=False),
+        Column("seats", Integer, nullable=False),
+        Index(f"ix_bench_{name}_bookings_trip", "trip_id", "seats"),
+    )
+    return trips, bookings
+
+
+def seed(trips: Table, bookings: Table, new_id, count: int, per_trip: int):
+    trip_ids = []
+    with engine.begin() as conn:
+        for offset in range(0, count, BATCH_SIZE):
+            batch = [new_id() for _ in range(min(BATCH_SIZE, count - offset))]
+            conn.execute(
+                insert(trips), [{"id": key, "price": 100} for key in batch]
+            )
+            conn.execute(insert(bookings), [
+                {"id": new_id(), "trip_id": key, "seats": 1}
+                for key in batch
+                for _ in range(per_trip)
+            ])
+            trip_ids.extend(batch)
+    return trip_ids
+
+
+def index_bytes(table: Table) -> int:
+    with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            return conn.scalar(text(
+                "SELECT SUM(pgsize) FROM dbstat WHERE name IN ("
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'index' AND tbl_name = :table)"
+            ), {"table": table.name})
+        return conn.scalar(
+            text("SELECT pg_indexes_size(CAST(:table AS regclass))"),
+            {"table": table.name},
+        )
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trips", type=int, default=100_000)
+    parser.add_argument("--bookings-per-trip", type=int, default=5)
+    parser.add_argument("--join-trips", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=1_000)
+    parser.add_argument("--scan-repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    metadata = MetaData()
+    layouts = {
+        name: (tables(metadata, name, key_type), new_id)
+        for name, (key_type, new_id) in LAYOUTS.items()
+    }
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+    rng = random.Random(17)
+    results = {}
+    for name, ((trips, bookings), new_id) in layouts.items():
+        started = time.perf_counter()
+        trip_ids = seed(
+            trips, bookings, new_id, args.trips, args.bookings_per_trip
+        )
+        insert_seconds = time.perf_counter() - started
+
+        join = (
+            select(trips.c.id, func.sum(bookings.c.seats))
+            .join(bookings, bookings.c.trip_id == trips.c.id)
+            .group_by(trips.c.id)
+        )
+        with engine.connect() as conn:
+            lookups = time_calls(
+                lambda: conn.scalar(
+                    select(trips.c.price)
+                    .where(trips.c.id == rng.choice(trip_ids))
+                ),
+                args.repeat,
+            )
+            joins = time_calls(
+                lambda: conn.execute(join.where(
+                    trips.c.id.in_(rng.sample(trip_ids, args.join_trips))
+                )).all(),
+                args.repeat // 10,
+            )
+            scans = time_calls(
+                lambda: conn.scalar(
+                    select(func.count())
+                    .select_from(bookings)
+                    .join(trips, trips.c.id == bookings.c.trip_id)
+                ),
+                args.scan_repeat,
+            )
+
+        results[name] = {
+            "insert_s": round(insert_seconds, 2),
+            "trips_index_bytes": index_bytes(trips),
+            "bookings_index_bytes": index_bytes(bookings),
+            "pk_lookup": summarize(lookups),
+            f"join_{args.join_trips}_trips": summarize(joins),
+            "join_all": summarize(scans),
+        }
+
+    metadata.drop_all(engine)
+    print(json.dumps({
+        "dialect": engine.dialect.name,
+        "trips": args.trips,
+        "bookings": args.trips * args.bookings_per_trip,
+        "layouts": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main_()
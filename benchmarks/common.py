@@ -0,0 +1,109 @@
+# benchmarks/common.py
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run from the repo root against a throwaway SQLite database
+unless DATABASE_URL is already set:
+
+    python -m benchmarks.bench_trip_catalog
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+RATE_LIMITS = (
+    "RATE_LIMIT_LOGIN_IP",
+    "RATE_LIMIT_LOGIN_ACCOUNT",
+    "RATE_LIMIT_OTP_REQUEST_IP",
+    "RATE_LIMIT_OTP_REQUEST_ACCOUNT",
+    "RATE_LIMIT_OTP_VERIFY_IP",
+    "RATE_LIMIT_OTP_VERIFY_ACCOUNT",
+    "RATE_LIMIT_REGISTER_IP",
+)
+
+
+def configure_env(name: str) -> str:
+    """Point the app at a fresh SQLite file before `core.config` is imported."""
+    if "DATABASE_URL" not in os.environ:
+        path = os.path.join(tempfile.gettempdir(), f"anand_bench_{name}.db")
+        if os.path.exists(path):
+            os.remove(path)
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+    # Load comes from one address and one account; measure the endpoints,
+    # not the rate limiter, unless a benchmark turns limits back on.
+    for name in RATE_LIMITS:
+        os.environ.setdefault(name, "0")
+    return os.environ["DATABASE_URL"]
+
+
+def migrate_database(seed_admin: bool = False):
+    """Bring the benchmark database to the latest schema, as a deploy would."""
+    import cli
+
+    cli.migrate()
+    if seed_admin:
+        cli.seed_admin()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def summarize(samples_ms: list[float]) -> dict:
+    return {
+        "count": len(samples_ms),
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p95_ms": round(percentile(samples_ms, 95), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+    }
+
+
+def time_calls(fn, repeat: int) -> list[float]:
+    """Call `fn` `repeat` times, returning per-call latency in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, **env) -> subprocess.Popen:
+    """Run `uvicorn main:app` with extra environment and wait until it serves."""
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--port", str(port), "--log-level", "warning",
+        ],
+        env=dict(os.environ, **env),
+    )
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/docs", timeout=1)
+            return process
+        except httpx.TransportError:
+            time.sleep(0.2)
+
+    process.kill()
+    raise RuntimeError("server did not start")
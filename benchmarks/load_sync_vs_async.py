@@ -0,0 +1,146 @@
+# benchmarks/load_sync_vs_async.py
+"""
+Throughput and tail latency of the sync vs async router stacks.
+
+Boots `uvicorn main:app` once per mode (DB_ASYNC=false / true) against the
+same seeded SQLite file (aiosqlite in async mode), then drives a fixed
+number of concurrent clients for `--duration` seconds:
+
+    python -m benchmarks.load_sync_vs_async --concurrency 64 --duration 15
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import date, timedelta
+
+import httpx
+
+from benchmarks.common import (
+    configure_env,
+    free_port,
+    migrate_database,
+    start_server,
+    summarize,
+)
+
+configure_env("load_sync_vs_async")
+
+from sqlalchemy import insert  # noqa: E402
+
+from core.database import SessionLocal  # noqa: E402
+from core.config import (  # noqa: E402
+    DEFAULT_ADMIN_EMAIL,
+    DEFAULT_ADMIN_PASSWORD,
+)
+from core.ids import uuid7  # noqa: E402
+from models.location import Location  # noqa: E402
+from models.trip import Trip, TripStatus  # noqa: E402
+
+
+def seed(trips: int):
+    migrate_database(seed_admin=True)
+    rng = random.Random(7)
+    with SessionLocal() as db:
+        location = Location(name="Load test location")
+        db.add(location)
+        db.commit()
+
+        start = date(2025, 1, 1)
+        db.execute(insert(Trip), [
+            {
+                "id": uuid7(),
+                "title": f"Trip {i}",
+                "description": "Load test",
+                "location_id": location.id,
+                "start_date": start + timedelta(days=rng.randrange(365)),
+                "end_date": start + timedelta(days=400),
+                "price": rng.randrange(1_000, 50_000),
+                "capacity": 40,
+                "status": TripStatus.PUBLISHED,
+                "is_active": True,
+            }
+            for i in range(trips)
+        ])
+        db.commit()
+
+
+async def drive(base_url: str, concurrency: int, duration: float) -> dict:
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        response = await client.post("/auth/login", data={
+            "username": DEFAULT_ADMIN_EMAIL,
+            "password": DEFAULT_ADMIN_PASSWORD,
+        })
+        headers = {
+            "Authorization": f"Bearer {response.json()['access_token']}"
+        }
+
+        routes = {
+            "GET /user/me": ("/user/me", None),
+            "GET /admin/trips": ("/admin/trips", {"limit": 20}),
+        }
+        samples = {name: [] for name in routes}
+        errors = 0
+        deadline = time.monotonic() + duration
+
+        async def worker(index: int):
+            nonlocal errors
+            names = list(routes)
+            i = index
+            while time.monotonic() < deadline:
+                name = names[i % len(names)]
+                i += 1
+                path, params = routes[name]
+                started = time.perf_counter()
+                response = await client.get(
+                    path, params=params, headers=headers
+                )
+                samples[name].append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    errors += 1
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.monotonic() - started
+
+    total = sum(len(s) for s in samples.values())
+    return {
+        "requests": total,
+        "errors": errors,
+        "requests_per_sec": round(total / elapsed, 1),
+        "overall": summarize([x for s in samples.values() for x in s]),
+        "routes": {name: summarize(s) for name, s in samples.items()},
+    }
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--trips", type=int, default=5_000)
+    args = parser.parse_args(argv)
+
+    seed(args.trips)
+
+    results = {}
+    for mode in ("sync", "async"):
+        port = free_port()
+        server = start_server(
+            port, DB_ASYNC="true" if mode == "async" else "false"
+        )
+        try:
+            results[mode] = asyncio.run(
+                drive(f"http://127.0.0.1:{port}", args.concurrency,
+                      args.duration)
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main_()
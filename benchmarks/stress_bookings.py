@@ -0,0 +1,191 @@
+# benchmarks/stress_bookings.py
+"""
+Fire hundreds of parallel booking requests at one popular trip and prove
+it is never overbooked, for both router stacks:
+
+    python -m benchmarks.stress_bookings --users 500 --capacity 120
+
+Every user asks for 1-3 seats at once against a real uvicorn server. After
+each run the script checks that the trip's seats_reserved equals the seats
+held by live bookings, that it never exceeds capacity, and that the 201s
+add up to exactly that many seats. Throughput and latency are reported.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import date
+
+import httpx
+
+from benchmarks.common import (
+    configure_env,
+    free_port,
+    migrate_database,
+    start_server,
+    summarize,
+)
+
+configure_env("stress_bookings")
+
+from sqlalchemy import delete, func, insert, select, update  # noqa: E402
+
+from core.database import SessionLocal  # noqa: E402
+from core.ids import uuid7  # noqa: E402
+from core.security import create_access_token  # noqa: E402
+from models.booking import Booking, BookingStatus  # noqa: E402
+from models.enums import UserRole  # noqa: E402
+from models.location import Location  # noqa: E402
+from models.trip import Trip, TripStatus  # noqa: E402
+from models.user import User  # noqa: E402
+
+
+def seed(users: int, capacity: int) -> tuple[str, list[str]]:
+    migrate_database()
+    with SessionLocal() as db:
+        location = Location(name="Stress test location")
+        trip = Trip(
+            title="Popular pilgrimage",
+            description="Stress test",
+            location=location,
+            start_date=date(2026, 11, 1),
+            end_date=date(2026, 11, 8),
+            price=25_000,
+            capacity=capacity,
+            status=TripStatus.PUBLISHED,
+        )
+        db.add(trip)
+
+        user_ids = [uuid7() for _ in range(users)]
+        db.execute(insert(User), [
+            {
+                "id": user_id,
+                "name": "Pilgrim",
+                "email": f"{user_id}@stress.local",
+                "password_hash": "x",
+                "role": UserRole.USER,
+                "is_active": True,
+            }
+            for user_id in user_ids
+        ])
+        db.commit()
+
+        tokens = [
+            create_access_token(str(user_id), UserRole.USER.value)
+            for user_id in user_ids
+        ]
+        return str(trip.id), tokens
+
+
+def reset(trip_id: str):
+    with SessionLocal() as db:
+        db.execute(delete(Booking))
+        db.execute(
+            update(Trip).where(Trip.id == trip_id).values(seats_reserved=0)
+        )
+        db.commit()
+
+
+def check(trip_id: str, granted_seats: int) -> dict:
+    with SessionLocal() as db:
+        trip = db.get(Trip, trip_id)
+        held = db.scalar(
+            select(func.coalesce(func.sum(Booking.seats), 0)).where(
+                Booking.trip_id == trip_id,
+                Booking.status.in_(
+                    [BookingStatus.HELD, BookingStatus.CONFIRMED]
+                ),
+            )
+        )
+
+    assert trip.seats_reserved <= trip.capacity, "trip overbooked"
+    assert trip.seats_reserved == held, "seat counter drifted from bookings"
+    assert held == granted_seats, "201 responses disagree with bookings"
+    return {
+        "capacity": trip.capacity,
+        "seats_reserved": trip.seats_reserved,
+    }
+
+
+async def burst(base_url: str, trip_id: str, tokens: list[str]) -> dict:
+    rng = random.Random(3)
+    requests = [(token, rng.randint(1, 3)) for token in tokens]
+    statuses: dict[int, int] = {}
+    latencies: list[float] = []
+    granted = 0
+
+    limits = httpx.Limits(max_connections=len(tokens))
+    async with httpx.AsyncClient(
+        base_url=base_url, timeout=60, limits=limits
+    ) as client:
+
+        async def book(token: str, seats: int):
+            nonlocal granted
+            started = time.perf_counter()
+            response = await client.post(
+                "/user/bookings",
+                json={"trip_id": trip_id, "seats": seats},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[response.status_code] = (
+                statuses.get(response.status_code, 0) + 1
+            )
+            if response.status_code == 201:
+                granted += seats
+
+        started = time.perf_counter()
+        await asyncio.gather(*(book(token, seats) for token, seats in requests))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(requests),
+        "seats_requested": sum(seats for _, seats in requests),
+        "seats_granted": granted,
+        "statuses": statuses,
+        "requests_per_second": round(len(requests) / elapsed, 1),
+        "latency": summarize(latencies),
+    }
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--capacity", type=int, default=120)
+    parser.add_argument(
+        "--modes", nargs="+", default=["sync", "async"],
+        choices=["sync", "async"],
+    )
+    args = parser.parse_args(argv)
+
+    trip_id, tokens = seed(args.users, args.capacity)
+    results = {}
+
+    for mode in args.modes:
+        reset(trip_id)
+        port = free_port()
+        server = start_server(
+            port,
+            DB_ASYNC=str(mode == "async").lower(),
+            DB_POOL_SIZE="20",
+            DB_MAX_OVERFLOW="20",
+        )
+        try:
+            result = asyncio.run(
+                burst(f"http://127.0.0.1:{port}", trip_id, tokens)
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+        result["trip"] = check(trip_id, result["seats_granted"])
+        results[mode] = result
+
+    print(json.dumps(results, indent=2))
+    print("no overbooking under concurrent load")
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,111 @@
+# app/cli.py
+"""
+Operational commands, run once per deploy instead of in every worker:
+
+    python cli.py migrate            # apply schema migrations (alembic)
+    python cli.py seed-admin         # create the default admin if missing
+    python cli.py rebuild-search     # reindex every trip for search
+
+New migrations: `alembic revision --autogenerate -m "..."`, then review.
+"""
+
+import argparse
+import os
+
+from sqlalchemy import inspect
+
+from core.config import SEARCH_REBUILD_BATCH_SIZE
+from core.database import SessionLocal, engine
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini")
+# Revision matching the first schema main.py created with create_all at
+# import time; 0001a adds whatever later create_all runs left out.
+BASELINE_REVISION = "0001"
+
+
+def alembic_config():
+    from alembic.config import Config
+
+    config = Config(ALEMBIC_INI)
+    # Keep the caller's logging when run in-process (tests, benchmarks).
+    config.attributes["configure_logger"] = __name__ == "__main__"
+    return config
+
+
+def adopt_unversioned_schema(config) -> bool:
+    """
+    Databases created by the old create_all-at-startup have at least the
+    baseline tables but no alembic_version: stamp the baseline and let
+    upgrade continue from there. True if the database was adopted.
+    """
+    from alembic import command
+
+    tables = set(inspect(engine).get_table_names())
+    if "alembic_version" in tables or "users" not in tables:
+        return False
+
+    command.stamp(config, BASELINE_REVISION)
+    return True
+
+
+def has_search_index() -> bool:
+    from core.search import search_index
+
+    with engine.connect() as conn:
+        return search_index(conn).exists(conn)
+
+
+def migrate(revision: str = "head"):
+    from alembic import command
+    from core.search import rebuild_search_index
+
+    config = alembic_config()
+    adopt_unversioned_schema(config)
+    searchable = has_search_index()
+    command.upgrade(config, revision)
+    # Migrations only create the search tables; fill them once.
+    if not searchable and has_search_index():
+        rebuild_search_index()
+
+
+def seed_admin() -> bool:
+    from core.init_admin import create_default_admin
+
+    with SessionLocal() as db:
+        return create_default_admin(db)
+
+
+def rebuild_search(batch_size: int = SEARCH_REBUILD_BATCH_SIZE) -> int:
+    from core.search import rebuild_search_index
+
+    return rebuild_search_index(batch_size)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser("migrate", help="apply migrations")
+    migrate_parser.add_argument("revision", nargs="?", default="head")
+
+    commands.add_parser("seed-admin", help="create the default admin")
+
+    rebuild_parser = commands.add_parser(
+        "rebuild-search", help="reindex every trip for search"
+    )
+    rebuild_parser.add_argument(
+        "--batch-size", type=int, default=SEARCH_REBUILD_BATCH_SIZE
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate":
+        migrate(args.revision)
+    elif args.command == "seed-admin":
+        seed_admin()
+    elif args.command == "rebuild-search":
+        print(f"Indexed {rebuild_search(args.batch_size)} trips")
+
+
+if __name__ == "__main__":
+    main()
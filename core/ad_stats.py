@@ -0,0 +1,216 @@
+# app/core/ad_stats.py
+"""
+Write-behind impression / click counters for advertisements.
+
+Tracking requests only add to in-memory counters; nothing touches the
+database on the request. Counters are sharded by ad id, each shard with
+its own lock, so requests on different threadpool threads rarely wait on
+each other. `flush` swaps every shard for an empty one and writes the
+summed deltas to ad_stats with batched upserts (impressions = impressions
++ delta): every AD_STATS_FLUSH_SECONDS, sooner once AD_STATS_FLUSH_KEYS
+ads have counts pending, and once more at shutdown. Each worker writes
+only its own deltas, so totals add up across workers.
+
+Counts are best effort: a worker that dies loses at most one interval's
+worth, and ids matching no advertisement are dropped at flush.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.config import (
+    AD_STATS_FLUSH_BATCH_SIZE,
+    AD_STATS_FLUSH_KEYS,
+    AD_STATS_MAX_KEYS,
+    AD_STATS_SHARDS,
+)
+from core.database import SessionLocal, dialect_insert
+from core.metrics import registry
+from models.ad_stat import AdStat
+from models.advertisement import Advertisement
+
+logger = logging.getLogger(__name__)
+
+# Index of each event in a key's counts.
+IMPRESSIONS, CLICKS = 0, 1
+
+flush_seconds = registry.histogram(
+    "ad_stats_flush_seconds", "Time to write one flush of ad counters"
+)
+dropped_events = registry.counter(
+    "ad_stats_dropped_events_total",
+    "Ad events not counted because AD_STATS_MAX_KEYS ads were pending",
+)
+
+
+class _Shard:
+    __slots__ = ("counts", "lock")
+
+    def __init__(self):
+        self.counts: dict[uuid.UUID, list[int]] = {}
+        self.lock = threading.Lock()
+
+
+def write_ad_stats(
+    db: Session,
+    deltas: dict[uuid.UUID, list[int]],
+    batch_size: int = AD_STATS_FLUSH_BATCH_SIZE,
+) -> int:
+    """
+    Add `deltas` to ad_stats in the caller's transaction, one upsert per
+    `batch_size` ads. Returns the number of ads written.
+    """
+    # One statement for every batch: executemany with a fixed statement
+    # is compiled once, where a multi-row VALUES is compiled per size.
+    statement = dialect_insert(db)(AdStat)
+    statement = statement.on_conflict_do_update(
+        index_elements=[AdStat.ad_id],
+        set_={
+            "impressions": (
+                AdStat.impressions + statement.excluded.impressions
+            ),
+            "clicks": AdStat.clicks + statement.excluded.clicks,
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+    now = datetime.utcnow()
+    ad_ids = list(deltas)
+    written = 0
+
+    for start in range(0, len(ad_ids), batch_size):
+        # Also drops ids that match no advertisement.
+        ads = db.execute(
+            select(Advertisement.id, Advertisement.trip_id)
+            .where(Advertisement.id.in_(ad_ids[start:start + batch_size]))
+        ).all()
+        if not ads:
+            continue
+
+        db.execute(statement, [
+            {
+                "ad_id": ad_id,
+                "trip_id": trip_id,
+                "impressions": deltas[ad_id][IMPRESSIONS],
+                "clicks": deltas[ad_id][CLICKS],
+                "updated_at": now,
+            }
+            for ad_id, trip_id in ads
+        ])
+        written += len(ads)
+
+    return written
+
+
+class AdStatsRecorder:
+    def __init__(
+        self,
+        shards: int = AD_STATS_SHARDS,
+        flush_keys: int = AD_STATS_FLUSH_KEYS,
+        max_keys: int = AD_STATS_MAX_KEYS,
+    ):
+        self._shards = [_Shard() for _ in range(shards)]
+        self.flush_keys = flush_keys
+        self.max_keys = max_keys
+        # Called (once per flush) when flush_keys ads are pending; main.py
+        # points it at the flush job's wake.
+        self.on_full = None
+        self._full = False
+        self.flushes = 0
+        self.flushed_rows = 0
+
+    def pending(self) -> int:
+        """Ads with counts waiting for the next flush."""
+        return sum(len(shard.counts) for shard in self._shards)
+
+    def add(self, ad_id: uuid.UUID, event: int, amount: int = 1):
+        shard = self._shards[hash(ad_id) % len(self._shards)]
+        with shard.lock:
+            counts = shard.counts.get(ad_id)
+            if counts is None:
+                # New key: the only case that can change what is pending.
+                # Sizes are read without the other shards' locks, so both
+                # limits are approximate.
+                pending = self.pending()
+                if pending >= self.max_keys:
+                    dropped_events.inc(amount)
+                    return
+                counts = shard.counts[ad_id] = [0, 0]
+                if pending + 1 >= self.flush_keys:
+                    self._request_flush()
+            counts[event] += amount
+
+    def impressions(self, ad_ids: list[uuid.UUID]):
+        for ad_id in ad_ids:
+            self.add(ad_id, IMPRESSIONS)
+
+    def click(self, ad_id: uuid.UUID):
+        self.add(ad_id, CLICKS)
+
+    def _request_flush(self):
+        if not self._full and self.on_full is not None:
+            self._full = True
+            self.on_full()
+
+    def drain(self) -> dict[uuid.UUID, list[int]]:
+        """Take every pending count, leaving the shards empty."""
+        self._full = False
+        deltas = {}
+        for shard in self._shards:
+            with shard.lock:
+                counts, shard.counts = shard.counts, {}
+            # An id lives in exactly one shard, so no merging is needed.
+            deltas.update(counts)
+        return deltas
+
+    def restore(self, deltas: dict[uuid.UUID, list[int]]):
+        """Put drained counts back after a failed write."""
+        # Leave the retry to the next interval rather than waking the job
+        # straight back into a failing write.
+        self._full = True
+        for ad_id, counts in deltas.items():
+            for event, amount in enumerate(counts):
+                if amount:
+                    self.add(ad_id, event, amount)
+
+    def flush(self) -> int:
+        """Write all pending counts. Returns the number of ads written."""
+        deltas = self.drain()
+        if not deltas:
+            return 0
+
+        started = time.perf_counter()
+        try:
+            with SessionLocal() as db:
+                written = write_ad_stats(db, deltas)
+                db.commit()
+        except Exception:
+            self.restore(deltas)
+            raise
+        flush_seconds.observe(time.perf_counter() - started)
+
+        self.flushes += 1
+        self.flushed_rows += written
+        return written
+
+    def close(self):
+        """Final flush at shutdown; a failure is logged, not raised."""
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Final ad stats flush failed; counts lost")
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.pending(),
+            "flushes": self.flushes,
+            "flushed_rows": self.flushed_rows,
+        }
+
+
+ad_stats = AdStatsRecorder()
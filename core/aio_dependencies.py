@@ -0,0 +1,62 @@
+# app/core/aio_dependencies.py
+# Async counterparts of core/dependencies.py, used by routers/aio.
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database import get_async_db
+from core.dependencies import (
+    Principal,
+    principal_cache,
+    get_token_payload,
+    ensure_active,
+    cache_principal,
+    claimed_principal,
+    require_role,
+)
+from core.config import TRUST_TOKEN_ROLE
+from core.query_budget import exempt_from_budget
+from models.user import User
+from models.enums import UserRole
+
+
+async def get_current_user_async(
+    payload: dict = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    return ensure_active(await db.get(User, payload["sub"]))
+
+
+async def get_current_principal_async(
+    payload: dict = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_async_db),
+) -> Principal:
+    principal = principal_cache.get(payload["sub"])
+    if principal is None:
+        with exempt_from_budget():
+            principal = cache_principal(await db.get(User, payload["sub"]))
+        # Release the connection before the endpoint runs (see the sync
+        # version).
+        await db.rollback()
+
+    return ensure_active(principal)
+
+
+async def get_role_principal_async(
+    payload: dict = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_async_db),
+) -> Principal:
+    if TRUST_TOKEN_ROLE:
+        return claimed_principal(payload)
+    return await get_current_principal_async(payload, db)
+
+
+async def require_admin_async(
+    principal: Principal = Depends(get_role_principal_async),
+):
+    return require_role(principal, UserRole.ADMIN, "Admin access required")
+
+
+async def require_agent_async(
+    principal: Principal = Depends(get_role_principal_async),
+):
+    return require_role(principal, UserRole.AGENT, "Agent access required")
@@ -0,0 +1,224 @@
+# app/core/bookings.py
+"""
+Seat reservation. Every change to `trips.seats_reserved` is a single
+conditional UPDATE, so the database serialises concurrent bookings on the
+trip row and capacity can never be exceeded. Booking state changes are
+likewise guarded by their current status, so a cancel racing the expiry
+job releases the seats exactly once.
+
+Functions take a sync Session; the async routers call them through
+AsyncSession.run_sync.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+from itertools import groupby
+
+from fastapi import HTTPException
+from sqlalchemy import Select, bindparam, literal, select, tuple_, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from core.config import BOOKING_HOLD_MINUTES
+from core.feed_cache import mark_feed_changed
+from core.pagination import decode_cursor, encode_cursor
+from models.booking import Booking, BookingStatus
+from models.trip import Trip, TripStatus
+
+trips = Trip.__table__
+
+# Core (table) statements on purpose: seats_reserved is not part of the
+# cached public feed, so bookings must not trigger its ORM invalidation
+# hooks. Capacity is, so set_capacity invalidates the feed itself.
+_reserve = (
+    update(trips)
+    .where(
+        trips.c.id == bindparam("trip_id"),
+        trips.c.is_active == True,
+        trips.c.status == TripStatus.PUBLISHED,
+        trips.c.seats_reserved + bindparam("seats") <= trips.c.capacity,
+    )
+    .values(seats_reserved=trips.c.seats_reserved + bindparam("seats"))
+)
+
+_release = (
+    update(trips)
+    .where(trips.c.id == bindparam("trip_id"))
+    .values(seats_reserved=trips.c.seats_reserved - bindparam("seats"))
+)
+
+# Capacity changes take the same row lock as _reserve, so a booking can
+# never land between the check and the write.
+_resize = (
+    update(trips)
+    .where(
+        trips.c.id == bindparam("trip_id"),
+        trips.c.seats_reserved <= bindparam("new_capacity"),
+    )
+    .values(capacity=bindparam("new_capacity"))
+)
+
+
+def set_capacity(db: Session, trip: Trip, capacity: int) -> None:
+    """
+    Resize `trip` in the caller's transaction, refusing to go below the
+    seats already reserved.
+    """
+    result = db.execute(
+        _resize, {"trip_id": trip.id, "new_capacity": capacity}
+    )
+    if result.rowcount != 1:
+        raise HTTPException(
+            400, "Capacity is below the seats already reserved"
+        )
+    # Written above; not a pending change for the next flush.
+    set_committed_value(trip, "capacity", capacity)
+    mark_feed_changed(db)
+
+
+def reserve_seats(
+    db: Session,
+    trip_id: uuid.UUID,
+    user_id: uuid.UUID,
+    seats: int,
+    booked_by_id: uuid.UUID | None = None,
+) -> Booking:
+    """Hold `seats` on a published trip for BOOKING_HOLD_MINUTES."""
+    result = db.execute(_reserve, {"trip_id": trip_id, "seats": seats})
+    if result.rowcount != 1:
+        db.rollback()
+        trip = db.get(Trip, trip_id)
+        if (
+            not trip
+            or not trip.is_active
+            or trip.status != TripStatus.PUBLISHED
+        ):
+            raise HTTPException(404, "Trip not found")
+        raise HTTPException(409, "Not enough seats available")
+
+    booking = Booking(
+        trip_id=trip_id,
+        user_id=user_id,
+        booked_by_id=booked_by_id,
+        seats=seats,
+        status=BookingStatus.HELD,
+        hold_expires_at=datetime.utcnow() + timedelta(
+            minutes=BOOKING_HOLD_MINUTES
+        ),
+    )
+    db.add(booking)
+    db.flush()
+    return _commit_detached(db, booking)
+
+
+def _commit_detached(db: Session, booking: Booking) -> Booking:
+    """
+    Commit and return `booking` detached with its loaded state. Nothing is
+    reloaded afterwards, so the connection is back in the pool before the
+    response is serialised: sync endpoints serialise on a worker thread,
+    and holding a connection while queuing for one deadlocks under load.
+    """
+    db.expunge(booking)
+    db.commit()
+    return booking
+
+
+def release_seats(db: Session, rows) -> None:
+    """Return seats for (trip_id, seats) rows, one UPDATE per trip."""
+    # Sorted so concurrent releases lock trip rows in the same order.
+    ordered = sorted(rows, key=lambda row: row[0])
+    params = [
+        {"trip_id": trip_id, "seats": sum(row[1] for row in group)}
+        for trip_id, group in groupby(ordered, key=lambda row: row[0])
+    ]
+    if params:
+        db.execute(_release, params)
+
+
+def _visible(db: Session, booking_id: uuid.UUID, criteria) -> Booking:
+    booking = db.scalar(
+        select(Booking).where(Booking.id == booking_id, *criteria)
+    )
+    if not booking:
+        raise HTTPException(404, "Booking not found")
+    return booking
+
+
+def confirm_booking(db: Session, booking_id: uuid.UUID, *criteria) -> Booking:
+    """
+    Mark a held booking as paid. `criteria` restrict which bookings the
+    caller may touch, e.g. Booking.user_id == principal.id.
+    """
+    result = db.execute(
+        update(Booking)
+        .where(
+            Booking.id == booking_id,
+            Booking.status == BookingStatus.HELD,
+            Booking.hold_expires_at > datetime.utcnow(),
+            *criteria,
+        )
+        .values(status=BookingStatus.CONFIRMED, hold_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+
+    if result.rowcount != 1:
+        db.rollback()
+        booking = _visible(db, booking_id, criteria)
+        if booking.status == BookingStatus.HELD:
+            raise HTTPException(409, "Booking hold has expired")
+        raise HTTPException(409, f"Booking is {booking.status.value}")
+
+    return _commit_detached(db, _visible(db, booking_id, criteria))
+
+
+def cancel_booking(db: Session, booking_id: uuid.UUID, *criteria) -> Booking:
+    """Cancel a held or confirmed booking and give its seats back."""
+    released = db.execute(
+        update(Booking)
+        .where(
+            Booking.id == booking_id,
+            Booking.status.in_([BookingStatus.HELD, BookingStatus.CONFIRMED]),
+            *criteria,
+        )
+        .values(status=BookingStatus.CANCELLED, hold_expires_at=None)
+        .returning(Booking.trip_id, Booking.seats)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    if not released:
+        db.rollback()
+        booking = _visible(db, booking_id, criteria)
+        raise HTTPException(409, f"Booking is {booking.status.value}")
+
+    release_seats(db, released)
+    return _commit_detached(db, _visible(db, booking_id, criteria))
+
+
+def bookings_query(cursor: str | None, *criteria) -> Select:
+    """Matching bookings newest first, keyset on (created_at, id)."""
+    query = select(Booking).where(*criteria)
+
+    if cursor:
+        created_at, booking_id = decode_cursor(cursor, 2)
+        try:
+            created_at = datetime.fromisoformat(created_at)
+            booking_id = uuid.UUID(booking_id)
+        except (TypeError, ValueError):
+            raise HTTPException(400, "Invalid cursor")
+        # Id bound with the column's type, as in routers.admin.trip_keyset.
+        query = query.where(
+            tuple_(Booking.created_at, Booking.id)
+            < tuple_(created_at, literal(booking_id, Booking.id.type))
+        )
+
+    return query.order_by(Booking.created_at.desc(), Booking.id.desc())
+
+
+def booking_page(bookings: list[Booking], limit: int) -> dict:
+    """`bookings` is fetched with limit + 1 rows to detect a further page."""
+    next_cursor = None
+    if len(bookings) > limit:
+        bookings = bookings[:limit]
+        next_cursor = encode_cursor(bookings[-1].created_at, bookings[-1].id)
+
+    return {"items": bookings, "next_cursor": next_cursor}
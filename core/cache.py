@@ -0,0 +1,143 @@
+# app/core/cache.py
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded LRU cache whose entries also expire.
+    Tracks hits/misses so callers can expose them as metrics.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING or entry[1] <= now:
+                if entry is not _MISSING:
+                    del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value, ttl: float | None = None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# =====================================================
+# SHARED BACKENDS
+# =====================================================
+# Minimal interface (get / set / incr on bytes) so a networked store can
+# sit behind an in-process TTLCache. MemoryBackend is the local fake.
+# incr's ttl applies when it creates the key (rate limit windows).
+
+class MemoryBackend:
+    """In-process stand-in for a shared store, for development and tests."""
+
+    def __init__(self):
+        self._data: dict[str, tuple[bytes, float | None]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[1] is not None and entry[1] <= time.monotonic():
+                del self._data[key]
+                return None
+            return entry[0]
+
+    def set(self, key: str, value: bytes, ttl: float | None = None):
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._data[key] = (value, expires_at)
+
+    def incr(self, key: str, ttl: float | None = None) -> int:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= now:
+                entry = None
+            if entry is None:
+                value = 1
+                expires_at = None if ttl is None else now + ttl
+            else:
+                value = int(entry[0]) + 1
+                expires_at = entry[1]
+            self._data[key] = (str(value).encode(), expires_at)
+            return value
+
+
+class RedisBackend:
+    def __init__(self, url: str):
+        import redis  # optional dependency, only needed for redis:// URLs
+
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> bytes | None:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float | None = None):
+        self._client.set(key, value, px=None if ttl is None else int(ttl * 1000))
+
+    def incr(self, key: str, ttl: float | None = None) -> int:
+        if ttl is None:
+            return self._client.incr(key)
+        pipe = self._client.pipeline()
+        pipe.incr(key)
+        pipe.pexpire(key, int(ttl * 1000), nx=True)
+        return pipe.execute()[0]
+
+
+def cache_backend(url: str):
+    """Backend for a FEED_CACHE_URL-style setting; None when unset."""
+    if not url:
+        return None
+    if url == "memory://":
+        return MemoryBackend()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackend(url)
+    raise RuntimeError(f"Unsupported cache backend URL '{url}'")
@@ -1,13 +1,43 @@
 # app/database.py
-from sqlalchemy import create_engine
+import importlib
+import uuid
+
+from sqlalchemy import String, create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
 from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
 from typing import Generator
-from core.config import DATABASE_URL
+from core.config import (
+    DATABASE_URL,
+    DB_ASYNC,
+    ASYNC_DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+)
+from core.ids import GUID
+from core.pool_metrics import (
+    InstrumentedQueuePool,
+    InstrumentedAsyncQueuePool,
+    instrument_engine,
+)
+
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
 
 engine = create_engine(
     DATABASE_URL,
-    pool_pre_ping=True,
-    echo=False
+    poolclass=InstrumentedQueuePool,
+    echo=False,
+    **POOL_OPTIONS,
 )
 
 SessionLocal = sessionmaker(
@@ -16,8 +46,51 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def async_url(url: str) -> str:
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise RuntimeError(f"No async driver configured for '{backend}'")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(
+        hide_password=False
+    )
+
+
+async_engine = None
+AsyncSessionLocal = None
+
+if DB_ASYNC:
+    # Imported only in async mode: it needs greenlet and an async driver.
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL or async_url(DATABASE_URL),
+        poolclass=InstrumentedAsyncQueuePool,
+        echo=False,
+        **POOL_OPTIONS,
+    )
+
+    # Objects stay loaded after commit: lazy refreshes cannot run implicitly
+    # under asyncio.
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+# Pool metrics describe the engine that serves requests.
+serving_engine = async_engine.sync_engine if DB_ASYNC else engine
+instrument_engine(serving_engine)
+
 class Base(DeclarativeBase):
-    pass
+    # Every uuid key and foreign key is stored natively (see core/ids.py).
+    type_annotation_map = {uuid.UUID: GUID}
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -25,3 +98,38 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+def dialect_insert(db: Session):
+    """
+    The dialect's own `insert` construct for the session's database, which
+    adds ON CONFLICT support (on_conflict_do_nothing / on_conflict_do_update)
+    on PostgreSQL and SQLite.
+    """
+    name = db.get_bind().dialect.name
+    if name not in ("postgresql", "sqlite"):
+        raise RuntimeError(f"No ON CONFLICT support for '{name}'")
+    return importlib.import_module(f"sqlalchemy.dialects.{name}").insert
+
+class folded(FunctionElement):
+    """
+    lower(expr) compared byte-wise on every dialect (COLLATE "C" on
+    PostgreSQL, SQLite's default already), so a prefix range
+    `>= folded(q) AND < folded(q + U+10FFFF)` and keyset order agree with
+    an index on the same expression whatever the database's collation.
+    """
+
+    type = String()
+    inherit_cache = True
+    name = "folded"
+
+@compiles(folded)
+def _compile_folded(element, compiler, **kw):
+    return f"lower({compiler.process(element.clauses, **kw)})"
+
+@compiles(folded, "postgresql")
+def _compile_folded_postgresql(element, compiler, **kw):
+    return f'lower({compiler.process(element.clauses, **kw)}) COLLATE "C"'
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
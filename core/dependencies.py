@@ -1,46 +1,120 @@
+import uuid
+from dataclasses import dataclass
+
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from jose import jwt, JWTError
 
 from core.database import get_db
+from core.cache import TTLCache
 from models.user import User
 from models.enums import UserRole
+from core.query_budget import exempt_from_budget
 from core.security import oauth2_scheme
-from core.config import SECRET_KEY, ALGORITHM
+from core.tokens import verify_token
+from core.config import (
+    PRINCIPAL_CACHE_SIZE,
+    PRINCIPAL_CACHE_TTL_SECONDS,
+    TRUST_TOKEN_ROLE,
+)
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")
-        if not user_id:
-            raise HTTPException(status_code=401, detail="Invalid token")
-    except JWTError:
-        raise HTTPException(status_code=401, detail="Invalid token")
+@dataclass(frozen=True)
+class Principal:
+    """The slice of a user that authorization checks need."""
+
+    id: uuid.UUID
+    role: UserRole
+    is_active: bool
+
+
+# Keyed by user id. Must be invalidated whenever a user is deactivated.
+principal_cache = TTLCache(
+    maxsize=PRINCIPAL_CACHE_SIZE,
+    ttl=PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_principal(user_id) -> None:
+    principal_cache.pop(uuid.UUID(str(user_id)))
 
-    user = db.get(User, user_id)
+
+async def get_token_payload(token: str = Depends(oauth2_scheme)) -> dict:
+    # async so it runs on the event loop rather than the threadpool
+    return verify_token(token)
+
+
+def ensure_active(user):
     if not user or not user.is_active:
         raise HTTPException(status_code=401, detail="Inactive user")
-
     return user
 
 
-def require_admin(user: User = Depends(get_current_user)):
-    if user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required",
-        )
-    return user
+def cache_principal(user: User | None) -> Principal:
+    if not user:
+        raise HTTPException(status_code=401, detail="Inactive user")
 
+    principal = Principal(id=user.id, role=user.role, is_active=user.is_active)
+    principal_cache.set(user.id, principal)
+    return principal
 
-def require_agent(user: User = Depends(get_current_user)):
-    if user.role != UserRole.AGENT:
+
+def claimed_principal(payload: dict) -> Principal:
+    try:
+        role = UserRole(payload.get("role"))
+    except ValueError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    return Principal(id=payload["sub"], role=role, is_active=True)
+
+
+def require_role(principal: Principal, role: UserRole, detail: str):
+    if principal.role != role:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Agent access required",
+            detail=detail,
         )
-    return user
+    return principal
+
+
+def get_current_user(
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db),
+) -> User:
+    return ensure_active(db.get(User, payload["sub"]))
+
+
+def get_current_principal(
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db),
+) -> Principal:
+    """Like `get_current_user`, but served from the principal cache."""
+    principal = principal_cache.get(payload["sub"])
+    if principal is None:
+        # Only on a miss, so outside the route's query budget.
+        with exempt_from_budget():
+            principal = cache_principal(db.get(User, payload["sub"]))
+        # End the read transaction so the connection goes back to the pool
+        # now: otherwise it stays checked out while the endpoint queues for
+        # a worker thread, and a burst of cache misses can hold every pooled
+        # connection while the threads that would release them are blocked
+        # on checkout.
+        db.rollback()
+
+    return ensure_active(principal)
+
+
+def get_role_principal(
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db),
+) -> Principal:
+    if TRUST_TOKEN_ROLE:
+        return claimed_principal(payload)
+    return get_current_principal(payload, db)
+
+
+def require_admin(principal: Principal = Depends(get_role_principal)):
+    return require_role(principal, UserRole.ADMIN, "Admin access required")
+
+
+def require_agent(principal: Principal = Depends(get_role_principal)):
+    return require_role(principal, UserRole.AGENT, "Agent access required")
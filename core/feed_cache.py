@@ -0,0 +1,124 @@
+# app/core/feed_cache.py
+import hashlib
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from core.cache import TTLCache, cache_backend
+from core.config import FEED_CACHE_SIZE, FEED_CACHE_TTL_SECONDS, FEED_CACHE_URL
+from models.trip import Trip
+from models.advertisement import Advertisement
+
+GENERATION_KEY = "feed:generation"
+
+# Commits touching these invalidate the public feed.
+FEED_MODELS = (Trip, Advertisement)
+
+
+def etag_for(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+class FeedCache:
+    """
+    Rendered feed pages as (etag, body), keyed by (generation, query).
+
+    Invalidation bumps the generation rather than deleting keys: a page
+    rendered from rows read before a commit is stored under the old
+    generation, which no reader asks for any more. With a shared backend
+    the generation lives there, so every worker sees the bump.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, backend=None):
+        self.local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.backend = backend
+        self._generation = 0
+
+    def generation(self) -> int:
+        if self.backend is None:
+            return self._generation
+        return int(self.backend.get(GENERATION_KEY) or 0)
+
+    def get(self, generation: int, key: str) -> tuple[str, bytes] | None:
+        entry = self.local.get((generation, key))
+        if entry is None and self.backend is not None:
+            body = self.backend.get(f"feed:{generation}:{key}")
+            if body is not None:
+                entry = (etag_for(body), body)
+                self.local.set((generation, key), entry)
+        return entry
+
+    def set(self, generation: int, key: str, body: bytes) -> tuple[str, bytes]:
+        entry = (etag_for(body), body)
+        self.local.set((generation, key), entry)
+        if self.backend is not None:
+            self.backend.set(f"feed:{generation}:{key}", body, self.local.ttl)
+        return entry
+
+    def invalidate(self):
+        if self.backend is not None:
+            self.backend.incr(GENERATION_KEY)
+        self._generation += 1
+        self.local.clear()
+
+    def stats(self) -> dict:
+        return {
+            **self.local.stats(),
+            "generation": self.generation(),
+            "backend": type(self.backend).__name__ if self.backend else None,
+        }
+
+
+feed_cache = FeedCache(
+    maxsize=FEED_CACHE_SIZE,
+    ttl=FEED_CACHE_TTL_SECONDS,
+    backend=cache_backend(FEED_CACHE_URL),
+)
+
+# =====================================================
+# WRITE-THROUGH INVALIDATION
+# =====================================================
+# Registered on the Session class, so they also cover the sync sessions
+# behind AsyncSession. The flag is set when a flush or bulk statement
+# touches a feed model and acted on only once the transaction commits.
+
+def mark_feed_changed(session: Session):
+    """
+    Invalidate the feed once `session` commits. For Core (table)
+    statements on feed models, which the hooks below cannot see.
+    """
+    session.info["feed_changed"] = True
+
+
+def _touches_feed(objects) -> bool:
+    return any(isinstance(obj, FEED_MODELS) for obj in objects)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed_changes(session, flush_context):
+    if (
+        _touches_feed(session.new)
+        or _touches_feed(session.dirty)
+        or _touches_feed(session.deleted)
+    ):
+        session.info["feed_changed"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_bulk_changes(orm_execute_state):
+    if orm_execute_state.is_select:
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in FEED_MODELS:
+        mark_feed_changed(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    if session.info.pop("feed_changed", False):
+        feed_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop("feed_changed", None)
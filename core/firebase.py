@@ -1,8 +1,22 @@
-import firebase_admin
-from firebase_admin import credentials
+from functools import lru_cache
 
 from core.config import FIREBASE_CREDENTIALS_PATH
 
-if FIREBASE_CREDENTIALS_PATH and not firebase_admin._apps:
+
+@lru_cache(maxsize=1)
+def firebase_app():
+    """
+    The Firebase app, initialised on first use rather than at import:
+    firebase_admin is slow to import and most workers never need it.
+    None when FIREBASE_CREDENTIALS_PATH is not configured.
+    """
+    if not FIREBASE_CREDENTIALS_PATH:
+        return None
+
+    import firebase_admin
+    from firebase_admin import credentials
+
+    if firebase_admin._apps:
+        return firebase_admin.get_app()
     cred = credentials.Certificate(FIREBASE_CREDENTIALS_PATH)
-    firebase_admin.initialize_app(cred)
+    return firebase_admin.initialize_app(cred)
@@ -0,0 +1,116 @@
+# app/core/hashing.py
+import asyncio
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from fastapi import HTTPException, status
+
+from core import otp, security
+from core.config import HASH_POOL_WORKERS, HASH_QUEUE_LIMIT
+
+
+class HashingService:
+    """
+    Runs bcrypt in worker processes so a burst of logins neither holds the
+    GIL nor exhausts the request threadpool. Once `queue_limit` calls are in
+    flight, new ones fail fast with 503 instead of queueing without bound.
+
+    Sync handlers call the plain methods (the worker thread waits on the
+    pool); async handlers await the `a`-prefixed ones.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.rejected = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def _submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self._pending >= self.queue_limit:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Server busy, please retry",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+
+        try:
+            if self.workers > 0:
+                future = self._pool().submit(fn, *args)
+            else:
+                future = Future()
+                try:
+                    future.set_result(fn(*args))
+                except Exception as exc:
+                    future.set_exception(exc)
+        except BaseException:
+            self._release(None)
+            raise
+
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future: Future | None):
+        with self._lock:
+            self._pending -= 1
+
+    def run(self, fn, *args):
+        return self._submit(fn, *args).result()
+
+    async def arun(self, fn, *args):
+        return await asyncio.wrap_future(self._submit(fn, *args))
+
+    # ----- passwords -----
+
+    def hash_password(self, password: str) -> str:
+        return self.run(security.hash_password, password)
+
+    def verify_password(self, plain_password: str, hashed: str) -> bool:
+        return self.run(security.verify_password, plain_password, hashed)
+
+    async def ahash_password(self, password: str) -> str:
+        return await self.arun(security.hash_password, password)
+
+    async def averify_password(self, plain_password: str, hashed: str) -> bool:
+        return await self.arun(security.verify_password, plain_password, hashed)
+
+    # ----- OTPs -----
+    # HMAC OTP hashes verify inline in microseconds; only hashes issued
+    # under the old bcrypt scheme still need a pool worker.
+
+    def verify_otp(self, code: str, hashed: str) -> bool:
+        if not otp.is_legacy_hash(hashed):
+            return otp.verify_otp(code, hashed)
+        return self.run(otp.verify_otp, code, hashed)
+
+    async def averify_otp(self, code: str, hashed: str) -> bool:
+        if not otp.is_legacy_hash(hashed):
+            return otp.verify_otp(code, hashed)
+        return await self.arun(otp.verify_otp, code, hashed)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "queue_limit": self.queue_limit,
+            "pending": self._pending,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+hasher = HashingService(HASH_POOL_WORKERS, HASH_QUEUE_LIMIT)
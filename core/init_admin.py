@@ -9,11 +9,11 @@ from core.config import (
     DEFAULT_ADMIN_NAME,
 )
 
-def create_default_admin(db: Session):
+def create_default_admin(db: Session) -> bool:
     admin = db.query(User).filter(User.email == DEFAULT_ADMIN_EMAIL).first()
 
     if admin:
-        return  # ✅ already exists, do nothing
+        return False  # ✅ already exists, do nothing
 
     admin = User(
         name=DEFAULT_ADMIN_NAME,
@@ -26,3 +26,4 @@ def create_default_admin(db: Session):
     db.add(admin)
     db.commit()
     print("✅ Default admin created")
+    return True
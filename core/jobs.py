@@ -0,0 +1,54 @@
+# app/core/jobs.py
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """
+    Runs blocking `fn` every `interval` seconds on a worker thread, so DB
+    housekeeping never stalls the event loop. Failures are logged and the
+    job keeps its schedule. `wake` runs it early.
+    """
+
+    def __init__(self, name: str, interval: float, fn):
+        self.name = name
+        self.interval = interval
+        self.fn = fn
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+
+    def start(self):
+        if self.interval > 0 and self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._task = self._loop.create_task(self._run())
+
+    def wake(self):
+        """Run now instead of at the next interval; safe from any thread."""
+        if self._task is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await asyncio.to_thread(self.fn)
+            except Exception:
+                logger.exception("Periodic job %s failed", self.name)
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,130 @@
+# app/core/locations.py
+"""
+Process-wide copy of the locations table: duplicate checks, id lookups
+and prefix autocomplete without a query.
+
+The copy is an immutable snapshot swapped in whole, so readers never
+lock. It is reloaded after this worker's own location commits and, for
+changes made by other workers, whenever the "locations" DataVersion row
+moves (checked every LOCATION_REFRESH_SECONDS).
+"""
+
+import threading
+import uuid
+from bisect import bisect_left
+from typing import NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.database import SessionLocal
+from core.text import location_key
+from core.versions import current_version
+from models.location import Location
+
+LOCATIONS = "locations"
+
+
+def clean_name(name: str) -> str:
+    """Name as stored: trimmed, inner whitespace collapsed."""
+    return " ".join(name.split())
+
+
+class LocationEntry(NamedTuple):
+    id: uuid.UUID
+    name: str
+
+
+class _Snapshot:
+    __slots__ = (
+        "version", "by_id", "by_key", "keys", "entries", "word_keys",
+        "word_entries",
+    )
+
+    def __init__(self, version: int, rows):
+        self.version = version
+        self.by_id = {}
+        self.by_key = {}
+        for location_id, name in rows:
+            entry = LocationEntry(location_id, name)
+            self.by_id[location_id] = entry
+            self.by_key[location_key(name)] = entry
+
+        # Sorted (key, entry) arrays: whole names, then every later word
+        # start so "val" also finds "Parvati Valley".
+        names = sorted(self.by_key.items())
+        words = sorted(
+            (key[i + 1:], entry)
+            for key, entry in names
+            for i, char in enumerate(key)
+            if char == " "
+        )
+        self.keys = [key for key, _ in names]
+        self.entries = [entry for _, entry in names]
+        self.word_keys = [key for key, _ in words]
+        self.word_entries = [entry for _, entry in words]
+
+
+class LocationRegistry:
+    def __init__(self):
+        self._snapshot = _Snapshot(-1, [])
+        self._reload_lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def load(self, db: Session):
+        """Replace the snapshot with the committed table, read via `db`."""
+        with self._reload_lock:
+            # Version first: a commit landing in between only makes the
+            # rows newer than the version, and the next check reloads.
+            version = current_version(db, LOCATIONS)
+            rows = db.execute(select(Location.id, Location.name)).all()
+            self._snapshot = _Snapshot(version, rows)
+
+    def refresh(self) -> bool:
+        """Reload if another worker changed locations; True if it did."""
+        with SessionLocal() as db:
+            if current_version(db, LOCATIONS) == self.version:
+                return False
+            self.load(db)
+            return True
+
+    def get(self, location_id: uuid.UUID) -> LocationEntry | None:
+        return self._snapshot.by_id.get(location_id)
+
+    def find(self, name: str) -> LocationEntry | None:
+        return self._snapshot.by_key.get(location_key(name))
+
+    def complete(self, prefix: str, limit: int) -> list[LocationEntry]:
+        """Names starting with `prefix`, then names with a word starting with it."""
+        key = location_key(prefix)
+        snapshot = self._snapshot
+        found: dict[uuid.UUID, LocationEntry] = {}
+
+        for keys, entries in (
+            (snapshot.keys, snapshot.entries),
+            (snapshot.word_keys, snapshot.word_entries),
+        ):
+            index = bisect_left(keys, key)
+            while (
+                len(found) < limit
+                and index < len(keys)
+                and keys[index].startswith(key)
+            ):
+                found.setdefault(entries[index].id, entries[index])
+                index += 1
+
+        return list(found.values())
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version,
+            "locations": len(snapshot.by_id),
+            "word_entries": len(snapshot.word_keys),
+        }
+
+
+location_registry = LocationRegistry()
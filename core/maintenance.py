@@ -0,0 +1,109 @@
+# app/core/maintenance.py
+from datetime import datetime
+
+from sqlalchemy import delete, select, update
+
+from core.bookings import release_seats
+from core.config import BOOKING_EXPIRY_BATCH_SIZE, OTP_PURGE_BATCH_SIZE
+from core.database import SessionLocal
+from models.booking import Booking, BookingStatus
+from models.password_reset import PasswordResetOTP
+from models.revoked_token import RevokedToken
+
+
+def purge_password_reset_otps(batch_size: int = OTP_PURGE_BATCH_SIZE) -> int:
+    """
+    Delete expired OTP rows (used ones are expired on consumption) in
+    batches of `batch_size`, each in its own short transaction so no lock
+    is held for long. Returns the number of rows deleted.
+    """
+    deleted = 0
+    cutoff = datetime.utcnow()
+
+    while True:
+        with SessionLocal() as db:
+            ids = db.scalars(
+                select(PasswordResetOTP.id)
+                .where(PasswordResetOTP.expires_at < cutoff)
+                .limit(batch_size)
+            ).all()
+            if not ids:
+                return deleted
+
+            db.execute(
+                delete(PasswordResetOTP).where(PasswordResetOTP.id.in_(ids))
+            )
+            db.commit()
+
+        deleted += len(ids)
+        if len(ids) < batch_size:
+            return deleted
+
+
+def purge_revoked_tokens(batch_size: int = OTP_PURGE_BATCH_SIZE) -> int:
+    """
+    Delete revocation rows whose token has expired anyway, in batches like
+    `purge_password_reset_otps`. Returns the number of rows deleted.
+    """
+    deleted = 0
+    cutoff = datetime.utcnow()
+
+    while True:
+        with SessionLocal() as db:
+            jtis = db.scalars(
+                select(RevokedToken.jti)
+                .where(RevokedToken.expires_at < cutoff)
+                .limit(batch_size)
+            ).all()
+            if not jtis:
+                return deleted
+
+            db.execute(delete(RevokedToken).where(RevokedToken.jti.in_(jtis)))
+            db.commit()
+
+        deleted += len(jtis)
+        if len(jtis) < batch_size:
+            return deleted
+
+
+def expire_booking_holds(batch_size: int = BOOKING_EXPIRY_BATCH_SIZE) -> int:
+    """
+    Expire HELD bookings whose hold has lapsed and release their seats, a
+    batch per transaction. Rows locked by another worker are skipped
+    (FOR UPDATE SKIP LOCKED where supported); the status guard on the
+    UPDATE makes a concurrent confirm / cancel win cleanly. Returns the
+    number of bookings expired.
+    """
+    expired = 0
+    cutoff = datetime.utcnow()
+
+    while True:
+        with SessionLocal() as db:
+            ids = db.scalars(
+                select(Booking.id)
+                .where(
+                    Booking.status == BookingStatus.HELD,
+                    Booking.hold_expires_at <= cutoff,
+                )
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not ids:
+                return expired
+
+            released = db.execute(
+                update(Booking)
+                .where(
+                    Booking.id.in_(ids),
+                    Booking.status == BookingStatus.HELD,
+                )
+                .values(status=BookingStatus.EXPIRED, hold_expires_at=None)
+                .returning(Booking.trip_id, Booking.seats)
+                .execution_options(synchronize_session=False)
+            ).all()
+            release_seats(db, released)
+            db.commit()
+
+        expired += len(released)
+        if len(ids) < batch_size:
+            return expired
@@ -0,0 +1,426 @@
+# app/core/media.py
+"""
+Advertisement images: uploads streamed to content-addressed storage, and
+resized variants rendered in worker processes.
+
+An upload is written chunk by chunk to a temporary file while its SHA-256
+is computed, then renamed to MEDIA_ROOT/<aa>/<digest>/original, so no
+request holds a whole image in memory and the same bytes always land on
+the same path. The asset row starts PENDING; the media-render job (woken
+by the upload) claims a batch of them for MEDIA_RENDER_LEASE_SECONDS, the
+way core.outbox claims messages, renders every VARIANTS entry as WebP in
+a process pool and marks each asset READY, or FAILED if the file is not
+a usable image. Only the worker holding an asset's lease writes its
+result.
+
+Variant files never change once written, which is what lets them be
+served as immutable. Never edit a VARIANTS entry in place: add a new
+variant name instead.
+"""
+
+import enum
+import hashlib
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+
+from core.config import (
+    MEDIA_MAX_PIXELS,
+    MEDIA_MAX_UPLOAD_BYTES,
+    MEDIA_POOL_WORKERS,
+    MEDIA_RENDER_BATCH_SIZE,
+    MEDIA_RENDER_LEASE_SECONDS,
+    MEDIA_RENDER_MAX_ATTEMPTS,
+    MEDIA_ROOT,
+)
+from core.database import SessionLocal, dialect_insert
+from core.metrics import registry
+from models.media_asset import MediaAsset, MediaStatus
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = ("image/jpeg", "image/png", "image/webp")
+VARIANT_MEDIA_TYPE = "image/webp"
+
+
+class MediaVariant(str, enum.Enum):
+    THUMBNAIL = "thumbnail"
+    CARD = "card"
+    FULL = "full"
+
+
+VARIANTS = {
+    # variant: (longest edge in pixels, WebP quality)
+    MediaVariant.THUMBNAIL: (160, 70),
+    MediaVariant.CARD: (640, 80),
+    MediaVariant.FULL: (1600, 85),
+}
+
+renders = registry.counter(
+    "media_renders_total", "Uploaded images rendered, by outcome", ("outcome",)
+)
+
+
+def asset_directory(digest: str, root: str = MEDIA_ROOT) -> str:
+    return os.path.join(root, digest[:2], digest)
+
+
+def variant_path(directory: str, variant: MediaVariant) -> str:
+    return os.path.join(directory, f"{variant.value}.webp")
+
+
+def render_variants(directory: str, max_pixels: int) -> tuple[int, int]:
+    """
+    Write every VARIANTS entry for `directory`/original. Runs in a pool
+    worker. Returns the original's upright (width, height).
+    """
+    # Only needed where variants are rendered.
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        image = Image.open(os.path.join(directory, "original"))
+    except UnidentifiedImageError:
+        raise ValueError("Not a readable image") from None
+
+    with image:
+        # Checked on the header, before anything is decoded.
+        if image.format not in ("JPEG", "PNG", "WEBP"):
+            raise ValueError(f"{image.format} images are not supported")
+        width, height = image.size
+        if width * height > max_pixels:
+            raise ValueError(f"{width}x{height} is over {max_pixels} pixels")
+
+        # JPEGs can decode straight at a fraction of their size.
+        largest = max(edge for edge, _ in VARIANTS.values())
+        image.draft("RGB", (largest, largest))
+        upright = ImageOps.exif_transpose(image)
+        if (upright.width > upright.height) != (width > height):
+            width, height = height, width
+
+        has_alpha = upright.mode in ("RGBA", "LA", "PA") or (
+            "transparency" in upright.info
+        )
+        current = upright.convert("RGBA" if has_alpha else "RGB")
+
+        # Largest first, each one resized from the last.
+        for variant, (edge, quality) in sorted(
+            VARIANTS.items(), key=lambda item: -item[1][0]
+        ):
+            current = current.copy()
+            current.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+            path = variant_path(directory, variant)
+            temp = f"{path}.{os.getpid()}.tmp"
+            current.save(temp, "WEBP", quality=quality, method=4)
+            os.replace(temp, path)
+
+    return width, height
+
+
+def register_asset(
+    db: Session,
+    digest: str,
+    content_type: str,
+    size: int,
+) -> MediaAsset:
+    """
+    Record a stored upload (a no-op for a known digest, except that a
+    FAILED asset goes back to PENDING for another try).
+    """
+    insert = dialect_insert(db)(MediaAsset).values(
+        id=digest,
+        content_type=content_type,
+        size=size,
+        status=MediaStatus.PENDING,
+        created_at=datetime.utcnow(),
+    )
+    db.execute(insert.on_conflict_do_update(
+        index_elements=[MediaAsset.id],
+        set_={
+            "status": MediaStatus.PENDING,
+            "error": None,
+            "attempts": 0,
+            "leased_until": None,
+        },
+        where=MediaAsset.status == MediaStatus.FAILED,
+    ))
+    db.commit()
+    return db.get(MediaAsset, digest)
+
+
+class MediaStore:
+    def __init__(
+        self,
+        root: str = MEDIA_ROOT,
+        workers: int = MEDIA_POOL_WORKERS,
+        max_bytes: int = MEDIA_MAX_UPLOAD_BYTES,
+        max_pixels: int = MEDIA_MAX_PIXELS,
+    ):
+        self.root = root
+        self.workers = workers
+        self.max_bytes = max_bytes
+        self.max_pixels = max_pixels
+        # Called after an upload is stored; main.py points it at the
+        # render job's wake.
+        self.on_stored = None
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._closed = False
+
+    # ----- uploads -----
+
+    def _temp_file(self):
+        directory = os.path.join(self.root, "tmp")
+        os.makedirs(directory, exist_ok=True)
+        return tempfile.NamedTemporaryFile(
+            dir=directory, prefix="upload-", delete=False
+        )
+
+    @staticmethod
+    def _write(temp, digest, chunk: bytes):
+        digest.update(chunk)
+        temp.write(chunk)
+
+    def _keep(self, temp_path: str, digest: str):
+        directory = asset_directory(digest, self.root)
+        os.makedirs(directory, exist_ok=True)
+        original = os.path.join(directory, "original")
+        if os.path.exists(original):
+            os.unlink(temp_path)
+        else:
+            os.replace(temp_path, original)
+
+    @staticmethod
+    def _discard(temp):
+        temp.close()
+        try:
+            os.unlink(temp.name)
+        except FileNotFoundError:
+            pass
+
+    async def receive(self, request: Request) -> tuple[str, str, int]:
+        """
+        Stream the request body (the image itself, not a form) into
+        storage. Returns (digest, content_type, size).
+        """
+        content_type = (
+            request.headers.get("content-type", "").split(";")[0].strip()
+        ).lower()
+        if content_type not in CONTENT_TYPES:
+            raise HTTPException(
+                status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                "Send a JPEG, PNG or WebP image as the request body",
+            )
+        too_large = HTTPException(
+            status.HTTP_413_CONTENT_TOO_LARGE,
+            f"Images are limited to {self.max_bytes} bytes",
+        )
+        length = request.headers.get("content-length", "")
+        if length.isdigit() and int(length) > self.max_bytes:
+            raise too_large
+
+        temp = await run_in_threadpool(self._temp_file)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async for chunk in request.stream():
+                size += len(chunk)
+                if size > self.max_bytes:
+                    raise too_large
+                await run_in_threadpool(self._write, temp, digest, chunk)
+            if not size:
+                raise HTTPException(400, "Empty upload")
+            await run_in_threadpool(temp.close)
+            await run_in_threadpool(self._keep, temp.name, digest.hexdigest())
+        except BaseException:
+            await run_in_threadpool(self._discard, temp)
+            raise
+
+        return digest.hexdigest(), content_type, size
+
+    def stored(self):
+        if self.on_stored is not None:
+            self.on_stored()
+
+    # ----- variants -----
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Spawned, not forked: the pool starts from a job thread
+                # while other threads may hold locks a fork would copy.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _render(self, digest: str) -> Future:
+        directory = asset_directory(digest, self.root)
+        future = Future()
+        if self._closed:
+            future.cancel()
+            return future
+        if self.workers > 0:
+            return self._pool().submit(
+                render_variants, directory, self.max_pixels
+            )
+
+        try:
+            future.set_result(render_variants(directory, self.max_pixels))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    @staticmethod
+    def _claim(
+        batch_size: int, now: datetime, leased_until: datetime
+    ) -> tuple[int, list]:
+        """Lease up to `batch_size` assets to render; (seen, claimed)."""
+        due = (
+            MediaAsset.status == MediaStatus.PENDING,
+            or_(
+                MediaAsset.leased_until.is_(None),
+                MediaAsset.leased_until <= now,
+            ),
+        )
+        with SessionLocal() as db:
+            digests = db.scalars(
+                select(MediaAsset.id)
+                .where(*due)
+                .order_by(MediaAsset.created_at)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not digests:
+                return 0, []
+
+            claimed = db.execute(
+                update(MediaAsset)
+                .where(MediaAsset.id.in_(digests), *due)
+                .values(
+                    leased_until=leased_until,
+                    attempts=MediaAsset.attempts + 1,
+                )
+                .returning(MediaAsset.id, MediaAsset.attempts)
+                .execution_options(synchronize_session=False)
+            ).all()
+            db.commit()
+        return len(digests), claimed
+
+    def render_pending(self, batch_size: int = MEDIA_RENDER_BATCH_SIZE) -> int:
+        """
+        Render PENDING assets, a claimed batch at a time across the pool,
+        until none are left. Returns the number of assets finished.
+        """
+        finished = 0
+        while not self._closed:
+            now = datetime.utcnow()
+            leased_until = now + timedelta(seconds=MEDIA_RENDER_LEASE_SECONDS)
+            seen, claimed = self._claim(batch_size, now, leased_until)
+            if not seen:
+                return finished
+
+            futures = [
+                (digest, attempts, self._render(digest))
+                for digest, attempts in claimed
+            ]
+            results = []
+            broken = False
+            for digest, attempts, future in futures:
+                try:
+                    width, height = future.result()
+                except CancelledError:
+                    # Shutting down: not this asset's attempt, and free
+                    # for the next worker straight away.
+                    results.append({
+                        "id": digest,
+                        "attempts": attempts - 1,
+                        "leased_until": None,
+                    })
+                    continue
+                except BrokenProcessPool:
+                    # A worker died (out of memory?) and took the rest of
+                    # the batch with it. Retry on a fresh pool, up to the
+                    # asset that keeps killing it.
+                    broken = True
+                    if attempts < MEDIA_RENDER_MAX_ATTEMPTS:
+                        results.append({"id": digest, "leased_until": None})
+                        continue
+                    error = "Render worker died"
+                except Exception as exc:
+                    error = str(exc)[:500] or type(exc).__name__
+                else:
+                    renders.inc(outcome="ready")
+                    results.append({
+                        "id": digest,
+                        "status": MediaStatus.READY,
+                        "width": width,
+                        "height": height,
+                        "leased_until": None,
+                    })
+                    finished += 1
+                    continue
+
+                logger.warning("Media asset %s failed: %s", digest, error)
+                renders.inc(outcome="failed")
+                results.append({
+                    "id": digest,
+                    "status": MediaStatus.FAILED,
+                    "error": error,
+                    "leased_until": None,
+                })
+                finished += 1
+
+            if broken:
+                with self._lock:
+                    executor, self._executor = self._executor, None
+                if executor is not None:
+                    executor.shutdown(wait=False)
+
+            if results:
+                with SessionLocal() as db:
+                    # ORM bulk UPDATE by primary key, guarded so a lease
+                    # that ran out (and was claimed again elsewhere) is
+                    # not overwritten.
+                    db.execute(
+                        update(MediaAsset)
+                        .where(
+                            MediaAsset.status == MediaStatus.PENDING,
+                            MediaAsset.leased_until == leased_until,
+                        )
+                        .execution_options(synchronize_session=None),
+                        results,
+                    )
+                    db.commit()
+            if seen < batch_size:
+                break
+        return finished
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "ready": int(renders.value(outcome="ready")),
+            "failed": int(renders.value(outcome="failed")),
+        }
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            # Queued renders stay PENDING for the next start; waiting for the
+            # running ones lets the pool release its semaphores.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+media_store = MediaStore()
@@ -1,21 +1,66 @@
-import random
+import hashlib
+import hmac
+import secrets
 from datetime import datetime, timedelta
 from passlib.context import CryptContext
+from sqlalchemy import Update, update
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from core.config import OTP_MAX_ATTEMPTS, SECRET_KEY
+from models.password_reset import PasswordResetOTP
+
+# Only needed to verify OTPs issued before the HMAC scheme.
+legacy_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+HMAC_PREFIX = "hmac-sha256$"
+
+# Derived so the OTP key is never the raw JWT signing key.
+_OTP_KEY = hmac.new(
+    SECRET_KEY.encode(), b"password-reset-otp", hashlib.sha256
+).digest()
 
 
 def generate_otp() -> str:
-    return str(random.randint(100000, 999999))
+    return str(100000 + secrets.randbelow(900000))
+
+
+def _digest(otp: str, salt: str) -> str:
+    message = f"{salt}${otp}".encode()
+    return hmac.new(_OTP_KEY, message, hashlib.sha256).hexdigest()
 
 
 def hash_otp(otp: str) -> str:
-    return pwd_context.hash(otp)
+    salt = secrets.token_hex(8)
+    return f"{HMAC_PREFIX}{salt}${_digest(otp, salt)}"
+
+
+def is_legacy_hash(hashed: str) -> bool:
+    return not hashed.startswith(HMAC_PREFIX)
 
 
 def verify_otp(otp: str, hashed: str) -> bool:
-    return pwd_context.verify(otp, hashed)
+    if is_legacy_hash(hashed):
+        return legacy_context.verify(otp, hashed)
+
+    salt, _, digest = hashed[len(HMAC_PREFIX):].partition("$")
+    return hmac.compare_digest(_digest(otp, salt), digest)
 
 
 def otp_expiry(minutes: int = 5):
     return datetime.utcnow() + timedelta(minutes=minutes)
+
+
+def claim_attempt(otp_id: str) -> Update:
+    """
+    Count one verification attempt against `otp_id` while any are left.
+    Matches no row once OTP_MAX_ATTEMPTS are used, so parallel guesses
+    can't all get past a check of a count read before the others landed.
+    """
+    return (
+        update(PasswordResetOTP)
+        .where(
+            PasswordResetOTP.id == otp_id,
+            PasswordResetOTP.attempts < OTP_MAX_ATTEMPTS,
+        )
+        .values(attempts=PasswordResetOTP.attempts + 1)
+        .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,107 @@
+# app/core/pool_metrics.py
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from core.metrics import registry
+
+checkout_wait = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+)
+checkouts = registry.counter(
+    "db_pool_checkouts_total", "Connections checked out of the pool"
+)
+timeouts = registry.counter(
+    "db_pool_timeouts_total", "Checkouts that gave up after DB_POOL_TIMEOUT"
+)
+connects = registry.counter(
+    "db_pool_connects_total", "New DBAPI connections opened"
+)
+overflow_connects = registry.counter(
+    "db_pool_overflow_connects_total",
+    "Connections opened beyond DB_POOL_SIZE",
+)
+invalidations = registry.counter(
+    "db_pool_invalidations_total",
+    "Connections invalidated, by kind (hard / soft)",
+    labelnames=("kind",),
+)
+checked_out = registry.gauge(
+    "db_pool_checked_out", "Connections currently checked out"
+)
+checked_out_peak = registry.gauge(
+    "db_pool_checked_out_peak", "High-water mark of checked-out connections"
+)
+
+
+class _TimedCheckout:
+    """Pool mixin timing how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timeouts.inc()
+            raise
+        finally:
+            checkout_wait.observe(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_engine(engine):
+    """Attach the pool listeners; they follow the pool across dispose()."""
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        connects.inc()
+        if engine.pool.checkedout() > engine.pool.size():
+            overflow_connects.inc()
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checkouts.inc()
+        checked_out.inc()
+        current = checked_out.value()
+        if current > checked_out_peak.value():
+            checked_out_peak.set(current)
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out.dec()
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        invalidations.inc(kind="hard")
+
+    @event.listens_for(engine, "soft_invalidate")
+    def on_soft_invalidate(dbapi_connection, connection_record, exception):
+        invalidations.inc(kind="soft")
+
+
+def pool_snapshot(pool) -> dict:
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checked_out_peak": int(checked_out_peak.value()),
+        "checkouts": int(checkouts.value()),
+        "connects": int(connects.value()),
+        "overflow_connects": int(overflow_connects.value()),
+        "invalidations": {
+            kind: int(invalidations.value(kind=kind))
+            for kind in ("hard", "soft")
+        },
+        "timeouts": int(timeouts.value()),
+        "checkout_wait_seconds": checkout_wait.snapshot(),
+    }
@@ -0,0 +1,91 @@
+# app/core/query_budget.py
+import logging
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from core.config import QUERY_BUDGET_MODE, QUERY_REPEAT_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+TRACKING = QUERY_BUDGET_MODE in ("warn", "enforce")
+
+_PLACEHOLDER = r"(?:\?|%\(\w+\)s|%s|\$\d+|:\w+)"
+_IN_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+# True while statements run that route budgets leave out.
+_exempt: ContextVar[bool] = ContextVar("query_budget_exempt", default=False)
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+@contextmanager
+def exempt_from_budget():
+    """
+    Leave the statements issued inside out of the route's budget (the
+    metrics still count them). For lookups served from a cache, like the
+    principal lookup: whether they query depends on the cache, and a
+    budget has to hold either way.
+    """
+    token = _exempt.set(True)
+    try:
+        yield
+    finally:
+        _exempt.reset(token)
+
+
+def budget_exempt() -> bool:
+    return _exempt.get()
+
+
+def query_budget(max_queries: int):
+    """
+    Declare how many SQL statements a route may issue per request,
+    including its dependencies (auth lookups) but not the cached principal
+    lookup (see exempt_from_budget). Checked only when QUERY_BUDGET_MODE
+    is warn / enforce.
+
+        @router.post("/advertisements")
+        @query_budget(4)
+        def create_advertisement(...):
+    """
+
+    def decorator(endpoint):
+        endpoint.query_budget = max_queries
+        return endpoint
+
+    return decorator
+
+
+def statement_shape(statement: str) -> str:
+    """Collapse whitespace and expanded IN lists so N+1 repeats compare equal."""
+    return _IN_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def check_request(scope, statements: list[str]):
+    """Report repeated statement shapes and enforce the route's budget."""
+    route = getattr(scope.get("route"), "path", scope.get("path"))
+
+    for shape, count in Counter(map(statement_shape, statements)).items():
+        if count >= QUERY_REPEAT_THRESHOLD:
+            logger.warning(
+                "Possible N+1 on %s %s: %d x %s",
+                scope["method"], route, count, shape,
+            )
+
+    budget = getattr(scope.get("endpoint"), "query_budget", None)
+    if budget is None or len(statements) <= budget:
+        return
+
+    message = (
+        f"{scope['method']} {route} issued {len(statements)} SQL "
+        f"statements, budget is {budget}"
+    )
+    if QUERY_BUDGET_MODE == "enforce":
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
@@ -0,0 +1,248 @@
+# app/core/rate_limit.py
+"""
+Sliding-window rate limits for the credential endpoints.
+
+Each limit keeps one counter per fixed window and estimates the sliding
+window from the current and previous counters, weighting the previous one
+by how much of it the sliding window still overlaps:
+
+    estimate = previous * (1 - elapsed / window) + current
+
+That is two integers per client and limit (no timestamp per request),
+without the double burst a plain fixed window allows at its boundary.
+
+Limits apply per client IP and per account (the email the request names),
+as a route dependency: they run before the handler opens a session or
+hashes anything, and over-limit requests get 429 with Retry-After.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
+
+from core.cache import TTLCache, cache_backend
+from core.config import (
+    RATE_LIMIT_LOGIN_ACCOUNT,
+    RATE_LIMIT_LOGIN_IP,
+    RATE_LIMIT_MAX_KEYS,
+    RATE_LIMIT_OTP_REQUEST_ACCOUNT,
+    RATE_LIMIT_OTP_REQUEST_IP,
+    RATE_LIMIT_OTP_VERIFY_ACCOUNT,
+    RATE_LIMIT_OTP_VERIFY_IP,
+    RATE_LIMIT_REGISTER_IP,
+    RATE_LIMIT_TRUST_FORWARDED,
+    RATE_LIMIT_URL,
+)
+from core.metrics import registry
+
+rate_limited_total = registry.counter(
+    "rate_limited_total",
+    "Requests rejected with 429, by limit and key type",
+    labelnames=("limit", "scope"),
+)
+
+
+@dataclass(frozen=True)
+class Limit:
+    requests: int
+    seconds: int
+
+    @classmethod
+    def parse(cls, spec: str) -> "Limit | None":
+        """`"<requests>/<seconds>"`; None when empty or zero (disabled)."""
+        spec = spec.strip()
+        if spec in ("", "0"):
+            return None
+        requests, _, seconds = spec.partition("/")
+        try:
+            limit = cls(int(requests), int(seconds))
+        except ValueError:
+            raise RuntimeError(f"Invalid rate limit '{spec}'") from None
+        if limit.requests <= 0 or limit.seconds <= 0:
+            raise RuntimeError(f"Invalid rate limit '{spec}'")
+        return limit
+
+
+# =====================================================
+# COUNTER STORES
+# =====================================================
+
+class LocalCounters:
+    """Per-process counters in a bounded TTLCache (oldest keys evicted)."""
+
+    shared = False
+
+    def __init__(self, maxsize: int):
+        self._cache = TTLCache(maxsize=maxsize, ttl=0)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> int:
+        return self._cache.get(key, 0)
+
+    def incr(self, key: str, ttl: float) -> int:
+        with self._lock:
+            value = self._cache.get(key, 0) + 1
+            self._cache.set(key, value, ttl)
+        return value
+
+
+class SharedCounters:
+    """Counters in a core.cache backend, seen by every worker."""
+
+    shared = True
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def get(self, key: str) -> int:
+        return int(self.backend.get(key) or 0)
+
+    def incr(self, key: str, ttl: float) -> int:
+        return self.backend.incr(key, ttl)
+
+
+def counter_store(url: str, maxsize: int):
+    backend = cache_backend(url)
+    if backend is None:
+        return LocalCounters(maxsize)
+    return SharedCounters(backend)
+
+
+# =====================================================
+# SLIDING WINDOW
+# =====================================================
+
+def retry_after(
+    previous: int, current: int, elapsed: float, window: int, allowed: int
+) -> float:
+    """Seconds until one more request fits, if no others arrive meanwhile."""
+    room = allowed - 1
+    if current <= room and previous:
+        # The previous window's share decays enough before this one ends.
+        return window * (1 - (room - current) / previous) - elapsed
+    # Only once this window is the previous one and has decayed enough.
+    return window - elapsed + window * (1 - room / current)
+
+
+class RateLimiter:
+    def __init__(self, counters, clock=time.time):
+        self.counters = counters
+        # Wall clock: workers sharing a store must agree on window edges.
+        self.clock = clock
+
+    def hit(self, key: str, limit: Limit) -> float:
+        """
+        Count one request against `key`. Returns 0 if it is within
+        `limit`, else the seconds to wait. Rejected requests count too,
+        so a client that keeps hammering stays locked out.
+        """
+        window = limit.seconds
+        index, elapsed = divmod(self.clock(), window)
+        index = int(index)
+
+        current = self.counters.incr(f"{key}:{index}", 2 * window)
+        previous = self.counters.get(f"{key}:{index - 1}")
+
+        if previous * (1 - elapsed / window) + current <= limit.requests:
+            return 0.0
+        return retry_after(previous, current, elapsed, window, limit.requests)
+
+
+limiter = RateLimiter(counter_store(RATE_LIMIT_URL, RATE_LIMIT_MAX_KEYS))
+
+
+# =====================================================
+# DEPENDENCIES
+# =====================================================
+
+def client_ip(request: Request) -> str:
+    if RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+async def account_name(request: Request, field: str) -> str | None:
+    """
+    The account a request names, from its JSON or form body. FastAPI has
+    already read and cached the body by the time dependencies run.
+    """
+    content_type = request.headers.get("content-type", "")
+    try:
+        if content_type.startswith("application/json"):
+            body = await request.json()
+            value = body.get(field) if isinstance(body, dict) else None
+        else:
+            value = (await request.form()).get(field)
+    except ValueError:
+        return None
+
+    if not isinstance(value, str) or not value.strip():
+        return None
+    # Hashed so shared stores never hold addresses.
+    normalized = value.strip().lower().encode()
+    return hashlib.blake2b(normalized, digest_size=16).hexdigest()
+
+
+def rate_limit(
+    name: str,
+    ip: Limit | None,
+    account: Limit | None = None,
+    account_field: str = "email",
+):
+    """Route dependency enforcing `ip` and `account` limits for `name`."""
+
+    async def check(request: Request):
+        keys = []
+        if ip is not None:
+            keys.append(("ip", client_ip(request), ip))
+        if account is not None:
+            value = await account_name(request, account_field)
+            if value is not None:
+                keys.append(("account", value, account))
+
+        for scope, value, limit in keys:
+            key = f"ratelimit:{name}:{scope}:{value}"
+            if limiter.counters.shared:
+                # Network round trip; keep it off the event loop.
+                wait = await run_in_threadpool(limiter.hit, key, limit)
+            else:
+                wait = limiter.hit(key, limit)
+
+            if wait:
+                rate_limited_total.inc(limit=name, scope=scope)
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many requests, try again later",
+                    headers={"Retry-After": str(max(1, math.ceil(wait)))},
+                )
+
+    return check
+
+
+login_rate_limit = rate_limit(
+    "login",
+    ip=Limit.parse(RATE_LIMIT_LOGIN_IP),
+    account=Limit.parse(RATE_LIMIT_LOGIN_ACCOUNT),
+    account_field="username",
+)
+otp_request_rate_limit = rate_limit(
+    "otp_request",
+    ip=Limit.parse(RATE_LIMIT_OTP_REQUEST_IP),
+    account=Limit.parse(RATE_LIMIT_OTP_REQUEST_ACCOUNT),
+)
+# verify-otp and reset-password both guess at the same OTP.
+otp_verify_rate_limit = rate_limit(
+    "otp_verify",
+    ip=Limit.parse(RATE_LIMIT_OTP_VERIFY_IP),
+    account=Limit.parse(RATE_LIMIT_OTP_VERIFY_ACCOUNT),
+)
+register_rate_limit = rate_limit(
+    "register", ip=Limit.parse(RATE_LIMIT_REGISTER_IP)
+)
@@ -0,0 +1,126 @@
+# app/core/request_metrics.py
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from core.metrics import registry
+from core.query_budget import TRACKING, budget_exempt, check_request
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+requests_total = registry.counter(
+    "http_requests_total",
+    "HTTP responses by method, route template and status code",
+    labelnames=("method", "route", "status"),
+)
+request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template",
+    labelnames=("method", "route"),
+)
+requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served"
+)
+request_queries = registry.histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request",
+    labelnames=("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+request_db_time = registry.histogram(
+    "http_request_db_seconds",
+    "Time spent in SQL statements per request",
+    labelnames=("method", "route"),
+)
+queries_total = registry.counter(
+    "db_queries_total", "SQL statements executed"
+)
+query_duration = registry.histogram(
+    "db_query_duration_seconds", "Latency of individual SQL statements"
+)
+
+
+class RequestDBStats:
+    __slots__ = ("queries", "seconds", "statements")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+        # statement text, kept only when query budgets are being tracked
+        self.statements = [] if TRACKING else None
+
+
+# Set for the duration of a request; threadpool handlers and the async
+# engine's greenlets both run inside the request's context.
+current_request_stats: ContextVar[RequestDBStats | None] = ContextVar(
+    "current_request_stats", default=None
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context,
+                           executemany):
+    # On the statement's own execution context, so a statement that fails
+    # (no after_cursor_execute) leaves nothing behind on the connection.
+    context._query_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context,
+                          executemany):
+    elapsed = time.perf_counter() - context._query_start
+    queries_total.inc()
+    query_duration.observe(elapsed)
+
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.seconds += elapsed
+        if stats.statements is not None and not budget_exempt():
+            stats.statements.append(statement)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware (no BaseHTTPMiddleware task overhead) recording
+    latency, status codes, in-flight requests and per-request SQL usage,
+    labelled with the matched route template, e.g. /admin/trips/{trip_id}.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestDBStats()
+        token = current_request_stats.set(stats)
+        requests_in_flight.inc_key(())
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+            if TRACKING:
+                check_request(scope, stats.statements)
+        finally:
+            elapsed = time.perf_counter() - started
+            requests_in_flight.inc_key((), -1)
+            current_request_stats.reset(token)
+
+            route = scope.get("route")
+            key = (scope["method"], getattr(route, "path", "unmatched"))
+
+            requests_total.inc_key(key + (str(status_code),))
+            request_duration.observe_key(key, elapsed)
+            request_queries.observe_key(key, stats.queries)
+            request_db_time.observe_key(key, stats.seconds)
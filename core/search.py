@@ -0,0 +1,567 @@
+# app/core/search.py
+"""
+Trip search index over the title, description and location name of every
+published, active trip.
+
+Writers keep it in step by calling `sync_trips` in the same transaction
+as the trip change, so the index never shows a commit that rolled back.
+Every query word must match; the last one also matches as a prefix so
+results follow the user's typing. SQLite uses FTS5 (bm25 ranking) plus a
+trigram index over the indexed vocabulary to correct misspelled words;
+PostgreSQL uses a weighted tsvector (ts_rank_cd) plus pg_trgm word
+similarity. Exact / prefix matches always rank ahead of corrected ones.
+
+Full reindex, e.g. after restoring a dump:
+
+    python cli.py rebuild-search --batch-size 1000
+"""
+
+import re
+import uuid
+from typing import Iterable, Sequence
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Select,
+    String,
+    Table,
+    bindparam,
+    delete,
+    inspect,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from core.config import (
+    SEARCH_FUZZY_CANDIDATES,
+    SEARCH_RANK_WINDOW,
+    SEARCH_REBUILD_BATCH_SIZE,
+)
+from core.database import SessionLocal, engine
+from core.ids import GUID
+from core.text import normalize
+from models.location import Location
+from models.trip import Trip, TripStatus
+
+WORD = re.compile(r"\w+")
+MAX_QUERY_TERMS = 8
+# Shorter words are never corrected (a typo in them is another word) and
+# are left out of the vocabulary.
+MIN_WORD_LENGTH = 4
+MAX_CORRECTIONS = 4
+MAX_COMPLETIONS = 16
+
+
+def words(value: str) -> list[str]:
+    return WORD.findall(normalize(value))
+
+
+def query_terms(query: str) -> list[str]:
+    """Distinct words of a search query, in order, at most MAX_QUERY_TERMS."""
+    return list(dict.fromkeys(words(query)))[:MAX_QUERY_TERMS]
+
+
+def max_edits(term: str) -> int:
+    if len(term) < MIN_WORD_LENGTH:
+        return 0
+    return 1 if len(term) < 6 else 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, or limit + 1 as soon as it must exceed `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def close_words(term: str, candidates: Iterable[str]) -> list[str]:
+    """Vocabulary words within max_edits(term) of `term`, closest first."""
+    limit = max_edits(term)
+    scored = []
+    for word in candidates:
+        distance = edit_distance(term, word, limit)
+        if distance <= limit:
+            scored.append((distance, word))
+    return [word for _, word in sorted(scored)[:MAX_CORRECTIONS]]
+
+
+def merge(
+    exact: list[uuid.UUID],
+    fuzzy: list[uuid.UUID],
+    limit: int,
+) -> list[tuple[uuid.UUID, bool]]:
+    """(trip_id, fuzzy) pairs: exact hits, then new fuzzy ones, up to `limit`."""
+    hits = [(trip_id, False) for trip_id in exact]
+    seen = set(exact)
+    for trip_id in fuzzy:
+        if len(hits) >= limit:
+            break
+        if trip_id not in seen:
+            hits.append((trip_id, True))
+    return hits
+
+
+def documents_query() -> Select:
+    """
+    Trips as (trip_id, title, description, location) rows plus the columns
+    that decide visibility. Callers narrow by id and filter with
+    searchable(): an id lookup that also filters is_active / status lets
+    SQLite pick the (is_active, status, ...) index over the primary key.
+    """
+    return (
+        select(
+            Trip.id.label("trip_id"),
+            Trip.title,
+            Trip.description,
+            Location.name.label("location"),
+            Trip.is_active,
+            Trip.status,
+        )
+        .join(Location, Location.id == Trip.location_id)
+    )
+
+
+def searchable(rows: Iterable) -> list:
+    return [
+        row for row in rows
+        if row.is_active and row.status == TripStatus.PUBLISHED
+    ]
+
+# =====================================================
+# SQLITE – FTS5
+# =====================================================
+
+_metadata = MetaData()
+
+# FTS5 rows are keyed by integer rowid; this maps them to trip ids.
+search_docs = Table(
+    "trip_search_docs",
+    _metadata,
+    Column("id", Integer, primary_key=True),
+    Column("trip_id", GUID, nullable=False, unique=True),
+)
+
+# Words ever indexed, for prefix completion and typo correction. Only
+# grows: a stale word just expands to something with no matches.
+search_terms = Table(
+    "trip_search_terms",
+    _metadata,
+    Column("id", Integer, primary_key=True),
+    Column("term", String, nullable=False, unique=True),
+)
+
+# bm25 column weights: title, description, location.
+BM25 = "bm25(trip_search, 10.0, 1.0, 5.0)"
+# FTS5 prefix indexes; longer prefixes are expanded through search_terms,
+# which is far cheaper than FTS5 merging doclists for an unindexed prefix.
+PREFIX_INDEXES = (2, 3)
+
+
+def fts_query(groups: list[list[str]]) -> str:
+    """FTS5 query: every group must match, any term within a group may."""
+    return " AND ".join("(" + " OR ".join(group) + ")" for group in groups)
+
+
+class SQLiteSearchIndex:
+    tables = ("trip_search", "trip_search_trigrams")
+
+    def exists(self, conn: Connection) -> bool:
+        return inspect(conn).has_table("trip_search_docs")
+
+    def create(self, conn: Connection):
+        _metadata.create_all(conn)
+        conn.execute(text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS trip_search USING fts5("
+            "title, description, location, "
+            "tokenize = 'unicode61 remove_diacritics 2', "
+            f"prefix = '{' '.join(map(str, PREFIX_INDEXES))}')"
+        ))
+        conn.execute(text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS trip_search_trigrams USING fts5("
+            "term, content = 'trip_search_terms', content_rowid = 'id', "
+            "tokenize = 'trigram', detail = 'none')"
+        ))
+
+    def drop(self, conn: Connection):
+        for table in self.tables:
+            conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        _metadata.drop_all(conn)
+
+    def write(self, db: Session, trip_ids: Sequence[uuid.UUID], docs: Sequence):
+        rowids = dict(db.execute(
+            select(search_docs.c.trip_id, search_docs.c.id)
+            .where(search_docs.c.trip_id.in_(trip_ids))
+        ).tuples().all())
+        if rowids:
+            db.execute(
+                text("DELETE FROM trip_search WHERE rowid = :id"),
+                [{"id": rowid} for rowid in rowids.values()],
+            )
+
+        live = {doc.trip_id for doc in docs}
+        gone = [trip_id for trip_id in rowids if trip_id not in live]
+        if gone:
+            db.execute(
+                delete(search_docs).where(search_docs.c.trip_id.in_(gone))
+            )
+
+        new = [{"trip_id": doc.trip_id} for doc in docs if doc.trip_id not in rowids]
+        if new:
+            rowids.update(db.execute(
+                insert(search_docs).returning(
+                    search_docs.c.trip_id, search_docs.c.id
+                ),
+                new,
+            ).tuples().all())
+
+        if docs:
+            db.execute(
+                text(
+                    "INSERT INTO trip_search (rowid, title, description, location) "
+                    "VALUES (:id, :title, :description, :location)"
+                ),
+                [
+                    {
+                        "id": rowids[doc.trip_id],
+                        "title": doc.title,
+                        "description": doc.description,
+                        "location": doc.location,
+                    }
+                    for doc in docs
+                ],
+            )
+            self.add_vocabulary(db, docs)
+
+    def add_vocabulary(self, db: Session, docs: Sequence):
+        vocabulary = {
+            word
+            for doc in docs
+            for word in words(f"{doc.title} {doc.description} {doc.location}")
+            if len(word) >= MIN_WORD_LENGTH
+        }
+        if not vocabulary:
+            return
+
+        added = db.execute(
+            sqlite_insert(search_terms)
+            .on_conflict_do_nothing()
+            .returning(search_terms.c.id, search_terms.c.term),
+            [{"term": word} for word in sorted(vocabulary)],
+        ).all()
+        if added:
+            db.execute(
+                text(
+                    "INSERT INTO trip_search_trigrams (rowid, term) "
+                    "VALUES (:id, :term)"
+                ),
+                [{"id": row.id, "term": row.term} for row in added],
+            )
+
+    def completions(self, db: Session, prefix: str) -> list[str]:
+        return db.scalars(
+            select(search_terms.c.term)
+            .where(
+                search_terms.c.term > prefix,
+                search_terms.c.term < prefix + "\U0010ffff",
+            )
+            .order_by(search_terms.c.term)
+            .limit(MAX_COMPLETIONS)
+        ).all()
+
+    def groups(self, db: Session, terms: list[str]) -> list[list[str]]:
+        *complete, last = terms
+        groups = [[f'"{term}"'] for term in complete]
+        if len(last) in PREFIX_INDEXES:
+            groups.append([f'"{last}"*'])
+        elif len(last) < MIN_WORD_LENGTH:
+            groups.append([f'"{last}"'])
+        else:
+            groups.append(
+                [f'"{word}"' for word in [last, *self.completions(db, last)]]
+            )
+        return groups
+
+    def corrections(self, db: Session, terms: list[str]) -> dict[str, list[str]]:
+        fuzzy = [term for term in terms if max_edits(term)]
+        grams = {
+            term[i:i + 3] for term in fuzzy for i in range(len(term) - 2)
+        }
+        if not grams:
+            return {}
+
+        # Words sharing the most trigrams with any term rank first; one
+        # lookup covers every term.
+        candidates = db.scalars(
+            text(
+                "SELECT term FROM trip_search_trigrams "
+                "WHERE trip_search_trigrams MATCH :query "
+                "ORDER BY rank LIMIT :limit"
+            ),
+            {
+                "query": " OR ".join(f'"{gram}"' for gram in sorted(grams)),
+                "limit": SEARCH_FUZZY_CANDIDATES * len(fuzzy),
+            },
+        ).all()
+        return {term: close_words(term, candidates) for term in fuzzy}
+
+    def ranked(self, db: Session, query: str, limit: int) -> list[uuid.UUID]:
+        # bm25 is scored over the newest SEARCH_RANK_WINDOW matches only,
+        # so a word in half the catalog costs the same as a rare one.
+        return db.scalars(
+            text(
+                f"SELECT d.trip_id FROM (SELECT rowid AS id, {BM25} AS score "
+                "FROM trip_search WHERE trip_search MATCH :query "
+                "ORDER BY rowid DESC LIMIT :window) AS ranked "
+                "JOIN trip_search_docs d ON d.id = ranked.id "
+                "ORDER BY ranked.score, ranked.id LIMIT :limit"
+            ).columns(trip_id=GUID),
+            {"query": query, "window": SEARCH_RANK_WINDOW, "limit": limit},
+        ).all()
+
+    def search(
+        self,
+        db: Session,
+        terms: list[str],
+        limit: int,
+    ) -> list[tuple[uuid.UUID, bool]]:
+        groups = self.groups(db, terms)
+        exact = self.ranked(db, fts_query(groups), limit)
+        if len(exact) >= limit:
+            return merge(exact, [], limit)
+
+        fixes = self.corrections(db, terms)
+        if not any(fixes.values()):
+            return merge(exact, [], limit)
+
+        corrected = [
+            group + [f'"{word}"' for word in fixes.get(term, [])]
+            for term, group in zip(terms, groups)
+        ]
+        fuzzy = self.ranked(db, fts_query(corrected), limit + len(exact))
+        return merge(exact, fuzzy, limit)
+
+    def optimize(self, db: Session):
+        db.execute(text("INSERT INTO trip_search (trip_search) VALUES ('optimize')"))
+
+# =====================================================
+# POSTGRESQL – tsvector + pg_trgm
+# =====================================================
+
+class PostgresSearchIndex:
+    def exists(self, conn: Connection) -> bool:
+        return inspect(conn).has_table("trip_search")
+
+    def create(self, conn: Connection):
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS trip_search ("
+            "trip_id UUID PRIMARY KEY REFERENCES trips (id) ON DELETE CASCADE, "
+            "document TSVECTOR NOT NULL, "
+            "names TEXT NOT NULL)"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_trip_search_document "
+            "ON trip_search USING GIN (document)"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_trip_search_names "
+            "ON trip_search USING GIN (names gin_trgm_ops)"
+        ))
+
+    def drop(self, conn: Connection):
+        conn.execute(text("DROP TABLE IF EXISTS trip_search"))
+
+    def write(self, db: Session, trip_ids: Sequence[uuid.UUID], docs: Sequence):
+        db.execute(
+            text("DELETE FROM trip_search WHERE trip_id IN :ids").bindparams(
+                bindparam("ids", expanding=True, type_=GUID)
+            ),
+            {"ids": list(trip_ids)},
+        )
+        if not docs:
+            return
+
+        # Text is accent-folded here so the 'simple' configuration needs
+        # no unaccent extension and matches query_terms().
+        db.execute(
+            text(
+                "INSERT INTO trip_search (trip_id, document, names) VALUES ("
+                ":trip_id, "
+                "setweight(to_tsvector('simple', :title), 'A') || "
+                "setweight(to_tsvector('simple', :location), 'B') || "
+                "setweight(to_tsvector('simple', :description), 'C'), "
+                ":names)"
+            ),
+            [
+                {
+                    "trip_id": doc.trip_id,
+                    "title": normalize(doc.title),
+                    "location": normalize(doc.location),
+                    "description": normalize(doc.description),
+                    "names": normalize(f"{doc.title} {doc.location}"),
+                }
+                for doc in docs
+            ],
+        )
+
+    def search(
+        self,
+        db: Session,
+        terms: list[str],
+        limit: int,
+    ) -> list[tuple[uuid.UUID, bool]]:
+        *complete, last = terms
+        # Ranked over at most SEARCH_RANK_WINDOW matches, as on SQLite.
+        exact = db.scalars(
+            text(
+                "SELECT trip_id FROM (SELECT trip_id, document FROM trip_search "
+                "WHERE document @@ to_tsquery('simple', :query) "
+                "LIMIT :window) AS matched "
+                "ORDER BY ts_rank_cd(document, to_tsquery('simple', :query)) "
+                "DESC, trip_id LIMIT :limit"
+            ).columns(trip_id=GUID),
+            {
+                "query": " & ".join([*complete, f"{last}:*"]),
+                "window": SEARCH_RANK_WINDOW,
+                "limit": limit,
+            },
+        ).all()
+        if len(exact) >= limit or not any(max_edits(term) for term in terms):
+            return merge(exact, [], limit)
+
+        # `<%` is word_similarity above pg_trgm's threshold and uses the
+        # trigram index.
+        fuzzy = db.scalars(
+            text(
+                "SELECT trip_id FROM (SELECT trip_id, names FROM trip_search "
+                "WHERE :query <% names LIMIT :window) AS matched "
+                "ORDER BY word_similarity(:query, names) DESC, trip_id "
+                "LIMIT :limit"
+            ).columns(trip_id=GUID),
+            {
+                "query": " ".join(terms),
+                "window": SEARCH_RANK_WINDOW,
+                "limit": limit + len(exact),
+            },
+        ).all()
+        return merge(exact, fuzzy, limit)
+
+    def optimize(self, db: Session):
+        db.execute(text("ANALYZE trip_search"))
+
+
+BACKENDS = {
+    "sqlite": SQLiteSearchIndex(),
+    "postgresql": PostgresSearchIndex(),
+}
+
+
+def search_index(bind: Engine | Connection):
+    name = bind.dialect.name
+    if name not in BACKENDS:
+        raise RuntimeError(f"No trip search backend for '{name}'")
+    return BACKENDS[name]
+
+# =====================================================
+# INDEXING
+# =====================================================
+
+def sync_trips(db: Session, trip_ids: Sequence[uuid.UUID]):
+    """
+    Bring the index entries of `trip_ids` in line with the trips table:
+    published, active trips are (re)indexed, anything else is removed.
+    Flush pending trip changes first; the caller commits.
+    """
+    if not trip_ids:
+        return
+
+    docs = searchable(db.execute(
+        documents_query().where(Trip.id.in_(trip_ids))
+    ))
+    search_index(db.get_bind()).write(db, trip_ids, docs)
+
+
+def create_search_index(bind: Engine = engine) -> bool:
+    """Create the index tables if missing; True when they were just created."""
+    index = search_index(bind)
+    with bind.begin() as conn:
+        if index.exists(conn):
+            return False
+        index.create(conn)
+    return True
+
+
+def rebuild_search_index(batch_size: int = SEARCH_REBUILD_BATCH_SIZE) -> int:
+    """
+    Drop and repopulate the index from the trips table, `batch_size` trips
+    per transaction in id order. Searches return partial results until it
+    finishes. Returns the number of trips indexed.
+    """
+    index = search_index(engine)
+    with engine.begin() as conn:
+        index.drop(conn)
+        index.create(conn)
+
+    indexed = 0
+    last_id = uuid.UUID(int=0)
+    while True:
+        with SessionLocal() as db:
+            rows = db.execute(
+                documents_query()
+                .where(Trip.id > last_id)
+                .order_by(Trip.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                index.optimize(db)
+                db.commit()
+                return indexed
+
+            docs = searchable(rows)
+            if docs:
+                index.write(db, [doc.trip_id for doc in docs], docs)
+                db.commit()
+
+        indexed += len(docs)
+        last_id = rows[-1].trip_id
+
+# =====================================================
+# QUERYING
+# =====================================================
+
+def search_trips(
+    db: Session,
+    query: str,
+    limit: int,
+    offset: int = 0,
+) -> list[tuple[uuid.UUID, bool]]:
+    """
+    (trip_id, fuzzy) pairs ranked by relevance: every exact / prefix match
+    first, then matches that needed a corrected word.
+    """
+    terms = query_terms(query)
+    if not terms:
+        return []
+
+    hits = search_index(db.get_bind()).search(db, terms, offset + limit)
+    return hits[offset:]
+
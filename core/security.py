@@ -8,6 +8,7 @@ from core.config import (
     ALGORITHM,
     ACCESS_TOKEN_EXPIRE_MINUTES,
 )
+from core.ids import uuid7
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
@@ -37,6 +38,8 @@ def create_access_token(
         "sub": subject,
         "role": role,
         "exp": expire,
+        # Token id, so one token can be revoked (POST /auth/logout).
+        "jti": str(uuid7()),
     }
 
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
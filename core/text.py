@@ -0,0 +1,18 @@
+# app/core/text.py
+"""
+Text folding shared by search, the location registry and the locations
+table's unique key, so all three agree on which names are the same.
+"""
+
+import unicodedata
+
+
+def normalize(value: str) -> str:
+    """Lower-case `value` and strip accents (Kullū -> kullu)."""
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def location_key(name: str) -> str:
+    """Comparison key: case, accents and spacing ignored (Manāli == manali)."""
+    return " ".join(normalize(name).split())
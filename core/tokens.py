@@ -0,0 +1,174 @@
+# app/core/tokens.py
+"""
+Bearer token verification with a cache of verified claims, and revocation.
+
+A client sends the same token on every request until it expires, so the
+verified claims are cached per worker under a digest of the token, each
+entry expiring at the token's own `exp`. A hit skips the signature check.
+
+Revocation (POST /auth/logout) is by `jti`: a row in revoked_tokens,
+stamped with its revoked_at. Each worker checks an in-memory set of live
+revoked ids on every request, cache hit or not. A logout adds its own
+jti to this worker's set; logouts on other workers are picked up every
+TOKEN_REVOCATION_REFRESH_SECONDS by reading only the rows revoked since
+the last sync.
+"""
+
+import hashlib
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+from jose import JWTError, jwt
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.cache import TTLCache
+from core.config import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    ALGORITHM,
+    SECRET_KEY,
+    TOKEN_CACHE_SIZE,
+)
+from core.database import SessionLocal, dialect_insert
+from models.revoked_token import RevokedToken
+
+# Each sync reads back this far before the newest revoked_at it has
+# seen, so a logout that committed late, or was stamped by a worker whose
+# clock runs behind, is not missed. Reading a jti again is harmless.
+SYNC_OVERLAP = timedelta(seconds=60)
+
+# Keyed by token digest; every entry is set with its token's remaining
+# lifetime, the default ttl is only a ceiling.
+token_cache = TTLCache(
+    maxsize=TOKEN_CACHE_SIZE,
+    ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
+def token_digest(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def decode_token(token: str) -> dict:
+    """Verified claims with `sub` as a UUID. Raises 401 on a bad token."""
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload["sub"] = uuid.UUID(payload.get("sub"))
+        if "jti" in payload:
+            payload["jti"] = uuid.UUID(payload["jti"])
+    except (JWTError, TypeError, ValueError, AttributeError):
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return payload
+
+
+def verify_token(token: str) -> dict:
+    """
+    Claims of `token`, from the cache when it was verified before. The
+    returned dict is shared with other requests; do not modify it.
+    """
+    key = token_digest(token)
+    payload = token_cache.get(key)
+    if payload is None:
+        payload = decode_token(token)
+        remaining = payload["exp"] - time.time()
+        if remaining > 0:
+            token_cache.set(key, payload, remaining)
+
+    if revocations.is_revoked(payload.get("jti")):
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+    return payload
+
+
+class RevocationList:
+    """
+    Live revoked jtis, each with its token's expiry. Readers check the
+    dict without locking; only syncs and local revocations write to it,
+    under the lock.
+    """
+
+    def __init__(self):
+        self._revoked: dict[uuid.UUID, datetime] = {}
+        self._synced_through: datetime | None = None
+        self._sync_lock = threading.Lock()
+
+    def is_revoked(self, jti: uuid.UUID | None) -> bool:
+        return jti is not None and jti in self._revoked
+
+    def sync(self, db: Session) -> int:
+        """
+        Add the committed revocations read via `db` since the last sync
+        (all live ones the first time) and drop the expired ones.
+        Returns the number of jtis new to this worker.
+        """
+        with self._sync_lock:
+            now = datetime.utcnow()
+            query = select(
+                RevokedToken.jti,
+                RevokedToken.expires_at,
+                RevokedToken.revoked_at,
+            ).where(RevokedToken.expires_at > now)
+            if self._synced_through is not None:
+                query = query.where(
+                    RevokedToken.revoked_at
+                    > self._synced_through - SYNC_OVERLAP
+                )
+            rows = db.execute(query).all()
+
+            added = 0
+            for row in rows:
+                if row.jti not in self._revoked:
+                    self._revoked[row.jti] = row.expires_at
+                    added += 1
+            self._synced_through = max(
+                (row.revoked_at for row in rows),
+                default=self._synced_through or now,
+            )
+
+            expired = [
+                jti for jti, expires_at in self._revoked.items()
+                if expires_at <= now
+            ]
+            for jti in expired:
+                del self._revoked[jti]
+            return added
+
+    def refresh(self) -> int:
+        """Pick up logouts made on other workers since the last sync."""
+        with SessionLocal() as db:
+            return self.sync(db)
+
+    def revoke(self, db: Session, payload: dict):
+        """
+        Record `payload`'s token as revoked in the caller's transaction.
+        Call `add` after the commit so this worker sees it at once.
+        """
+        insert = dialect_insert(db)
+        db.execute(
+            insert(RevokedToken)
+            .values(
+                jti=payload["jti"],
+                expires_at=datetime.utcfromtimestamp(payload["exp"]),
+                revoked_at=datetime.utcnow(),
+            )
+            # Same token logged out twice, on two workers.
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        )
+
+    def add(self, payload: dict):
+        """Revoke `payload`'s token on this worker, without a query."""
+        with self._sync_lock:
+            self._revoked[payload["jti"]] = datetime.utcfromtimestamp(
+                payload["exp"]
+            )
+
+    def stats(self) -> dict:
+        return {
+            "synced_through": self._synced_through,
+            "revoked": len(self._revoked),
+        }
+
+
+revocations = RevocationList()
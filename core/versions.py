@@ -0,0 +1,32 @@
+# app/core/versions.py
+"""
+DataVersion counters: a per-dataset change number, bumped in the same
+transaction as the change, that workers poll to know when an in-process
+copy (core.locations) has gone stale.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.database import dialect_insert
+from models.data_version import DataVersion
+
+
+def bump_version(db: Session, name: str):
+    """Increment `name`'s version in the caller's transaction."""
+    insert = dialect_insert(db)
+    db.execute(
+        insert(DataVersion)
+        .values(name=name, version=1)
+        .on_conflict_do_update(
+            index_elements=[DataVersion.name],
+            set_={"version": DataVersion.version + 1},
+        )
+    )
+
+
+def current_version(db: Session, name: str) -> int:
+    version = db.scalar(
+        select(DataVersion.version).where(DataVersion.name == name)
+    )
+    return version or 0
@@ -1,22 +1,117 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from routers import auth, admin, agent, user
-from core.database import SessionLocal, engine,Base
-from core.init_admin import create_default_admin
+from core.config import (
+    AD_STATS_FLUSH_SECONDS,
+    DB_ASYNC,
+    OTP_PURGE_INTERVAL_SECONDS,
+    BOOKING_EXPIRY_INTERVAL_SECONDS,
+    LOCATION_REFRESH_SECONDS,
+    MEDIA_RENDER_SECONDS,
+    OUTBOX_POLL_SECONDS,
+    REVOKED_TOKEN_PURGE_INTERVAL_SECONDS,
+    TOKEN_REVOCATION_REFRESH_SECONDS,
+)
+from core.ad_stats import ad_stats
+from core.database import SessionLocal
+from core.hashing import hasher
+from core.jobs import PeriodicJob
+from core.locations import location_registry
+from core.media import media_store
+from core.maintenance import (
+    expire_booking_holds,
+    purge_password_reset_otps,
+    purge_revoked_tokens,
+)
+from core.outbox import close_transports, dispatch_outbox
+from core.tokens import revocations
+from core.request_metrics import MetricsMiddleware
+from routers import metrics
+
+# Only the selected stack is imported; the other one never loads.
+if DB_ASYNC:
+    from routers.aio import auth, admin, agent, user, public
+else:
+    from routers import auth, admin, agent, user, public
+
+# Schema and the default admin are deploy steps, not startup work:
+#     python cli.py migrate && python cli.py seed-admin
+
+jobs = [
+    PeriodicJob(
+        "otp-purge",
+        OTP_PURGE_INTERVAL_SECONDS,
+        purge_password_reset_otps,
+    ),
+    PeriodicJob(
+        "booking-expiry",
+        BOOKING_EXPIRY_INTERVAL_SECONDS,
+        expire_booking_holds,
+    ),
+    PeriodicJob(
+        "location-refresh",
+        LOCATION_REFRESH_SECONDS,
+        location_registry.refresh,
+    ),
+    PeriodicJob(
+        "revocation-refresh",
+        TOKEN_REVOCATION_REFRESH_SECONDS,
+        revocations.refresh,
+    ),
+    PeriodicJob(
+        "revoked-token-purge",
+        REVOKED_TOKEN_PURGE_INTERVAL_SECONDS,
+        purge_revoked_tokens,
+    ),
+    PeriodicJob(
+        "outbox-dispatch",
+        OUTBOX_POLL_SECONDS,
+        dispatch_outbox,
+    ),
+]
+
+ad_stats_flush = PeriodicJob(
+    "ad-stats-flush",
+    AD_STATS_FLUSH_SECONDS,
+    ad_stats.flush,
+)
+# Flush early once enough ads have counts pending.
+ad_stats.on_full = ad_stats_flush.wake
+jobs.append(ad_stats_flush)
+
+media_render = PeriodicJob(
+    "media-render",
+    MEDIA_RENDER_SECONDS,
+    media_store.render_pending,
+)
+# Render an upload's variants as soon as it is stored.
+media_store.on_stored = media_render.wake
+jobs.append(media_render)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    with SessionLocal() as db:
+        location_registry.load(db)
+        revocations.sync(db)
+    for job in jobs:
+        job.start()
 
-app = FastAPI(title="Anand Devocation")
+    yield
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+    for job in jobs:
+        await job.stop()
+    close_transports()
+    # Ad counts not yet flushed.
+    ad_stats.close()
+    hasher.shutdown()
+    media_store.shutdown()
 
-@app.on_event("startup")
-def startup_event():
-    db = SessionLocal()
-    try:
-        create_default_admin(db)
-    finally:
-        db.close()
+app = FastAPI(title="Anand Devocation", lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth.router)
 app.include_router(admin.router)
 app.include_router(agent.router)
 app.include_router(user.router)
+app.include_router(public.router)
+app.include_router(metrics.router)
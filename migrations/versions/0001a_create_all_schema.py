@@ -0,0 +1,185 @@
+"""create_all schema
+
+Everything added to the models while main.py still ran create_all at
+startup: users.phone, trips.seats_reserved, password_reset_otps.attempts,
+the catalog and OTP indexes, case-insensitive location names, and the
+bookings, trip_agents and data_versions tables.
+
+create_all only ever created missing tables (with their indexes); it
+never added a column or index to a table that already existed. So a
+database adopted by `cli.py migrate` can hold any mix of the above, and
+each step here checks the live schema and adds only what is missing.
+An index whose columns have since changed is rebuilt.
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-18 18:42:06.113502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001a'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Indexes on the original tables: name -> (table, columns).
+INDEXES = {
+    'ix_password_reset_otps_lookup': (
+        'password_reset_otps', ['user_id', 'is_used', 'expires_at'],
+    ),
+    'ix_password_reset_otps_expires_at': (
+        'password_reset_otps', ['expires_at'],
+    ),
+    'ix_trips_start_date_id': ('trips', ['start_date', 'id']),
+    'ix_trips_location_start': ('trips', ['location_id', 'start_date', 'id']),
+    'ix_trips_status_start': ('trips', ['status', 'start_date', 'id']),
+    'ix_trips_active_start': ('trips', ['is_active', 'start_date', 'id']),
+    'ix_trips_active_status_start': (
+        'trips', ['is_active', 'status', 'start_date', 'id'],
+    ),
+}
+
+# Indexes on the new tables; ix_bookings_trip_status gained `seats`.
+TABLE_INDEXES = {
+    'bookings': {
+        'ix_bookings_booked_by_created': ['booked_by_id', 'created_at', 'id'],
+        'ix_bookings_status_hold': ['status', 'hold_expires_at'],
+        'ix_bookings_trip_status': ['trip_id', 'status', 'seats'],
+        'ix_bookings_user_created': ['user_id', 'created_at', 'id'],
+    },
+    'trip_agents': {
+        'ix_trip_agents_agent_start': [
+            'agent_id', 'trip_start_date', 'trip_id',
+        ],
+        'ix_trip_agents_trip': ['trip_id', 'agent_id'],
+    },
+}
+
+
+def _new_columns():
+    """New columns on the original tables."""
+    return {
+        'users': [sa.Column('phone', sa.String(length=20), nullable=True)],
+        'trips': [
+            sa.Column(
+                'seats_reserved', sa.Integer(), server_default='0',
+                nullable=False,
+            ),
+        ],
+        'password_reset_otps': [
+            sa.Column(
+                'attempts', sa.Integer(), server_default='0', nullable=False
+            ),
+        ],
+    }
+
+
+def _new_tables():
+    return {
+        'data_versions': lambda: op.create_table('data_versions',
+            sa.Column('name', sa.String(length=50), nullable=False),
+            sa.Column('version', sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint('name')
+        ),
+        'bookings': lambda: op.create_table('bookings',
+            sa.Column('id', sa.Uuid(), nullable=False),
+            sa.Column('trip_id', sa.String(), nullable=False),
+            sa.Column('user_id', sa.Uuid(), nullable=False),
+            sa.Column('booked_by_id', sa.Uuid(), nullable=True),
+            sa.Column('seats', sa.Integer(), nullable=False),
+            sa.Column('status', sa.Enum('HELD', 'CONFIRMED', 'CANCELLED', 'EXPIRED', name='bookingstatus'), nullable=False),
+            sa.Column('hold_expires_at', sa.DateTime(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(['booked_by_id'], ['users.id'], ),
+            sa.ForeignKeyConstraint(['trip_id'], ['trips.id'], ),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        ),
+        'trip_agents': lambda: op.create_table('trip_agents',
+            sa.Column('agent_id', sa.Uuid(), nullable=False),
+            sa.Column('trip_id', sa.String(), nullable=False),
+            sa.Column('trip_start_date', sa.Date(), nullable=False),
+            sa.Column('assigned_at', sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(['agent_id'], ['users.id'], ),
+            sa.ForeignKeyConstraint(['trip_id'], ['trips.id'], ),
+            sa.PrimaryKeyConstraint('agent_id', 'trip_id')
+        ),
+    }
+
+
+def _ensure_index(bind, name: str, table: str, columns: list[str]):
+    existing = {
+        index['name']: index['column_names']
+        for index in sa.inspect(bind).get_indexes(table)
+    }
+    if existing.get(name) == columns:
+        return
+    if name in existing:
+        op.drop_index(name, table_name=table)
+    op.create_index(name, table, columns, unique=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    added = set()
+    for table, columns in _new_columns().items():
+        existing = {column['name'] for column in inspector.get_columns(table)}
+        for column in columns:
+            if column.name not in existing:
+                op.add_column(table, column)
+                added.add((table, column.name))
+
+    for name, (table, columns) in INDEXES.items():
+        _ensure_index(bind, name, table, columns)
+
+    # Expression indexes are not reflected on SQLite.
+    op.create_index(
+        'uq_locations_name_lower', 'locations', [sa.text('lower(name)')],
+        unique=True, if_not_exists=True,
+    )
+
+    for table, create in _new_tables().items():
+        if table not in tables:
+            create()
+    for table, indexes in TABLE_INDEXES.items():
+        for name, columns in indexes.items():
+            _ensure_index(bind, name, table, columns)
+
+    # A create_all database may have taken bookings before trips had the
+    # counter; held and confirmed seats are what it counts.
+    if 'bookings' in tables and ('trips', 'seats_reserved') in added:
+        op.execute(
+            "UPDATE trips SET seats_reserved = ("
+            "SELECT coalesce(sum(seats), 0) FROM bookings"
+            " WHERE bookings.trip_id = trips.id"
+            " AND bookings.status IN ('HELD', 'CONFIRMED'))"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, indexes in TABLE_INDEXES.items():
+        for name in indexes:
+            op.drop_index(name, table_name=table)
+    for table in reversed(list(_new_tables())):
+        op.drop_table(table)
+    sa.Enum(name='bookingstatus').drop(op.get_bind(), checkfirst=True)
+
+    op.drop_index('uq_locations_name_lower', table_name='locations')
+    for name, (table, _) in INDEXES.items():
+        op.drop_index(name, table_name=table)
+    for table, columns in _new_columns().items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.drop_column(column.name)
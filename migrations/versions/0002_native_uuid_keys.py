@@ -0,0 +1,210 @@
+"""native uuid keys
+
+Every primary and foreign key becomes core.ids.GUID: native uuid on
+PostgreSQL, a 16-byte BLOB on SQLite.
+
+On PostgreSQL users, locations and bookings already used uuid; the
+trips, advertisements and password_reset_otps ids, and every trip_id
+foreign key, were VARCHAR and are cast in place. On SQLite everything
+was text (CHAR(32) hex or 36-char VARCHAR). Values are rewritten to
+their 16 bytes first, then each table is rebuilt with BLOB columns.
+
+Existing ids keep their value; only new rows get time-ordered UUIDv7s.
+Finally the trip search tables are created if this database has none
+(`cli.py migrate` then fills them).
+
+Revision ID: 0002
+Revises: 0001a
+Create Date: 2026-10-18 16:05:12.481937
+
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from core.ids import GUID
+from core.search import search_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Key columns per table, and which of them used to be VARCHAR holding the
+# 36-char form (the rest were sa.Uuid).
+KEYS = {
+    'users': ['id'],
+    'locations': ['id'],
+    'password_reset_otps': ['id', 'user_id'],
+    'trips': ['id', 'location_id'],
+    'advertisements': ['id', 'trip_id'],
+    'bookings': ['id', 'trip_id', 'user_id', 'booked_by_id'],
+    'trip_agents': ['agent_id', 'trip_id'],
+}
+VARCHAR_KEYS = {
+    'password_reset_otps': ['id'],
+    'trips': ['id'],
+    'advertisements': ['id', 'trip_id'],
+    'bookings': ['trip_id'],
+    'trip_agents': ['trip_id'],
+}
+NULLABLE = {('bookings', 'booked_by_id')}
+
+# PostgreSQL: foreign keys onto trips.id, dropped while its type changes.
+TRIP_FOREIGN_KEYS = {
+    'advertisements': 'advertisements_trip_id_fkey',
+    'bookings': 'bookings_trip_id_fkey',
+    'trip_agents': 'trip_agents_trip_id_fkey',
+}
+
+
+def _old_type(table: str, column: str):
+    return sa.String() if column in VARCHAR_KEYS.get(table, []) else sa.Uuid()
+
+
+def _to_bytes(value):
+    return uuid.UUID(value).bytes if isinstance(value, str) else value
+
+
+def _to_text(dashed: bool):
+    def convert(value):
+        if not isinstance(value, bytes):
+            return value
+        value = uuid.UUID(bytes=value)
+        return str(value) if dashed else value.hex
+    return convert
+
+
+def _sqlite_rewrite(bind, table: str, columns: list[str], function: str):
+    assignments = ', '.join(
+        f'{column} = {function}({column})' for column in columns
+    )
+    bind.exec_driver_sql(f'UPDATE {table} SET {assignments}')
+
+
+def _has_table(bind, table: str) -> bool:
+    return sa.inspect(bind).has_table(table)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        _upgrade_sqlite(bind)
+    else:
+        _upgrade_postgresql(bind)
+    search_index(bind).create(bind)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        _downgrade_sqlite(bind)
+    else:
+        _downgrade_postgresql(bind)
+
+
+def _upgrade_sqlite(bind):
+    sqlite = bind.connection.driver_connection
+    sqlite.create_function('uuid_bytes', 1, _to_bytes, deterministic=True)
+
+    # Batch mode rebuilds each table and cannot carry an expression index.
+    op.drop_index('uq_locations_name_lower', table_name='locations')
+
+    for table, columns in KEYS.items():
+        _sqlite_rewrite(bind, table, columns, 'uuid_bytes')
+        with op.batch_alter_table(table, recreate='always') as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=_old_type(table, column),
+                    type_=GUID(),
+                    existing_nullable=(table, column) in NULLABLE,
+                )
+
+    op.create_index(
+        'uq_locations_name_lower', 'locations', [sa.text('lower(name)')],
+        unique=True,
+    )
+
+    # The search map is rebuilt-on-demand state; values are enough.
+    if _has_table(bind, 'trip_search_docs'):
+        _sqlite_rewrite(bind, 'trip_search_docs', ['trip_id'], 'uuid_bytes')
+
+
+def _downgrade_sqlite(bind):
+    sqlite = bind.connection.driver_connection
+    sqlite.create_function('uuid_dashed', 1, _to_text(True), deterministic=True)
+    sqlite.create_function('uuid_hex', 1, _to_text(False), deterministic=True)
+
+    op.drop_index('uq_locations_name_lower', table_name='locations')
+
+    for table, columns in KEYS.items():
+        # Text first: the rebuild CASTs, which would mangle raw bytes.
+        dashed = VARCHAR_KEYS.get(table, [])
+        if dashed:
+            _sqlite_rewrite(bind, table, dashed, 'uuid_dashed')
+        hexed = [column for column in columns if column not in dashed]
+        if hexed:
+            _sqlite_rewrite(bind, table, hexed, 'uuid_hex')
+
+        with op.batch_alter_table(table, recreate='always') as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=GUID(),
+                    type_=_old_type(table, column),
+                    existing_nullable=(table, column) in NULLABLE,
+                )
+
+    op.create_index(
+        'uq_locations_name_lower', 'locations', [sa.text('lower(name)')],
+        unique=True,
+    )
+
+    if _has_table(bind, 'trip_search_docs'):
+        _sqlite_rewrite(bind, 'trip_search_docs', ['trip_id'], 'uuid_dashed')
+
+
+def _alter_trip_keys(bind, type_, cast: str):
+    search = _has_table(bind, 'trip_search')
+    for table, name in TRIP_FOREIGN_KEYS.items():
+        op.drop_constraint(name, table, type_='foreignkey')
+    if search:
+        op.drop_constraint(
+            'trip_search_trip_id_fkey', 'trip_search', type_='foreignkey'
+        )
+
+    for table, columns in VARCHAR_KEYS.items():
+        for column in columns:
+            op.alter_column(
+                table, column, type_=type_,
+                postgresql_using=f'{column}::{cast}',
+            )
+    if search:
+        op.alter_column(
+            'trip_search', 'trip_id', type_=type_,
+            postgresql_using=f'trip_id::{cast}',
+        )
+
+    for table, name in TRIP_FOREIGN_KEYS.items():
+        op.create_foreign_key(name, table, 'trips', ['trip_id'], ['id'])
+    if search:
+        op.create_foreign_key(
+            'trip_search_trip_id_fkey', 'trip_search', 'trips',
+            ['trip_id'], ['id'], ondelete='CASCADE',
+        )
+
+
+def _upgrade_postgresql(bind):
+    _alter_trip_keys(bind, sa.Uuid(), 'uuid')
+
+
+def _downgrade_postgresql(bind):
+    _alter_trip_keys(bind, sa.String(), 'text')
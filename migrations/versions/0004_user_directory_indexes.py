@@ -0,0 +1,52 @@
+"""user directory indexes
+
+Indexes behind the admin user directory (GET /admin/users): the folded
+name after each combination of role / is_active equality, and the folded
+email alone and after role (and is_active): admins and agents are too
+rare to find by filtering an email prefix range. core.database.folded
+renders lower(x), with COLLATE "C" on PostgreSQL.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 15:31:08.220417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from core.database import folded
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NAME = folded(sa.column('name'))
+EMAIL = folded(sa.column('email'))
+
+INDEXES = {
+    'ix_users_name_folded': [NAME, 'id'],
+    'ix_users_role_name_folded': ['role', NAME, 'id'],
+    'ix_users_active_name_folded': ['is_active', NAME, 'id'],
+    'ix_users_role_active_name_folded': ['role', 'is_active', NAME, 'id'],
+    'ix_users_email_folded': [EMAIL, 'id'],
+    'ix_users_role_email_folded': ['role', EMAIL, 'id'],
+    'ix_users_role_active_email_folded': ['role', 'is_active', EMAIL, 'id'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, columns in INDEXES.items():
+        op.create_index(name, 'users', columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in INDEXES:
+        op.drop_index(name, table_name='users')
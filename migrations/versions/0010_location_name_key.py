@@ -0,0 +1,88 @@
+"""location name key
+
+locations.name_key: the name with case, accents and spacing folded
+(core.text.location_key), under the unique index that used to be on
+lower(name). The database now rejects the same duplicates as the
+in-memory check in core/locations.py, so "Manāli" and "manali" racing
+in two workers no longer both get in.
+
+Names that already collide this way stop the upgrade; rename or merge
+them first.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 21:05:42.318730
+
+"""
+from collections import defaultdict
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from core.text import location_key
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, Sequence[str], None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+locations = sa.table(
+    'locations', sa.column('id'), sa.column('name'), sa.column('name_key')
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Batch mode rebuilds the table and cannot carry an expression index.
+    op.drop_index('uq_locations_name_lower', table_name='locations')
+
+    with op.batch_alter_table('locations', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('name_key', sa.String(length=100), nullable=True))
+
+    bind = op.get_bind()
+    by_key = defaultdict(list)
+    for location_id, name in bind.execute(
+        sa.select(locations.c.id, locations.c.name)
+    ):
+        by_key[location_key(name)].append((location_id, name))
+
+    clashes = [
+        sorted(name for _, name in rows)
+        for rows in by_key.values() if len(rows) > 1
+    ]
+    if clashes:
+        raise RuntimeError(
+            "Locations differing only in case, accents or spacing: "
+            + "; ".join(" / ".join(names) for names in clashes)
+            + ". Rename or merge them, then migrate again."
+        )
+
+    for key, rows in by_key.items():
+        ((location_id, _),) = rows
+        bind.execute(
+            locations.update()
+            .where(locations.c.id == location_id)
+            .values(name_key=key)
+        )
+
+    with op.batch_alter_table('locations', schema=None) as batch_op:
+        batch_op.alter_column(
+            'name_key', existing_type=sa.String(length=100), nullable=False
+        )
+        batch_op.create_index('uq_locations_name_key', ['name_key'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('locations', schema=None) as batch_op:
+        batch_op.drop_index('uq_locations_name_key')
+        batch_op.drop_column('name_key')
+
+    op.create_index(
+        'uq_locations_name_lower', 'locations', [sa.text('lower(name)')],
+        unique=True,
+    )
@@ -0,0 +1,16 @@
+# Import every model so relationship() string targets resolve and
+# Base.metadata is complete whichever model module is imported first.
+from models import (  # noqa: F401
+    ad_stat,
+    advertisement,
+    booking,
+    data_version,
+    location,
+    media_asset,
+    outbox,
+    password_reset,
+    revoked_token,
+    trip,
+    trip_agent,
+    user,
+)
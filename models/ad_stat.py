@@ -0,0 +1,36 @@
+# app/models/ad_stat.py
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class AdStat(Base):
+    """
+    Impression / click totals per advertisement, written behind by
+    core.ad_stats (one upsert of summed deltas per flush, never a write
+    per event).
+    """
+
+    __tablename__ = "ad_stats"
+    __table_args__ = (
+        # per-trip totals: one index range per trip, no table lookups
+        Index("ix_ad_stats_trip", "trip_id", "impressions", "clicks"),
+    )
+
+    ad_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("advertisements.id"), primary_key=True
+    )
+    # Copied from the ad (which never changes trip) for per-trip totals.
+    trip_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("trips.id"), nullable=False
+    )
+
+    impressions: Mapped[int] = mapped_column(
+        BigInteger, default=0, nullable=False
+    )
+    clicks: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -1,19 +1,25 @@
 from sqlalchemy import String, Boolean, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
 
 from core.database import Base
+from core.ids import uuid7
 
 
 class Advertisement(Base):
     __tablename__ = "advertisements"
 
-    id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid.uuid4())
-    )
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
 
     title: Mapped[str] = mapped_column(String(200))
-    image_url: Mapped[str] = mapped_column(String(500))
-    trip_id: Mapped[str] = mapped_column(ForeignKey("trips.id"))
+    # Uploaded image (core.media). Ads created before uploads existed
+    # have only a remote image_url.
+    asset_id: Mapped[str | None] = mapped_column(
+        ForeignKey("media_assets.id"), nullable=True
+    )
+    image_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    trip_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("trips.id"))
 
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+
+    trip: Mapped["Trip"] = relationship(back_populates="advertisements")
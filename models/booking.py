@@ -0,0 +1,58 @@
+# app/models/booking.py
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+from core.ids import uuid7
+
+
+class BookingStatus(str, enum.Enum):
+    HELD = "HELD"              # seats reserved, awaiting payment
+    CONFIRMED = "CONFIRMED"
+    CANCELLED = "CANCELLED"
+    EXPIRED = "EXPIRED"        # hold lapsed, seats released
+
+
+class Booking(Base):
+    __tablename__ = "bookings"
+    __table_args__ = (
+        # expiry job: HELD rows whose hold has lapsed
+        Index("ix_bookings_status_hold", "status", "hold_expires_at"),
+        Index("ix_bookings_user_created", "user_id", "created_at", "id"),
+        Index(
+            "ix_bookings_booked_by_created", "booked_by_id", "created_at", "id"
+        ),
+        # per-trip aggregates, covering so they never touch the table
+        Index("ix_bookings_trip_status", "trip_id", "status", "seats"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+
+    trip_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("trips.id"), nullable=False
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id"), nullable=False
+    )
+    # Agent who made the booking on the user's behalf, if any.
+    booked_by_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("users.id"), nullable=True
+    )
+
+    seats: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[BookingStatus] = mapped_column(
+        Enum(BookingStatus),
+        default=BookingStatus.HELD,
+        nullable=False,
+    )
+
+    hold_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
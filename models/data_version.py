@@ -0,0 +1,18 @@
+# app/models/data_version.py
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class DataVersion(Base):
+    """
+    Change counter per cached dataset, bumped in the same transaction as
+    the change. Workers holding an in-process copy poll it to know when
+    to reload.
+    """
+
+    __tablename__ = "data_versions"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
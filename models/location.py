@@ -1,11 +1,26 @@
 # app/models/location.py
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 from core.database import Base
+from core.ids import uuid7
+from core.text import location_key
 import uuid
 
+
+def _name_key(context) -> str:
+    return location_key(context.get_current_parameters()["name"])
+
+
 class Location(Base):
     __tablename__ = "locations"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(100), unique=True)
+    # location_key(name), filled in on insert (locations are not renamed).
+    name_key: Mapped[str] = mapped_column(String(100), default=_name_key)
+
+
+# Case / accent / spacing-insensitive uniqueness, the same comparison as
+# the in-memory duplicate check in core/locations.py; catches two workers
+# racing on the same name.
+Index("uq_locations_name_key", Location.name_key, unique=True)
@@ -0,0 +1,55 @@
+# app/models/media_asset.py
+import enum
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class MediaStatus(str, enum.Enum):
+    PENDING = "PENDING"        # stored; not rendered yet (or leased)
+    READY = "READY"
+    FAILED = "FAILED"          # not a usable image; see error
+
+
+class MediaAsset(Base):
+    """
+    An uploaded image, keyed by the SHA-256 of its bytes (uploading the
+    same file twice gives the same asset). The original and its variants
+    live under MEDIA_ROOT; see core.media.
+    """
+
+    __tablename__ = "media_assets"
+    __table_args__ = (
+        # render job: PENDING assets, oldest first
+        Index("ix_media_assets_status_created", "status", "created_at"),
+    )
+
+    # hex SHA-256 of the original
+    id: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    content_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Of the original; known once rendered.
+    width: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    height: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    status: Mapped[MediaStatus] = mapped_column(
+        Enum(MediaStatus),
+        default=MediaStatus.PENDING,
+        nullable=False,
+    )
+    error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    # Render claims so far, and while one is running, the time until
+    # which the other workers leave the asset alone.
+    attempts: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    leased_until: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
@@ -0,0 +1,63 @@
+# app/models/outbox.py
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+from core.ids import uuid7
+
+
+class OutboxChannel(str, enum.Enum):
+    EMAIL = "EMAIL"
+    SMS = "SMS"
+
+
+class OutboxStatus(str, enum.Enum):
+    PENDING = "PENDING"        # due at next_attempt_at (or leased until it)
+    FAILED = "FAILED"          # gave up; body cleared, kept for inspection
+
+
+class OutboxMessage(Base):
+    """
+    An email / SMS written in the transaction that produced it and sent
+    later by core.outbox.dispatch_outbox. Delivered rows are deleted.
+    """
+
+    __tablename__ = "outbox_messages"
+    __table_args__ = (
+        # dispatcher: due PENDING rows, oldest first
+        Index("ix_outbox_messages_status_next", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+
+    channel: Mapped[OutboxChannel] = mapped_column(
+        Enum(OutboxChannel), nullable=False
+    )
+    recipient: Mapped[str] = mapped_column(String(120), nullable=False)
+    subject: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    # May hold a secret (an OTP): cleared when the message fails for good.
+    body: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    status: Mapped[OutboxStatus] = mapped_column(
+        Enum(OutboxStatus),
+        default=OutboxStatus.PENDING,
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Due time; pushed ahead by a lease while a dispatcher is sending, and
+    # by the backoff after a failed attempt.
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    # Not worth delivering after this (an OTP past its own expiry).
+    expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True
+    )
+    last_error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
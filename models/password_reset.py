@@ -1,21 +1,35 @@
 import uuid
 from datetime import datetime, timedelta
 
-from sqlalchemy import String, DateTime, Boolean, ForeignKey
+from sqlalchemy import String, DateTime, Boolean, ForeignKey, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.database import Base
+from core.ids import uuid7
 
 
 class PasswordResetOTP(Base):
     __tablename__ = "password_reset_otps"
-
-    id: Mapped[str] = mapped_column(
-        String, primary_key=True, default=lambda: str(uuid.uuid4())
+    __table_args__ = (
+        # latest unused OTP for a user: equality on (user_id, is_used),
+        # then a backward scan on expires_at
+        Index(
+            "ix_password_reset_otps_lookup",
+            "user_id", "is_used", "expires_at",
+        ),
+        # range scan for the purge job
+        Index("ix_password_reset_otps_expires_at", "expires_at"),
     )
 
-    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"))
     otp_hash: Mapped[str] = mapped_column(String, nullable=False)
 
+    # Set to the consumption time when an OTP is used or superseded, so
+    # "expired or used" is a single indexed range: expires_at < now.
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     is_used: Mapped[bool] = mapped_column(Boolean, default=False)
+
+    # Failed verification attempts; locked at OTP_MAX_ATTEMPTS.
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -0,0 +1,29 @@
+# app/models/revoked_token.py
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class RevokedToken(Base):
+    """Access tokens logged out before their `exp`, by `jti` claim."""
+
+    __tablename__ = "revoked_tokens"
+    __table_args__ = (
+        # load of the live set, and range scan for the purge job
+        Index("ix_revoked_tokens_expires_at", "expires_at"),
+        # incremental sync on each worker
+        Index("ix_revoked_tokens_revoked_at", "revoked_at"),
+    )
+
+    jti: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+
+    # The token's own exp: the row is dead weight after it.
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
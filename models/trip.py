@@ -4,10 +4,11 @@ import enum
 import uuid
 from datetime import date
 
-from sqlalchemy import String, Integer, Enum, Boolean, ForeignKey, Date
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, Enum, Boolean, ForeignKey, Date, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.database import Base
+from core.ids import uuid7
 
 
 class TripStatus(str, enum.Enum):
@@ -19,17 +20,25 @@ class TripStatus(str, enum.Enum):
 
 class Trip(Base):
     __tablename__ = "trips"
-
-    id: Mapped[str] = mapped_column(
-        String,
-        primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+    # Every catalog filter is an equality prefix followed by the
+    # (start_date, id) keyset, so each one can walk an index in order.
+    __table_args__ = (
+        Index("ix_trips_start_date_id", "start_date", "id"),
+        Index("ix_trips_location_start", "location_id", "start_date", "id"),
+        Index("ix_trips_status_start", "status", "start_date", "id"),
+        Index("ix_trips_active_start", "is_active", "start_date", "id"),
+        Index(
+            "ix_trips_active_status_start",
+            "is_active", "status", "start_date", "id",
+        ),
     )
 
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str] = mapped_column(String(1000), nullable=False)
 
-    location_id: Mapped[int] = mapped_column(
+    location_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("locations.id"),
         nullable=False,
     )
@@ -41,6 +50,11 @@ class Trip(Base):
 
     price: Mapped[int] = mapped_column(Integer, nullable=False)
     capacity: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Seats held or confirmed by bookings. Only ever changed by conditional
+    # UPDATEs in core/bookings.py, never read-modify-write.
+    seats_reserved: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
 
     status: Mapped[TripStatus] = mapped_column(
         Enum(TripStatus),
@@ -49,3 +63,8 @@ class Trip(Base):
     )
 
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+
+    location: Mapped["Location"] = relationship()
+    advertisements: Mapped[list["Advertisement"]] = relationship(
+        back_populates="trip"
+    )
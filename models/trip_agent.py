@@ -0,0 +1,37 @@
+# app/models/trip_agent.py
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class TripAgent(Base):
+    """Which agents look after which trips."""
+
+    __tablename__ = "trip_agents"
+    __table_args__ = (
+        # an agent's upcoming trips, read in page order
+        Index(
+            "ix_trip_agents_agent_start",
+            "agent_id", "trip_start_date", "trip_id",
+        ),
+        Index("ix_trip_agents_trip", "trip_id", "agent_id"),
+    )
+
+    agent_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id"), primary_key=True
+    )
+    trip_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("trips.id"), primary_key=True
+    )
+    # Copy of trips.start_date so the "my trips" page is a range scan of
+    # the index above whatever the planner thinks of the trips table. Trip
+    # dates are fixed once created; keep this in step if that changes.
+    trip_start_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    assigned_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
@@ -1,16 +1,40 @@
 # app/models/user.py
-from sqlalchemy import String, Boolean, Enum
+from sqlalchemy import String, Boolean, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column
-from core.database import Base
+from core.database import Base, folded
+from core.ids import uuid7
 from models.enums import UserRole
 import uuid
 
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(100))
     email: Mapped[str] = mapped_column(String(120), unique=True, index=True)
+    phone: Mapped[str | None] = mapped_column(String(20), nullable=True)
     password_hash: Mapped[str]
     role: Mapped[UserRole] = mapped_column(Enum(UserRole))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+
+
+# Admin directory (routers/admin.py:user_directory_query). Pages are
+# ordered by (folded name, id), or (folded email, id) for an email search,
+# so each filter combination is an equality prefix plus a range on one of
+# these indexes, read in order.
+Index("ix_users_name_folded", folded(User.name), User.id)
+Index("ix_users_role_name_folded", User.role, folded(User.name), User.id)
+Index(
+    "ix_users_active_name_folded", User.is_active, folded(User.name), User.id
+)
+Index(
+    "ix_users_role_active_name_folded",
+    User.role, User.is_active, folded(User.name), User.id,
+)
+Index("ix_users_email_folded", folded(User.email), User.id)
+# Rare roles would otherwise filter a whole email prefix range.
+Index("ix_users_role_email_folded", User.role, folded(User.email), User.id)
+Index(
+    "ix_users_role_active_email_folded",
+    User.role, User.is_active, folded(User.email), User.id,
+)
@@ -1,18 +1,94 @@
 # app/routers/admin.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import EmailStr, ValidationError
+from sqlalchemy import (
+    Select,
+    and_,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from datetime import date
-
-from core.database import get_db
-from core.dependencies import require_admin
-from core.security import hash_password
-
+from itertools import islice
+from typing import Any, Iterable, Iterator
+import csv
+import enum
+import io
+import json
+import uuid
+
+from core.ad_stats import ad_stats
+from core.bookings import set_capacity
+from core.config import IMPORT_BATCH_SIZE, IMPORT_MAX_ERRORS, EXPORT_BATCH_SIZE
+from core.database import (
+    SessionLocal,
+    dialect_insert,
+    folded,
+    get_db,
+    serving_engine,
+)
+from core.dependencies import (
+    require_admin,
+    invalidate_principal,
+    principal_cache,
+)
+from core.feed_cache import feed_cache
+from core.hashing import hasher
+from core.ids import uuid7
+from core.locations import LOCATIONS, clean_name, location_registry
+from core.media import CONTENT_TYPES, media_store, register_asset
+from core.pool_metrics import pool_snapshot
+from core.pagination import encode_cursor, decode_cursor
+from core.query_budget import query_budget
+from core.search import sync_trips
+from core.tokens import revocations, token_cache
+from core.versions import bump_version
+
+from models.ad_stat import AdStat
 from models.location import Location
+from models.media_asset import MediaAsset, MediaStatus
 from models.user import User
 from models.enums import UserRole
 from models.trip import Trip, TripStatus
 from models.advertisement import Advertisement
+from models.trip_agent import TripAgent
+
+from schemas.advertisement import (
+    AdStatsRead,
+    AdvertisementRead,
+    TripAdStatsRead,
+)
+from schemas.common import MessageResponse
+from schemas.location import LocationRead
+from schemas.media import MediaAssetRead
+from schemas.trip import (
+    TripAgentAssigned,
+    TripAgentBatch,
+    TripAgentUnassigned,
+    TripFileFormat,
+    TripImportReport,
+    TripImportRow,
+    TripPage,
+    TripRead,
+)
+from schemas.user import AgentCreated, AgentDeactivated, UserPage, UserRead
 
 router = APIRouter(
     prefix="/admin",
@@ -24,12 +100,18 @@ router = APIRouter(
 # LOCATION MANAGEMENT
 # =====================================================
 
-@router.post("/locations")
+@router.post("/locations", response_model=LocationRead)
 def create_location(
     name: str,
     db: Session = Depends(get_db),
 ):
-    if db.query(Location).filter(Location.name == name).first():
+    name = clean_name(name)
+    if not name:
+        raise HTTPException(400, "Location name is required")
+
+    # In-memory, case / accent-insensitive; the unique name_key index
+    # (same comparison) catches a race with another worker.
+    if location_registry.find(name):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Location already exists",
@@ -37,14 +119,24 @@ def create_location(
 
     loc = Location(name=name)
     db.add(loc)
-    db.commit()
+    bump_version(db, LOCATIONS)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Location already exists",
+        )
+
     db.refresh(loc)
+    location_registry.load(db)
     return loc
 
 
-@router.delete("/locations/{location_id}")
+@router.delete("/locations/{location_id}", response_model=MessageResponse)
 def delete_location(
-    location_id: int,
+    location_id: uuid.UUID,
     db: Session = Depends(get_db),
 ):
     loc = db.get(Location, location_id)
@@ -52,17 +144,19 @@ def delete_location(
         raise HTTPException(404, "Location not found")
 
     db.delete(loc)
+    bump_version(db, LOCATIONS)
     db.commit()
+    location_registry.load(db)
     return {"message": "Location deleted"}
 
 # =====================================================
 # AGENT MANAGEMENT
 # =====================================================
 
-@router.post("/agents")
+@router.post("/agents", response_model=AgentCreated)
 def create_agent(
     name: str,
-    email: str,
+    email: EmailStr,
     password: str,
     db: Session = Depends(get_db),
 ):
@@ -75,7 +169,7 @@ def create_agent(
     agent = User(
         name=name,
         email=email,
-        password_hash=hash_password(password),
+        password_hash=hasher.hash_password(password),
         role=UserRole.AGENT,   # 🔒 forced
         is_active=True,
     )
@@ -86,14 +180,14 @@ def create_agent(
 
     return {
         "message": "Agent created successfully",
-        "agent_id": str(agent.id),
+        "agent_id": agent.id,
         "email": agent.email,
     }
 
 
-@router.delete("/agents/{agent_id}")
+@router.delete("/agents/{agent_id}", response_model=AgentDeactivated)
 def deactivate_agent(
-    agent_id: str,
+    agent_id: uuid.UUID,
     db: Session = Depends(get_db),
 ):
     agent = db.get(User, agent_id)
@@ -103,21 +197,112 @@ def deactivate_agent(
 
     agent.is_active = False
     db.commit()
+    invalidate_principal(agent_id)
 
     return {
         "message": "Agent deactivated successfully",
         "agent_id": agent_id,
     }
 
+# =====================================================
+# USER DIRECTORY
+# =====================================================
+
+def prefix_range(key, prefix: str):
+    """`key` starts with `prefix`, as a range the index on `key` can seek."""
+    return and_(
+        key >= folded(literal(prefix)),
+        key < folded(literal(prefix + "\U0010ffff")),
+    )
+
+
+async def user_directory_query(
+    cursor: str | None = None,
+    role: UserRole | None = None,
+    is_active: bool | None = None,
+    name: str | None = Query(None, min_length=1, max_length=100),
+    email: str | None = Query(None, min_length=1, max_length=120),
+) -> Select:
+    """
+    Filtered directory statement selecting (User, sort_key), ordered by
+    the (sort_key, id) keyset. `name` and `email` are case-insensitive
+    prefixes; the sort key is the folded email when searching by email,
+    else the folded name. Shared with the async admin router.
+    """
+
+    sort_key = folded(User.email if email is not None else User.name)
+    query = select(User, sort_key.label("sort_key"))
+
+    if role is not None:
+        query = query.where(User.role == role)
+    if is_active is not None:
+        query = query.where(User.is_active == is_active)
+    if email is not None:
+        query = query.where(prefix_range(sort_key, email))
+    if name is not None:
+        query = query.where(prefix_range(folded(User.name), name))
+
+    if cursor:
+        cursor_key, cursor_id = decode_cursor(cursor, 2)
+        try:
+            cursor_id = uuid.UUID(cursor_id)
+        except (TypeError, ValueError):
+            raise HTTPException(400, "Invalid cursor")
+
+        # Typed bind, as in trip_keyset.
+        query = query.where(
+            tuple_(sort_key, User.id)
+            > tuple_(cursor_key, literal(cursor_id, User.id.type))
+        )
+
+    return query.order_by(sort_key, User.id)
+
+
+def user_page(rows, limit: int) -> dict:
+    """`rows` is fetched with limit + 1 rows to detect a further page."""
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].sort_key, rows[-1].User.id)
+
+    return {"items": [row.User for row in rows], "next_cursor": next_cursor}
+
+
+@router.get("/users", response_model=UserPage)
+@query_budget(1)
+def list_users(
+    limit: int = Query(50, ge=1, le=200),
+    query: Select = Depends(user_directory_query),
+    db: Session = Depends(get_db),
+):
+    """
+    Users, agents and admins by name (by email when searching `email`),
+    filtered by `role` / `is_active`. Pass `next_cursor` as `cursor`.
+    """
+
+    return user_page(db.execute(query.limit(limit + 1)).all(), limit)
+
+
+@router.get("/users/{user_id}", response_model=UserRead)
+@query_budget(1)
+def get_user(
+    user_id: uuid.UUID,
+    db: Session = Depends(get_db),
+):
+    user = db.get(User, user_id)
+    if not user:
+        raise HTTPException(404, "User not found")
+    return user
+
 # =====================================================
 # TRIP MANAGEMENT (ADMIN FULL CRUD)
 # =====================================================
 
-@router.post("/trips")
+@router.post("/trips", response_model=TripRead)
 def create_trip(
     title: str,
     description: str,
-    location_id: int,
+    location_id: uuid.UUID,
     start_date: date,
     end_date: date,
     price: int,
@@ -137,14 +322,16 @@ def create_trip(
     )
 
     db.add(trip)
+    db.flush()
+    sync_trips(db, [trip.id])
     db.commit()
     db.refresh(trip)
     return trip
 
 
-@router.put("/trips/{trip_id}")
+@router.put("/trips/{trip_id}", response_model=TripRead)
 def update_trip(
-    trip_id: str,
+    trip_id: uuid.UUID,
     title: str | None = None,
     description: str | None = None,
     price: int | None = None,
@@ -163,17 +350,21 @@ def update_trip(
     if price is not None:
         trip.price = price
     if capacity is not None:
-        trip.capacity = capacity
+        set_capacity(db, trip, capacity)
     if status is not None:
         trip.status = status
 
+    if title is not None or description is not None or status is not None:
+        db.flush()
+        sync_trips(db, [trip.id])
+
     db.commit()
     return trip
 
 
-@router.delete("/trips/{trip_id}")
+@router.delete("/trips/{trip_id}", response_model=MessageResponse)
 def deactivate_trip(
-    trip_id: str,
+    trip_id: uuid.UUID,
     db: Session = Depends(get_db),
 ):
     trip = db.get(Trip, trip_id)
@@ -181,31 +372,494 @@ def deactivate_trip(
         raise HTTPException(404, "Trip not found")
 
     trip.is_active = False
+    db.flush()
+    sync_trips(db, [trip.id])
     db.commit()
     return {"message": "Trip deactivated"}
 
 
-@router.get("/trips")
-def list_all_trips(db: Session = Depends(get_db)):
-    return db.query(Trip).all()
+async def trip_catalog_query(
+    cursor: str | None = None,
+    location_id: uuid.UUID | None = None,
+    status: TripStatus | None = None,
+    is_active: bool | None = None,
+    min_price: int | None = Query(None, ge=0),
+    max_price: int | None = Query(None, ge=0),
+    start_from: date | None = None,
+    start_to: date | None = None,
+) -> Select:
+    """
+    Filtered catalog statement ordered by the (start_date, id) keyset.
+    Shared with the async admin router; CPU only, so it stays on the loop.
+    """
+
+    query = select(Trip)
+
+    if location_id is not None:
+        query = query.where(Trip.location_id == location_id)
+    if status is not None:
+        query = query.where(Trip.status == status)
+    if is_active is not None:
+        query = query.where(Trip.is_active == is_active)
+    if min_price is not None:
+        query = query.where(Trip.price >= min_price)
+    if max_price is not None:
+        query = query.where(Trip.price <= max_price)
+    if start_from is not None:
+        query = query.where(Trip.start_date >= start_from)
+    if start_to is not None:
+        query = query.where(Trip.start_date <= start_to)
+
+    return trip_keyset(query, cursor)
+
+
+def trip_keyset(
+    query: Select,
+    cursor: str | None,
+    start_date=Trip.start_date,
+    trip_id=Trip.id,
+) -> Select:
+    """
+    Order `query` by (start_date, id) and resume after `cursor`. The
+    columns can be swapped for copies of them on another table.
+    """
+    if cursor:
+        cursor_date, cursor_id = decode_cursor(cursor, 2)
+        try:
+            cursor_date = date.fromisoformat(cursor_date)
+            cursor_id = uuid.UUID(cursor_id)
+        except (TypeError, ValueError):
+            raise HTTPException(400, "Invalid cursor")
+
+        # Row-value comparison so the planner seeks straight into the
+        # (start_date, id) index instead of expanding an OR. The id is
+        # bound with the column's type: a bare UUID in tuple_ gets the
+        # generic Uuid type, which SQLite compares as text against the
+        # BLOB key, so the page after a cursor would repeat it.
+        query = query.where(
+            tuple_(start_date, trip_id)
+            > tuple_(cursor_date, literal(cursor_id, trip_id.type))
+        )
+
+    return query.order_by(start_date, trip_id)
+
+
+def trip_page(trips: list[Trip], limit: int) -> dict:
+    """`trips` is fetched with limit + 1 rows to detect a further page."""
+    next_cursor = None
+    if len(trips) > limit:
+        trips = trips[:limit]
+        next_cursor = encode_cursor(trips[-1].start_date, trips[-1].id)
+
+    return {"items": trips, "next_cursor": next_cursor}
+
+
+@router.get("/trips", response_model=TripPage)
+@query_budget(2)
+def list_all_trips(
+    limit: int = Query(50, ge=1, le=200),
+    query: Select = Depends(trip_catalog_query),
+    db: Session = Depends(get_db),
+):
+    """
+    Keyset-paginated trip catalog ordered by (start_date, id).
+    Pass `next_cursor` from the previous page as `cursor`.
+    """
+
+    trips = db.scalars(query.limit(limit + 1)).all()
+    return trip_page(trips, limit)
+
+# =====================================================
+# BULK TRIP IMPORT / EXPORT
+# =====================================================
+
+EXPORT_COLUMNS = (
+    "id", "title", "description", "location_id", "start_date", "end_date",
+    "price", "capacity", "status", "is_active",
+)
+
+MEDIA_TYPES = {
+    TripFileFormat.CSV: "text/csv",
+    TripFileFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def import_format(
+    file: UploadFile,
+    fmt: TripFileFormat | None,
+) -> TripFileFormat:
+    if fmt is not None:
+        return fmt
+
+    filename = (file.filename or "").lower()
+    if filename.endswith(".csv") or file.content_type == "text/csv":
+        return TripFileFormat.CSV
+    if filename.endswith((".ndjson", ".jsonl")) or (
+        file.content_type in ("application/x-ndjson", "application/jsonl")
+    ):
+        return TripFileFormat.NDJSON
+    raise HTTPException(400, "Unsupported import format, pass format=csv|ndjson")
+
+
+def import_records(
+    binary,
+    fmt: TripFileFormat,
+) -> Iterator[tuple[int, dict | str]]:
+    """
+    (line number, record) pairs read incrementally from the upload. A
+    record is a dict, or a message when the line itself is unreadable.
+    """
+
+    text = io.TextIOWrapper(binary, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == TripFileFormat.CSV:
+            reader = csv.DictReader(text)
+            for record in reader:
+                yield reader.line_num, {
+                    key: value
+                    for key, value in record.items()
+                    if key and value not in ("", None)
+                }
+            return
+
+        for line_no, line in enumerate(text, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                yield line_no, f"Invalid JSON: {exc}"
+                continue
+            if not isinstance(record, dict):
+                yield line_no, "Expected a JSON object"
+                continue
+            yield line_no, record
+    except UnicodeDecodeError:
+        raise HTTPException(400, "Import file must be UTF-8")
+    finally:
+        # Leave the upload's file open for its owner to close.
+        text.detach()
+
+
+def validation_message(error: dict) -> str:
+    field = ".".join(map(str, error["loc"])) or "row"
+    return f"{field}: {error['msg']}"
+
+
+def import_trips(
+    db: Session,
+    records: Iterable[tuple[int, dict | str]],
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> dict:
+    """
+    Validate and insert trips `batch_size` rows at a time: one location
+    lookup (for ids not seen yet), one multi-row INSERT and one commit per
+    batch. Invalid rows are reported and skipped; valid ones still land.
+    """
+
+    report = {"inserted": 0, "failed": 0, "errors": []}
+    known_locations: set[uuid.UUID] = set()
+
+    def fail(line: int, errors: list[str]):
+        report["failed"] += 1
+        if len(report["errors"]) < IMPORT_MAX_ERRORS:
+            report["errors"].append({"line": line, "errors": errors})
+
+    records = iter(records)
+    while batch := list(islice(records, batch_size)):
+        valid = []
+        for line, record in batch:
+            if isinstance(record, str):
+                fail(line, [record])
+                continue
+            try:
+                valid.append((line, TripImportRow.model_validate(record)))
+            except ValidationError as exc:
+                fail(line, [validation_message(error) for error in exc.errors()])
+
+        unseen = {row.location_id for _, row in valid} - known_locations
+        if unseen:
+            known_locations.update(
+                db.scalars(select(Location.id).where(Location.id.in_(unseen)))
+            )
+
+        rows = []
+        for line, row in valid:
+            if row.location_id not in known_locations:
+                fail(line, ["location_id: Location not found"])
+                continue
+            rows.append({
+                **row.model_dump(),
+                "id": uuid7(),
+                "status": TripStatus(row.status.value),
+            })
+
+        if rows:
+            db.execute(insert(Trip), rows)
+            sync_trips(db, [
+                row["id"] for row in rows
+                if row["status"] is TripStatus.PUBLISHED
+            ])
+            db.commit()
+            report["inserted"] += len(rows)
+
+    report["errors"].sort(key=lambda error: error["line"])
+    return report
+
+
+@router.post("/trips/import", response_model=TripImportReport)
+def import_trips_file(
+    file: UploadFile = File(...),
+    fmt: TripFileFormat | None = Query(None, alias="format"),
+    db: Session = Depends(get_db),
+):
+    """
+    Bulk-create trips from a CSV (header row) or NDJSON upload with the
+    TripImportRow fields. The format comes from `format`, else the file
+    name / content type. Batches commit independently; see the report for
+    rejected lines.
+    """
+
+    records = import_records(file.file, import_format(file, fmt))
+    return import_trips(db, records)
+
+
+def export_statement(query: Select) -> Select:
+    """Catalog statement narrowed to plain export columns (no ORM objects)."""
+    return query.with_only_columns(
+        *(Trip.__table__.c[name] for name in EXPORT_COLUMNS)
+    ).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+
+def export_value(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, uuid.UUID)):
+        return str(value)
+    return value
+
+
+def export_header(fmt: TripFileFormat) -> str:
+    if fmt == TripFileFormat.CSV:
+        return ",".join(EXPORT_COLUMNS) + "\r\n"
+    return ""
+
+
+def export_chunk(rows, fmt: TripFileFormat) -> str:
+    """One fetched batch rendered as CSV or NDJSON text."""
+    if fmt == TripFileFormat.NDJSON:
+        return "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, map(export_value, row)))) + "\n"
+            for row in rows
+        )
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        [export_value(value) for value in row] for row in rows
+    )
+    return buffer.getvalue()
+
+
+def stream_export(query: Select, fmt: TripFileFormat) -> Iterator[str]:
+    # Own session: the response body is produced after the request's
+    # dependencies have been torn down.
+    yield export_header(fmt)
+    with SessionLocal() as db:
+        for rows in db.execute(export_statement(query)).partitions():
+            yield export_chunk(rows, fmt)
+
+
+def export_response(body, fmt: TripFileFormat) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="trips.{fmt.value}"'
+        },
+    )
+
+
+@router.get("/trips/export")
+def export_trips(
+    fmt: TripFileFormat = Query(TripFileFormat.NDJSON, alias="format"),
+    query: Select = Depends(trip_catalog_query),
+):
+    """
+    Stream the (filtered) catalog as CSV or NDJSON in (start_date, id)
+    order. Rows are read through a server-side cursor EXPORT_BATCH_SIZE at
+    a time, so memory use does not grow with the catalog. The CSV output
+    can be fed straight back into /trips/import.
+    """
+
+    return export_response(stream_export(query, fmt), fmt)
+
+# =====================================================
+# TRIP ↔ AGENT ASSIGNMENT
+# =====================================================
+
+def assignment_pairs(
+    batch: TripAgentBatch,
+) -> list[tuple[uuid.UUID, uuid.UUID]]:
+    return list(dict.fromkeys(
+        (pair.trip_id, pair.agent_id) for pair in batch.assignments
+    ))
+
+
+def assign_agents(db: Session, batch: TripAgentBatch) -> dict:
+    """
+    Assign agents to trips in one statement. Trips and agents are checked
+    with one IN query each; pairs that already exist are left alone.
+    """
+
+    pairs = assignment_pairs(batch)
+    trip_ids = {trip_id for trip_id, _ in pairs}
+    agent_ids = {agent_id for _, agent_id in pairs}
+
+    start_dates = dict(db.execute(
+        select(Trip.id, Trip.start_date).where(Trip.id.in_(trip_ids))
+    ).all())
+    missing_trips = trip_ids - start_dates.keys()
+    if missing_trips:
+        missing = ", ".join(sorted(map(str, missing_trips)))
+        raise HTTPException(404, f"Trip not found: {missing}")
+
+    missing_agents = agent_ids - set(db.scalars(
+        select(User.id).where(
+            User.id.in_(agent_ids),
+            User.role == UserRole.AGENT,
+            User.is_active == True,
+        )
+    ))
+    if missing_agents:
+        missing = ", ".join(sorted(map(str, missing_agents)))
+        raise HTTPException(404, f"Agent not found: {missing}")
+
+    db.execute(
+        dialect_insert(db)(TripAgent).on_conflict_do_nothing(),
+        [
+            {
+                "trip_id": trip_id,
+                "agent_id": agent_id,
+                "trip_start_date": start_dates[trip_id],
+            }
+            for trip_id, agent_id in pairs
+        ],
+    )
+    db.commit()
+    return {"assigned": len(pairs)}
+
+
+def unassign_agents(db: Session, batch: TripAgentBatch) -> dict:
+    result = db.execute(
+        delete(TripAgent)
+        .where(
+            tuple_(TripAgent.trip_id, TripAgent.agent_id).in_(
+                assignment_pairs(batch)
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return {"unassigned": result.rowcount}
+
+
+@router.post("/trip-agents/assign", response_model=TripAgentAssigned)
+@query_budget(4)
+def assign_trip_agents(
+    batch: TripAgentBatch,
+    db: Session = Depends(get_db),
+):
+    return assign_agents(db, batch)
+
+
+@router.post("/trip-agents/unassign", response_model=TripAgentUnassigned)
+@query_budget(2)
+def unassign_trip_agents(
+    batch: TripAgentBatch,
+    db: Session = Depends(get_db),
+):
+    return unassign_agents(db, batch)
 
 # =====================================================
 # ADVERTISEMENT MANAGEMENT
 # =====================================================
 
-@router.post("/advertisements")
+# The image itself is the request body (no multipart form), so it can be
+# streamed to storage as it arrives.
+MEDIA_UPLOAD_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            content_type: {"schema": {"type": "string", "format": "binary"}}
+            for content_type in CONTENT_TYPES
+        },
+    },
+}
+
+
+def media_asset_or_404(asset: MediaAsset | None) -> MediaAsset:
+    if not asset:
+        raise HTTPException(404, "Media asset not found")
+    return asset
+
+
+def ad_asset_or_error(asset: MediaAsset | None) -> MediaAsset:
+    """An asset an ad may use: PENDING is fine, its variants are on the way."""
+    asset = media_asset_or_404(asset)
+    if asset.status == MediaStatus.FAILED:
+        raise HTTPException(400, f"Media asset is unusable: {asset.error}")
+    return asset
+
+
+def _register_upload(digest: str, content_type: str, size: int) -> MediaAsset:
+    with SessionLocal() as db:
+        return register_asset(db, digest, content_type, size)
+
+
+@router.post(
+    "/media",
+    response_model=MediaAssetRead,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=MEDIA_UPLOAD_BODY,
+)
+@query_budget(2)
+async def upload_media(request: Request):
+    """
+    Upload an ad image as the raw request body (Content-Type image/jpeg,
+    image/png or image/webp; MEDIA_MAX_UPLOAD_BYTES at most). Returns the
+    asset, PENDING until its variants are rendered; pass its id as
+    `asset_id` when creating an advertisement. The same bytes always give
+    the same asset.
+    """
+
+    upload = await media_store.receive(request)
+    asset = await run_in_threadpool(_register_upload, *upload)
+    if asset.status == MediaStatus.PENDING:
+        media_store.stored()
+    return asset
+
+
+@router.get("/media/{asset_id}", response_model=MediaAssetRead)
+@query_budget(1)
+def get_media(asset_id: str, db: Session = Depends(get_db)):
+    return media_asset_or_404(db.get(MediaAsset, asset_id))
+
+
+@router.post("/advertisements", response_model=AdvertisementRead)
+@query_budget(4)
 def create_advertisement(
     title: str,
-    image_url: str,
-    trip_id: str,
+    asset_id: str,
+    trip_id: uuid.UUID,
     db: Session = Depends(get_db),
 ):
     if not db.get(Trip, trip_id):
         raise HTTPException(404, "Trip not found")
+    ad_asset_or_error(db.get(MediaAsset, asset_id))
 
     ad = Advertisement(
         title=title,
-        image_url=image_url,
+        asset_id=asset_id,
         trip_id=trip_id,
         is_active=True,
     )
@@ -216,9 +870,9 @@ def create_advertisement(
     return ad
 
 
-@router.delete("/advertisements/{ad_id}")
+@router.delete("/advertisements/{ad_id}", response_model=MessageResponse)
 def deactivate_advertisement(
-    ad_id: str,
+    ad_id: uuid.UUID,
     db: Session = Depends(get_db),
 ):
     ad = db.get(Advertisement, ad_id)
@@ -230,6 +884,81 @@ def deactivate_advertisement(
     return {"message": "Advertisement deactivated"}
 
 
-@router.get("/advertisements")
+@router.get("/advertisements", response_model=list[AdvertisementRead])
+@query_budget(1)
 def list_advertisements(db: Session = Depends(get_db)):
     return db.query(Advertisement).all()
+
+
+def ad_stats_query(trip_id: uuid.UUID | None = None) -> Select:
+    """Per-ad impression / click totals, optionally for one trip."""
+    query = select(AdStat)
+    if trip_id is not None:
+        query = query.where(AdStat.trip_id == trip_id)
+    return query.order_by(AdStat.impressions.desc(), AdStat.ad_id)
+
+
+def trip_ad_stats_query() -> Select:
+    """Totals per trip, summed from ix_ad_stats_trip alone."""
+    return (
+        select(
+            AdStat.trip_id,
+            func.count().label("ads"),
+            func.sum(AdStat.impressions).label("impressions"),
+            func.sum(AdStat.clicks).label("clicks"),
+        )
+        .group_by(AdStat.trip_id)
+        .order_by(func.sum(AdStat.impressions).desc(), AdStat.trip_id)
+    )
+
+
+@router.get("/advertisements/stats", response_model=list[AdStatsRead])
+@query_budget(1)
+def list_ad_stats(
+    trip_id: uuid.UUID | None = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Impressions and clicks per ad, most seen first. Counts reach the
+    database on each worker's next flush (AD_STATS_FLUSH_SECONDS).
+    """
+
+    return db.scalars(ad_stats_query(trip_id)).all()
+
+
+@router.get(
+    "/advertisements/stats/trips", response_model=list[TripAdStatsRead]
+)
+@query_budget(1)
+def list_trip_ad_stats(db: Session = Depends(get_db)):
+    return db.execute(trip_ad_stats_query()).mappings().all()
+
+# =====================================================
+# METRICS
+# =====================================================
+
+@router.get("/metrics/cache", response_model=dict[str, Any])
+def cache_metrics():
+    return {
+        "principal_cache": principal_cache.stats(),
+        "feed_cache": feed_cache.stats(),
+        "location_registry": location_registry.stats(),
+        "token_cache": token_cache.stats(),
+        "revoked_tokens": revocations.stats(),
+        "ad_stats": ad_stats.stats(),
+    }
+
+
+@router.get("/metrics/media", response_model=dict[str, Any])
+def media_metrics():
+    return media_store.stats()
+
+
+@router.get("/metrics/hashing", response_model=dict[str, Any])
+def hashing_metrics():
+    return hasher.stats()
+
+
+@router.get("/metrics/pool", response_model=dict[str, Any])
+def pool_metrics():
+    return pool_snapshot(serving_engine.pool)
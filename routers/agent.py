@@ -1,12 +1,159 @@
 # app/routers/agent.py
-from fastapi import APIRouter, Depends
-from core.dependencies import require_agent
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+from datetime import datetime
+import uuid
+
+from core.bookings import (
+    booking_page,
+    bookings_query,
+    cancel_booking,
+    confirm_booking,
+    reserve_seats,
+)
+from core.database import get_db
+from core.dependencies import Principal, require_agent
+from core.pagination import encode_cursor
+from core.query_budget import query_budget
+from models.booking import Booking, BookingStatus
+from models.trip import Trip
+from models.trip_agent import TripAgent
+from models.user import User
+from routers.admin import trip_keyset
+from schemas.booking import AgentBookingCreate, BookingPage, BookingRead
+from schemas.trip import AgentTripPage
 
 router = APIRouter(
     prefix="/agent",
     tags=["Agent"],
 )
 
-@router.get("/assigned-trips")
-def get_assigned_trips(agent=Depends(require_agent)):
-    return {"message": "Trips visible to this agent only"}
+# =====================================================
+# ASSIGNED TRIPS
+# =====================================================
+
+def _seats(booking_status: BookingStatus):
+    return (
+        select(func.coalesce(func.sum(Booking.seats), 0))
+        .where(Booking.trip_id == Trip.id, Booking.status == booking_status)
+        .scalar_subquery()
+    )
+
+
+def assigned_trips_query(agent_id: uuid.UUID, cursor: str | None) -> Select:
+    """
+    The agent's upcoming active trips in (start_date, id) order, walked
+    from the agent's slice of ix_trip_agents_agent_start, each with
+    booking aggregates. The aggregates are correlated subqueries answered
+    from the covering (trip_id, status, seats) bookings index, one probe
+    per trip on the page.
+    """
+
+    confirmed_bookings = (
+        select(func.count())
+        .where(
+            Booking.trip_id == Trip.id,
+            Booking.status == BookingStatus.CONFIRMED,
+        )
+        .scalar_subquery()
+    )
+
+    query = (
+        select(
+            Trip,
+            confirmed_bookings.label("confirmed_bookings"),
+            _seats(BookingStatus.CONFIRMED).label("confirmed_seats"),
+            _seats(BookingStatus.HELD).label("held_seats"),
+        )
+        .join(TripAgent, TripAgent.trip_id == Trip.id)
+        .where(
+            TripAgent.agent_id == agent_id,
+            TripAgent.trip_start_date >= datetime.utcnow().date(),
+            Trip.is_active == True,
+        )
+    )
+    return trip_keyset(
+        query, cursor, TripAgent.trip_start_date, TripAgent.trip_id
+    )
+
+
+def assigned_trips_page(rows, limit: int) -> dict:
+    """`rows` is fetched with limit + 1 rows to detect a further page."""
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1].Trip
+        next_cursor = encode_cursor(last.start_date, last.id)
+
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+@router.get("/assigned-trips", response_model=AgentTripPage)
+@query_budget(2)
+def get_assigned_trips(
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    agent: Principal = Depends(require_agent),
+):
+    """Upcoming trips assigned to this agent, with booking counts."""
+    query = assigned_trips_query(agent.id, cursor)
+    rows = db.execute(query.limit(limit + 1)).all()
+    return assigned_trips_page(rows, limit)
+
+# =====================================================
+# BOOKINGS (made on behalf of customers)
+# =====================================================
+
+@router.post(
+    "/bookings",
+    response_model=BookingRead,
+    status_code=status.HTTP_201_CREATED,
+)
+@query_budget(4)
+def book_for_customer(
+    data: AgentBookingCreate,
+    db: Session = Depends(get_db),
+    agent: Principal = Depends(require_agent),
+):
+    customer = db.get(User, data.user_id)
+    if not customer or not customer.is_active:
+        raise HTTPException(404, "User not found")
+
+    return reserve_seats(
+        db, data.trip_id, customer.id, data.seats, booked_by_id=agent.id
+    )
+
+
+@router.get("/bookings", response_model=BookingPage)
+@query_budget(2)
+def list_agent_bookings(
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    agent: Principal = Depends(require_agent),
+):
+    query = bookings_query(cursor, Booking.booked_by_id == agent.id)
+    return booking_page(db.scalars(query.limit(limit + 1)).all(), limit)
+
+
+@router.post("/bookings/{booking_id}/confirm", response_model=BookingRead)
+@query_budget(3)
+def confirm_agent_booking(
+    booking_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    agent: Principal = Depends(require_agent),
+):
+    """Record payment collected by the agent for a booking they made."""
+    return confirm_booking(db, booking_id, Booking.booked_by_id == agent.id)
+
+
+@router.delete("/bookings/{booking_id}", response_model=BookingRead)
+@query_budget(4)
+def cancel_agent_booking(
+    booking_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    agent: Principal = Depends(require_agent),
+):
+    return cancel_booking(db, booking_id, Booking.booked_by_id == agent.id)
@@ -0,0 +1,531 @@
+# app/routers/aio/admin.py
+# Async mirror of routers/admin.py, mounted when DB_ASYNC=true.
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from pydantic import EmailStr
+from sqlalchemy import Select, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+from typing import Any
+import uuid
+
+from core.database import (
+    AsyncSessionLocal,
+    SessionLocal,
+    get_async_db,
+    serving_engine,
+)
+from core.ad_stats import ad_stats
+from core.bookings import set_capacity
+from core.aio_dependencies import require_admin_async
+from core.dependencies import invalidate_principal, principal_cache
+from core.tokens import revocations, token_cache
+from core.versions import bump_version
+from core.feed_cache import feed_cache
+from core.hashing import hasher
+from core.locations import LOCATIONS, clean_name, location_registry
+from core.media import media_store, register_asset
+from core.pool_metrics import pool_snapshot
+from core.query_budget import query_budget
+from core.search import sync_trips
+
+from models.location import Location
+from models.media_asset import MediaAsset, MediaStatus
+from models.user import User
+from models.enums import UserRole
+from models.trip import Trip, TripStatus
+from models.advertisement import Advertisement
+
+from routers.admin import (
+    MEDIA_UPLOAD_BODY,
+    ad_asset_or_error,
+    ad_stats_query,
+    assign_agents,
+    export_chunk,
+    export_header,
+    export_response,
+    export_statement,
+    import_format,
+    import_records,
+    import_trips,
+    media_asset_or_404,
+    trip_ad_stats_query,
+    trip_catalog_query,
+    trip_page,
+    unassign_agents,
+    user_directory_query,
+    user_page,
+)
+from schemas.advertisement import (
+    AdStatsRead,
+    AdvertisementRead,
+    TripAdStatsRead,
+)
+from schemas.common import MessageResponse
+from schemas.location import LocationRead
+from schemas.media import MediaAssetRead
+from schemas.trip import (
+    TripAgentAssigned,
+    TripAgentBatch,
+    TripAgentUnassigned,
+    TripFileFormat,
+    TripImportReport,
+    TripPage,
+    TripRead,
+)
+from schemas.user import AgentCreated, AgentDeactivated, UserPage, UserRead
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin_async)],  # 🔒 ADMIN ONLY
+)
+
+# =====================================================
+# LOCATION MANAGEMENT
+# =====================================================
+
+@router.post("/locations", response_model=LocationRead)
+async def create_location(
+    name: str,
+    db: AsyncSession = Depends(get_async_db),
+):
+    name = clean_name(name)
+    if not name:
+        raise HTTPException(400, "Location name is required")
+
+    # In-memory, case / accent-insensitive; the unique name_key index
+    # (same comparison) catches a race with another worker.
+    if location_registry.find(name):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Location already exists",
+        )
+
+    loc = Location(name=name)
+    db.add(loc)
+    await db.run_sync(bump_version, LOCATIONS)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Location already exists",
+        )
+
+    await db.refresh(loc)
+    await db.run_sync(location_registry.load)
+    return loc
+
+
+@router.delete("/locations/{location_id}", response_model=MessageResponse)
+async def delete_location(
+    location_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+):
+    loc = await db.get(Location, location_id)
+    if not loc:
+        raise HTTPException(404, "Location not found")
+
+    await db.delete(loc)
+    await db.run_sync(bump_version, LOCATIONS)
+    await db.commit()
+    await db.run_sync(location_registry.load)
+    return {"message": "Location deleted"}
+
+# =====================================================
+# AGENT MANAGEMENT
+# =====================================================
+
+@router.post("/agents", response_model=AgentCreated)
+async def create_agent(
+    name: str,
+    email: EmailStr,
+    password: str,
+    db: AsyncSession = Depends(get_async_db),
+):
+    if await db.scalar(select(User).where(User.email == email)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this email already exists",
+        )
+
+    agent = User(
+        name=name,
+        email=email,
+        password_hash=await hasher.ahash_password(password),
+        role=UserRole.AGENT,   # 🔒 forced
+        is_active=True,
+    )
+
+    db.add(agent)
+    await db.commit()
+    await db.refresh(agent)
+
+    return {
+        "message": "Agent created successfully",
+        "agent_id": agent.id,
+        "email": agent.email,
+    }
+
+
+@router.delete("/agents/{agent_id}", response_model=AgentDeactivated)
+async def deactivate_agent(
+    agent_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+):
+    agent = await db.get(User, agent_id)
+
+    if not agent or agent.role != UserRole.AGENT:
+        raise HTTPException(404, "Agent not found")
+
+    agent.is_active = False
+    await db.commit()
+    invalidate_principal(agent_id)
+
+    return {
+        "message": "Agent deactivated successfully",
+        "agent_id": agent_id,
+    }
+
+# =====================================================
+# USER DIRECTORY
+# =====================================================
+
+@router.get("/users", response_model=UserPage)
+@query_budget(1)
+async def list_users(
+    limit: int = Query(50, ge=1, le=200),
+    query: Select = Depends(user_directory_query),
+    db: AsyncSession = Depends(get_async_db),
+):
+    result = await db.execute(query.limit(limit + 1))
+    return user_page(result.all(), limit)
+
+
+@router.get("/users/{user_id}", response_model=UserRead)
+@query_budget(1)
+async def get_user(
+    user_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+):
+    user = await db.get(User, user_id)
+    if not user:
+        raise HTTPException(404, "User not found")
+    return user
+
+# =====================================================
+# TRIP MANAGEMENT (ADMIN FULL CRUD)
+# =====================================================
+
+@router.post("/trips", response_model=TripRead)
+async def create_trip(
+    title: str,
+    description: str,
+    location_id: uuid.UUID,
+    start_date: date,
+    end_date: date,
+    price: int,
+    capacity: int,
+    db: AsyncSession = Depends(get_async_db),
+):
+    trip = Trip(
+        title=title,
+        description=description,
+        location_id=location_id,
+        start_date=start_date,
+        end_date=end_date,
+        price=price,
+        capacity=capacity,
+        status=TripStatus.DRAFT,
+        is_active=True,
+    )
+
+    db.add(trip)
+    await db.flush()
+    await db.run_sync(sync_trips, [trip.id])
+    await db.commit()
+    await db.refresh(trip)
+    return trip
+
+
+@router.put("/trips/{trip_id}", response_model=TripRead)
+async def update_trip(
+    trip_id: uuid.UUID,
+    title: str | None = None,
+    description: str | None = None,
+    price: int | None = None,
+    capacity: int | None = None,
+    status: TripStatus | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    trip = await db.get(Trip, trip_id)
+    if not trip:
+        raise HTTPException(404, "Trip not found")
+
+    if title is not None:
+        trip.title = title
+    if description is not None:
+        trip.description = description
+    if price is not None:
+        trip.price = price
+    if capacity is not None:
+        await db.run_sync(set_capacity, trip, capacity)
+    if status is not None:
+        trip.status = status
+
+    if title is not None or description is not None or status is not None:
+        await db.flush()
+        await db.run_sync(sync_trips, [trip.id])
+
+    await db.commit()
+    return trip
+
+
+@router.delete("/trips/{trip_id}", response_model=MessageResponse)
+async def deactivate_trip(
+    trip_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+):
+    trip = await db.get(Trip, trip_id)
+    if not trip:
+        raise HTTPException(404, "Trip not found")
+
+    trip.is_active = False
+    await db.flush()
+    await db.run_sync(sync_trips, [trip.id])
+    await db.commit()
+    return {"message": "Trip deactivated"}
+
+
+@router.get("/trips", response_model=TripPage)
+@query_budget(2)
+async def list_all_trips(
+    limit: int = Query(50, ge=1, le=200),
+    query: Select = Depends(trip_catalog_query),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Keyset-paginated trip catalog ordered by (start_date, id).
+    Pass `next_cursor` from the previous page as `cursor`.
+    """
+
+    trips = (await db.scalars(query.limit(limit + 1))).all()
+    return trip_page(trips, limit)
+
+# =====================================================
+# BULK TRIP IMPORT / EXPORT
+# =====================================================
+
+def _import_upload(binary, fmt: TripFileFormat) -> dict:
+    # Parsing and validation are CPU-bound and the upload is a blocking
+    # file, so the whole import runs on a worker thread with a sync session.
+    with SessionLocal() as db:
+        return import_trips(db, import_records(binary, fmt))
+
+
+@router.post("/trips/import", response_model=TripImportReport)
+async def import_trips_file(
+    file: UploadFile = File(...),
+    fmt: TripFileFormat | None = Query(None, alias="format"),
+):
+    """
+    Bulk-create trips from a CSV (header row) or NDJSON upload with the
+    TripImportRow fields. The format comes from `format`, else the file
+    name / content type. Batches commit independently; see the report for
+    rejected lines.
+    """
+
+    fmt = import_format(file, fmt)
+    return await run_in_threadpool(_import_upload, file.file, fmt)
+
+
+async def stream_export(query: Select, fmt: TripFileFormat):
+    yield export_header(fmt)
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(export_statement(query))
+        async for rows in result.partitions():
+            yield export_chunk(rows, fmt)
+
+
+@router.get("/trips/export")
+async def export_trips(
+    fmt: TripFileFormat = Query(TripFileFormat.NDJSON, alias="format"),
+    query: Select = Depends(trip_catalog_query),
+):
+    """
+    Stream the (filtered) catalog as CSV or NDJSON in (start_date, id)
+    order. Rows are read through a server-side cursor EXPORT_BATCH_SIZE at
+    a time, so memory use does not grow with the catalog. The CSV output
+    can be fed straight back into /trips/import.
+    """
+
+    return export_response(stream_export(query, fmt), fmt)
+
+# =====================================================
+# TRIP ↔ AGENT ASSIGNMENT
+# =====================================================
+
+@router.post("/trip-agents/assign", response_model=TripAgentAssigned)
+@query_budget(4)
+async def assign_trip_agents(
+    batch: TripAgentBatch,
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await db.run_sync(assign_agents, batch)
+
+
+@router.post("/trip-agents/unassign", response_model=TripAgentUnassigned)
+@query_budget(2)
+async def unassign_trip_agents(
+    batch: TripAgentBatch,
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await db.run_sync(unassign_agents, batch)
+
+# =====================================================
+# ADVERTISEMENT MANAGEMENT
+# =====================================================
+
+@router.post(
+    "/media",
+    response_model=MediaAssetRead,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=MEDIA_UPLOAD_BODY,
+)
+@query_budget(2)
+async def upload_media(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Upload an ad image as the raw request body (Content-Type image/jpeg,
+    image/png or image/webp; MEDIA_MAX_UPLOAD_BYTES at most). Returns the
+    asset, PENDING until its variants are rendered; pass its id as
+    `asset_id` when creating an advertisement. The same bytes always give
+    the same asset.
+    """
+
+    upload = await media_store.receive(request)
+    asset = await db.run_sync(register_asset, *upload)
+    if asset.status == MediaStatus.PENDING:
+        media_store.stored()
+    return asset
+
+
+@router.get("/media/{asset_id}", response_model=MediaAssetRead)
+@query_budget(1)
+async def get_media(
+    asset_id: str,
+    db: AsyncSession = Depends(get_async_db),
+):
+    return media_asset_or_404(await db.get(MediaAsset, asset_id))
+
+
+@router.post("/advertisements", response_model=AdvertisementRead)
+@query_budget(4)
+async def create_advertisement(
+    title: str,
+    asset_id: str,
+    trip_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+):
+    if not await db.get(Trip, trip_id):
+        raise HTTPException(404, "Trip not found")
+    ad_asset_or_error(await db.get(MediaAsset, asset_id))
+
+    ad = Advertisement(
+        title=title,
+        asset_id=asset_id,
+        trip_id=trip_id,
+        is_active=True,
+    )
+
+    db.add(ad)
+    await db.commit()
+    await db.refresh(ad)
+    return ad
+
+
+@router.delete("/advertisements/{ad_id}", response_model=MessageResponse)
+async def deactivate_advertisement(
+    ad_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+):
+    ad = await db.get(Advertisement, ad_id)
+    if not ad:
+        raise HTTPException(404, "Advertisement not found")
+
+    ad.is_active = False
+    await db.commit()
+    return {"message": "Advertisement deactivated"}
+
+
+@router.get("/advertisements", response_model=list[AdvertisementRead])
+@query_budget(1)
+async def list_advertisements(db: AsyncSession = Depends(get_async_db)):
+    return (await db.scalars(select(Advertisement))).all()
+
+
+@router.get("/advertisements/stats", response_model=list[AdStatsRead])
+@query_budget(1)
+async def list_ad_stats(
+    trip_id: uuid.UUID | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Impressions and clicks per ad, most seen first. Counts reach the
+    database on each worker's next flush (AD_STATS_FLUSH_SECONDS).
+    """
+
+    return (await db.scalars(ad_stats_query(trip_id))).all()
+
+
+@router.get(
+    "/advertisements/stats/trips", response_model=list[TripAdStatsRead]
+)
+@query_budget(1)
+async def list_trip_ad_stats(db: AsyncSession = Depends(get_async_db)):
+    return (await db.execute(trip_ad_stats_query())).mappings().all()
+
+# =====================================================
+# METRICS
+# =====================================================
+
+@router.get("/metrics/cache", response_model=dict[str, Any])
+async def cache_metrics():
+    return {
+        "principal_cache": principal_cache.stats(),
+        "feed_cache": feed_cache.stats(),
+        "location_registry": location_registry.stats(),
+        "token_cache": token_cache.stats(),
+        "revoked_tokens": revocations.stats(),
+        "ad_stats": ad_stats.stats(),
+    }
+
+
+@router.get("/metrics/media", response_model=dict[str, Any])
+async def media_metrics():
+    return media_store.stats()
+
+
+@router.get("/metrics/hashing", response_model=dict[str, Any])
+async def hashing_metrics():
+    return hasher.stats()
+
+
+@router.get("/metrics/pool", response_model=dict[str, Any])
+async def pool_metrics():
+    return pool_snapshot(serving_engine.pool)
@@ -0,0 +1,105 @@
+# app/routers/aio/agent.py
+# Async mirror of routers/agent.py, mounted when DB_ASYNC=true.
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+import uuid
+
+from core.bookings import (
+    booking_page,
+    bookings_query,
+    cancel_booking,
+    confirm_booking,
+    reserve_seats,
+)
+from core.database import get_async_db
+from core.aio_dependencies import require_agent_async
+from core.dependencies import Principal
+from core.query_budget import query_budget
+from models.booking import Booking
+from models.user import User
+from routers.agent import assigned_trips_page, assigned_trips_query
+from schemas.booking import AgentBookingCreate, BookingPage, BookingRead
+from schemas.trip import AgentTripPage
+
+router = APIRouter(
+    prefix="/agent",
+    tags=["Agent"],
+)
+
+# =====================================================
+# ASSIGNED TRIPS
+# =====================================================
+
+@router.get("/assigned-trips", response_model=AgentTripPage)
+@query_budget(2)
+async def get_assigned_trips(
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+    agent: Principal = Depends(require_agent_async),
+):
+    """Upcoming trips assigned to this agent, with booking counts."""
+    query = assigned_trips_query(agent.id, cursor)
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    return assigned_trips_page(rows, limit)
+
+# =====================================================
+# BOOKINGS (made on behalf of customers)
+# =====================================================
+
+@router.post(
+    "/bookings",
+    response_model=BookingRead,
+    status_code=status.HTTP_201_CREATED,
+)
+@query_budget(4)
+async def book_for_customer(
+    data: AgentBookingCreate,
+    db: AsyncSession = Depends(get_async_db),
+    agent: Principal = Depends(require_agent_async),
+):
+    customer = await db.get(User, data.user_id)
+    if not customer or not customer.is_active:
+        raise HTTPException(404, "User not found")
+
+    return await db.run_sync(
+        reserve_seats, data.trip_id, customer.id, data.seats, agent.id
+    )
+
+
+@router.get("/bookings", response_model=BookingPage)
+@query_budget(2)
+async def list_agent_bookings(
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+    agent: Principal = Depends(require_agent_async),
+):
+    query = bookings_query(cursor, Booking.booked_by_id == agent.id)
+    bookings = (await db.scalars(query.limit(limit + 1))).all()
+    return booking_page(bookings, limit)
+
+
+@router.post("/bookings/{booking_id}/confirm", response_model=BookingRead)
+@query_budget(3)
+async def confirm_agent_booking(
+    booking_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+    agent: Principal = Depends(require_agent_async),
+):
+    """Record payment collected by the agent for a booking they made."""
+    return await db.run_sync(
+        confirm_booking, booking_id, Booking.booked_by_id == agent.id
+    )
+
+
+@router.delete("/bookings/{booking_id}", response_model=BookingRead)
+@query_budget(4)
+async def cancel_agent_booking(
+    booking_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+    agent: Principal = Depends(require_agent_async),
+):
+    return await db.run_sync(
+        cancel_booking, booking_id, Booking.booked_by_id == agent.id
+    )
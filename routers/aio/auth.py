@@ -0,0 +1,83 @@
+# app/routers/aio/auth.py
+# Async mirror of routers/auth.py, mounted when DB_ASYNC=true.
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database import get_async_db
+from core.dependencies import get_token_payload
+from models.user import User
+from core.security import create_access_token
+from core.hashing import hasher
+from core.query_budget import query_budget
+from core.rate_limit import login_rate_limit
+from core.tokens import revocations
+from schemas.auth import TokenResponse
+from schemas.common import MessageResponse
+
+router = APIRouter(
+    prefix="/auth",
+    tags=["Auth"],
+)
+
+
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    dependencies=[Depends(login_rate_limit)],
+)
+@query_budget(1)
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Email + Password login.
+    OAuth2 expects `username` field (we treat it as email).
+    Works for Admin, Agent, User.
+    """
+
+    user = await db.scalar(
+        select(User).where(User.email == form_data.username)
+    )
+
+    if not user or not await hasher.averify_password(
+        form_data.password,
+        user.password_hash,
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials",
+        )
+
+    access_token = create_access_token(
+        subject=str(user.id),
+        role=user.role,
+    )
+
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+    }
+
+
+@router.post("/logout", response_model=MessageResponse)
+@query_budget(1)
+async def logout(
+    payload: dict = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Revoke the bearer token of this request, on every worker."""
+    if "jti" not in payload:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Token cannot be revoked; it lapses at its expiry",
+        )
+
+    await db.run_sync(revocations.revoke, payload)
+    await db.commit()
+    revocations.add(payload)
+
+    return {"message": "Logged out"}
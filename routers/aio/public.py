@@ -0,0 +1,165 @@
+# app/routers/aio/public.py
+# Async mirror of routers/public.py, mounted when DB_ASYNC=true.
+
+from fastapi import APIRouter, Depends, Path, Query, Request, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+import uuid
+
+from core.ad_stats import ad_stats
+from core.config import SEARCH_MAX_RESULTS
+from core.database import get_async_db
+from core.feed_cache import feed_cache
+from core.locations import location_registry
+from core.media import VARIANT_MEDIA_TYPE, MediaVariant
+from core.query_budget import query_budget
+from core.search import search_trips
+
+from routers.public import (
+    feed_key,
+    feed_query,
+    feed_response,
+    media_response,
+    render_feed,
+    search_page,
+    search_query,
+)
+from schemas.advertisement import AdImpressions
+from schemas.feed import FeedPage
+from schemas.location import LocationRead
+from schemas.search import SearchPage
+
+router = APIRouter(
+    prefix="/public",
+    tags=["Public"],
+)
+
+# =====================================================
+# TRIP FEED
+# =====================================================
+
+@router.get(
+    "/feed",
+    response_model=FeedPage,
+    responses={304: {"description": "Feed unchanged since the given ETag"}},
+)
+@query_budget(2)
+async def trip_feed(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    location_id: uuid.UUID | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Public trip + advertisement feed, served from cache until a trip or
+    advertisement commit invalidates it. Send the ETag back as
+    If-None-Match to get a 304 while nothing has changed.
+    """
+
+    generation = feed_cache.generation()
+    key = feed_key(location_id, cursor, limit)
+
+    entry = feed_cache.get(generation, key)
+    if entry is None:
+        trips = (await db.scalars(feed_query(location_id, cursor, limit))).all()
+        entry = feed_cache.set(generation, key, render_feed(trips, limit))
+
+    return feed_response(request, entry)
+
+# =====================================================
+# TRIP SEARCH
+# =====================================================
+
+@router.get("/search", response_model=SearchPage)
+@query_budget(5)
+async def search(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0, lt=SEARCH_MAX_RESULTS),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Published trips whose title, description or location matches every
+    word of `q`, best first. The last word also matches as a prefix ("kas"
+    finds Kasol); misspelled words are corrected ("manaly" finds Manali)
+    and those trips rank after exact matches. Page with `next_offset`.
+    """
+
+    limit = min(limit, SEARCH_MAX_RESULTS - offset)
+    hits = await db.run_sync(search_trips, q, limit + 1, offset)
+    if not hits:
+        return {"items": [], "next_offset": None}
+
+    query = search_query([trip_id for trip_id, _ in hits])
+    trips = (await db.scalars(query)).all()
+    return search_page(hits, trips, limit, offset)
+
+# =====================================================
+# LOCATION AUTOCOMPLETE
+# =====================================================
+
+@router.get("/locations", response_model=list[LocationRead])
+@query_budget(0)
+async def autocomplete_locations(
+    q: str = Query("", max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """
+    Locations whose name, or any word of it, starts with `q` (case and
+    accents ignored), served from the in-process location registry.
+    """
+
+    return location_registry.complete(q, limit)
+
+# =====================================================
+# ADVERTISEMENT TRACKING
+# =====================================================
+
+@router.post(
+    "/advertisements/impressions",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+@query_budget(0)
+async def record_impressions(data: AdImpressions):
+    """
+    Count an impression of each ad in `ad_ids`, typically every ad a feed
+    page showed. Counted in memory and written behind (core/ad_stats.py);
+    ids matching no advertisement are ignored.
+    """
+
+    ad_stats.impressions(data.ad_ids)
+
+
+@router.post(
+    "/advertisements/{ad_id}/click",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+@query_budget(0)
+async def record_click(ad_id: uuid.UUID):
+    ad_stats.click(ad_id)
+
+# =====================================================
+# ADVERTISEMENT MEDIA
+# =====================================================
+
+@router.get(
+    "/media/{asset_id}/{variant}",
+    response_class=FileResponse,
+    responses={
+        200: {"content": {VARIANT_MEDIA_TYPE: {}}},
+        304: {"description": "Unchanged (it always is) since the ETag"},
+    },
+)
+@query_budget(0)
+async def get_media(
+    request: Request,
+    variant: MediaVariant,
+    asset_id: str = Path(pattern="^[0-9a-f]{64}$"),
+):
+    """
+    An ad image variant as WebP (see the `images` URLs on an ad), cached
+    as immutable. 404 until the image has been rendered.
+    """
+
+    return media_response(request, asset_id, variant)
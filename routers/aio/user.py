@@ -0,0 +1,339 @@
+# app/routers/aio/user.py
+# Async mirror of routers/user.py, mounted when DB_ASYNC=true.
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+import uuid
+
+from core.database import get_async_db
+from core.aio_dependencies import (
+    get_current_principal_async,
+    get_current_user_async,
+)
+from core.dependencies import Principal, invalidate_principal
+from core.bookings import (
+    booking_page,
+    bookings_query,
+    cancel_booking,
+    confirm_booking,
+    reserve_seats,
+)
+from core.hashing import hasher
+from models.user import User
+from models.enums import UserRole
+from models.password_reset import PasswordResetOTP
+from models.booking import Booking
+
+from schemas.common import MessageResponse
+from schemas.user import UserRead, UserUpdate, UserCreate
+from schemas.booking import BookingCreate, BookingPage, BookingRead
+from schemas.password_reset import (
+    ForgotPasswordRequest,
+    VerifyOTPRequest,
+    ResetPasswordRequest,
+)
+
+from core.otp import claim_attempt, generate_otp, hash_otp, otp_expiry
+from core.outbox import otp_messages
+from core.query_budget import query_budget
+from core.rate_limit import (
+    otp_request_rate_limit,
+    otp_verify_rate_limit,
+    register_rate_limit,
+)
+
+router = APIRouter(
+    prefix="/user",
+    tags=["User"],
+)
+
+
+async def _user_by_email(db: AsyncSession, email: str) -> User | None:
+    return await db.scalar(select(User).where(User.email == email))
+
+# =====================================================
+# CREATE – User self registration
+# =====================================================
+
+@router.post(
+    "/register",
+    response_model=UserRead,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(register_rate_limit)],
+)
+@query_budget(3)
+async def register_user(
+    data: UserCreate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    if await _user_by_email(db, data.email):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this email already exists",
+        )
+
+    user = User(
+        name=data.name,
+        email=data.email,
+        phone=data.phone,
+        password_hash=await hasher.ahash_password(data.password),
+        role=UserRole.USER,     # 🔒 forced
+        is_active=True,
+    )
+
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+
+    return user
+
+# =====================================================
+# READ – Get my profile
+# =====================================================
+
+@router.get("/me", response_model=UserRead)
+@query_budget(1)
+async def get_my_profile(
+    current_user: User = Depends(get_current_user_async),
+):
+    return current_user
+
+# =====================================================
+# UPDATE – Update my profile (SAFE FIELDS ONLY)
+# =====================================================
+
+@router.put("/me", response_model=UserRead)
+async def update_my_profile(
+    data: UserUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    updates = data.model_dump(exclude_unset=True)
+
+    for field, value in updates.items():
+        setattr(current_user, field, value)
+
+    await db.commit()
+    await db.refresh(current_user)
+
+    return current_user
+
+# =====================================================
+# DELETE – Deactivate my account (soft delete)
+# =====================================================
+
+@router.delete("/me", response_model=MessageResponse)
+async def deactivate_my_account(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    if not current_user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Account already deactivated",
+        )
+
+    current_user.is_active = False
+    await db.commit()
+    invalidate_principal(current_user.id)
+
+    return {"message": "Account deactivated successfully"}
+
+# =====================================================
+# FORGOT PASSWORD – SEND OTP
+# =====================================================
+
+@router.post(
+    "/forgot-password",
+    response_model=MessageResponse,
+    dependencies=[Depends(otp_request_rate_limit)],
+)
+@query_budget(4)
+async def forgot_password(
+    data: ForgotPasswordRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    user = await _user_by_email(db, data.email)
+
+    # 🔒 Prevent user enumeration
+    if not user:
+        return {"message": "If the account exists, OTP has been sent"}
+
+    # Supersede any outstanding OTPs in one UPDATE, same transaction
+    await db.execute(
+        update(PasswordResetOTP)
+        .where(
+            PasswordResetOTP.user_id == user.id,
+            PasswordResetOTP.is_used == False,
+        )
+        .values(is_used=True, expires_at=datetime.utcnow())
+    )
+
+    otp = generate_otp()
+
+    reset = PasswordResetOTP(
+        user_id=user.id,
+        otp_hash=hash_otp(otp),
+        expires_at=otp_expiry(),
+    )
+
+    db.add(reset)
+    # Sent by the outbox dispatcher once this commits, not on this request.
+    db.add_all(otp_messages(user, otp, reset.expires_at))
+    await db.commit()
+
+    return {"message": "OTP sent successfully"}
+
+# =====================================================
+# VERIFY OTP
+# =====================================================
+
+async def check_otp(
+    db: AsyncSession,
+    user: User,
+    code: str,
+) -> PasswordResetOTP:
+    """
+    Latest unused OTP for `user` if `code` matches; counts failures. On
+    success the attempt is still claimed in the open transaction: roll
+    back to hand it back.
+    """
+    otp_entry = await db.scalar(
+        select(PasswordResetOTP)
+        .where(
+            PasswordResetOTP.user_id == user.id,
+            PasswordResetOTP.is_used == False,
+        )
+        .order_by(PasswordResetOTP.expires_at.desc())
+        .limit(1)
+    )
+
+    if not otp_entry or otp_entry.expires_at < datetime.utcnow():
+        raise HTTPException(status_code=400, detail="Invalid or expired OTP")
+
+    # 🔒 Every guess first takes one of OTP_MAX_ATTEMPTS; once they are
+    # gone the OTP is locked and a new one must be requested
+    result = await db.execute(claim_attempt(otp_entry.id))
+    if result.rowcount != 1:
+        await db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail="Too many failed attempts, request a new OTP",
+        )
+
+    if not await hasher.averify_otp(code, otp_entry.otp_hash):
+        await db.commit()
+        raise HTTPException(status_code=400, detail="Invalid or expired OTP")
+
+    return otp_entry
+
+
+@router.post(
+    "/verify-otp",
+    response_model=MessageResponse,
+    dependencies=[Depends(otp_verify_rate_limit)],
+)
+@query_budget(3)
+async def verify_otp_code(
+    data: VerifyOTPRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    user = await _user_by_email(db, data.email)
+    if not user:
+        raise HTTPException(status_code=400, detail="Invalid OTP")
+
+    await check_otp(db, user, data.otp)
+    # A correct code is not a failed attempt.
+    await db.rollback()
+
+    return {"message": "OTP verified successfully"}
+
+# =====================================================
+# RESET PASSWORD
+# =====================================================
+
+@router.post(
+    "/reset-password",
+    response_model=MessageResponse,
+    dependencies=[Depends(otp_verify_rate_limit)],
+)
+@query_budget(5)
+async def reset_password(
+    data: ResetPasswordRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    user = await _user_by_email(db, data.email)
+    if not user:
+        raise HTTPException(status_code=400, detail="Invalid request")
+
+    # Hashed before check_otp claims an attempt: the claim holds its row
+    # lock until the commit, and bcrypt must not run under it.
+    password_hash = await hasher.ahash_password(data.new_password)
+    otp_entry = await check_otp(db, user, data.otp)
+
+    user.password_hash = password_hash
+    otp_entry.is_used = True
+    otp_entry.expires_at = datetime.utcnow()
+
+    await db.commit()
+
+    return {"message": "Password reset successful"}
+
+# =====================================================
+# BOOKINGS
+# =====================================================
+
+@router.post(
+    "/bookings",
+    response_model=BookingRead,
+    status_code=status.HTTP_201_CREATED,
+)
+@query_budget(3)
+async def book_trip(
+    data: BookingCreate,
+    db: AsyncSession = Depends(get_async_db),
+    principal: Principal = Depends(get_current_principal_async),
+):
+    """Hold seats on a published trip; confirm before the hold expires."""
+    return await db.run_sync(
+        reserve_seats, data.trip_id, principal.id, data.seats
+    )
+
+
+@router.get("/bookings", response_model=BookingPage)
+@query_budget(2)
+async def list_my_bookings(
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+    principal: Principal = Depends(get_current_principal_async),
+):
+    query = bookings_query(cursor, Booking.user_id == principal.id)
+    bookings = (await db.scalars(query.limit(limit + 1))).all()
+    return booking_page(bookings, limit)
+
+
+@router.post("/bookings/{booking_id}/confirm", response_model=BookingRead)
+@query_budget(3)
+async def confirm_my_booking(
+    booking_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+    principal: Principal = Depends(get_current_principal_async),
+):
+    return await db.run_sync(
+        confirm_booking, booking_id, Booking.user_id == principal.id
+    )
+
+
+@router.delete("/bookings/{booking_id}", response_model=BookingRead)
+@query_budget(4)
+async def cancel_my_booking(
+    booking_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+    principal: Principal = Depends(get_current_principal_async),
+):
+    return await db.run_sync(
+        cancel_booking, booking_id, Booking.user_id == principal.id
+    )
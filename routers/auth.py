@@ -5,8 +5,15 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.dependencies import get_token_payload
 from models.user import User
-from core.security import verify_password, create_access_token
+from core.security import create_access_token
+from core.hashing import hasher
+from core.query_budget import query_budget
+from core.rate_limit import login_rate_limit
+from core.tokens import revocations
+from schemas.auth import TokenResponse
+from schemas.common import MessageResponse
 
 router = APIRouter(
     prefix="/auth",
@@ -14,7 +21,12 @@ router = APIRouter(
 )
 
 
-@router.post("/login")
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    dependencies=[Depends(login_rate_limit)],
+)
+@query_budget(1)
 def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db),
@@ -29,7 +41,7 @@ def login(
         User.email == form_data.username
     ).first()
 
-    if not user or not verify_password(
+    if not user or not hasher.verify_password(
         form_data.password,
         user.password_hash,
     ):
@@ -47,3 +59,23 @@ def login(
         "access_token": access_token,
         "token_type": "bearer",
     }
+
+
+@router.post("/logout", response_model=MessageResponse)
+@query_budget(1)
+def logout(
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db),
+):
+    """Revoke the bearer token of this request, on every worker."""
+    if "jti" not in payload:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Token cannot be revoked; it lapses at its expiry",
+        )
+
+    revocations.revoke(db, payload)
+    db.commit()
+    revocations.add(payload)
+
+    return {"message": "Logged out"}
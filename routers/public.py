@@ -0,0 +1,294 @@
+# app/routers/public.py
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import FileResponse
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session, joinedload, selectinload
+import os
+import uuid
+
+from core.ad_stats import ad_stats
+from core.config import SEARCH_MAX_RESULTS
+from core.database import get_db
+from core.feed_cache import feed_cache
+from core.locations import location_registry
+from core.media import (
+    VARIANT_MEDIA_TYPE,
+    MediaVariant,
+    asset_directory,
+    media_store,
+    variant_path,
+)
+from core.query_budget import query_budget
+from core.search import search_trips
+
+from models.trip import Trip, TripStatus
+from models.advertisement import Advertisement
+
+from routers.admin import trip_keyset, trip_page
+from schemas.advertisement import AdImpressions
+from schemas.feed import FeedPage
+from schemas.location import LocationRead
+from schemas.search import SearchPage, SearchTrip
+
+router = APIRouter(
+    prefix="/public",
+    tags=["Public"],
+)
+
+# =====================================================
+# TRIP FEED
+# =====================================================
+
+def feed_key(location_id: uuid.UUID | None, cursor: str | None, limit: int) -> str:
+    return f"{location_id or ''}|{cursor or ''}|{limit}"
+
+
+def feed_query(
+    location_id: uuid.UUID | None,
+    cursor: str | None,
+    limit: int,
+) -> Select:
+    """
+    Published, active trips with their location (joined) and active ads
+    (one IN query for the whole page): two statements per page.
+    """
+
+    query = (
+        select(Trip)
+        .where(Trip.is_active == True, Trip.status == TripStatus.PUBLISHED)
+        .options(
+            joinedload(Trip.location, innerjoin=True),
+            selectinload(
+                Trip.advertisements.and_(Advertisement.is_active == True)
+            ),
+        )
+    )
+    if location_id is not None:
+        query = query.where(Trip.location_id == location_id)
+
+    return trip_keyset(query, cursor).limit(limit + 1)
+
+
+def render_feed(trips: list[Trip], limit: int) -> bytes:
+    page = FeedPage.model_validate(trip_page(trips, limit), from_attributes=True)
+    return page.model_dump_json().encode()
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match", "")
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in tags or "*" in tags
+
+
+def feed_response(request: Request, entry: tuple[str, bytes]) -> Response:
+    etag, body = entry
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(body, media_type="application/json", headers=headers)
+
+
+@router.get(
+    "/feed",
+    response_model=FeedPage,
+    responses={304: {"description": "Feed unchanged since the given ETag"}},
+)
+@query_budget(2)
+def trip_feed(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    location_id: uuid.UUID | None = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Public trip + advertisement feed, served from cache until a trip or
+    advertisement commit invalidates it. Send the ETag back as
+    If-None-Match to get a 304 while nothing has changed.
+    """
+
+    generation = feed_cache.generation()
+    key = feed_key(location_id, cursor, limit)
+
+    entry = feed_cache.get(generation, key)
+    if entry is None:
+        trips = db.scalars(feed_query(location_id, cursor, limit)).all()
+        entry = feed_cache.set(generation, key, render_feed(trips, limit))
+
+    return feed_response(request, entry)
+
+# =====================================================
+# TRIP SEARCH
+# =====================================================
+
+def search_query(trip_ids: list[uuid.UUID]) -> Select:
+    # Primary-key lookup only; search_page() re-checks visibility (the
+    # index is only as fresh as the last sync) so SQLite cannot trade the
+    # PK for the (is_active, status, ...) index.
+    return (
+        select(Trip)
+        .where(Trip.id.in_(trip_ids))
+        .options(joinedload(Trip.location, innerjoin=True))
+    )
+
+
+def search_page(
+    hits: list[tuple[uuid.UUID, bool]],
+    trips: list[Trip],
+    limit: int,
+    offset: int,
+) -> dict:
+    """Trips in ranked order; `hits` holds one extra entry if there is more."""
+    by_id = {
+        trip.id: trip for trip in trips
+        if trip.is_active and trip.status == TripStatus.PUBLISHED
+    }
+    items = [
+        SearchTrip.model_validate(by_id[trip_id]).model_copy(
+            update={"fuzzy": fuzzy}
+        )
+        for trip_id, fuzzy in hits[:limit]
+        if trip_id in by_id
+    ]
+
+    next_offset = offset + limit
+    has_more = len(hits) > limit and next_offset < SEARCH_MAX_RESULTS
+    return {"items": items, "next_offset": next_offset if has_more else None}
+
+
+@router.get("/search", response_model=SearchPage)
+@query_budget(5)
+def search(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0, lt=SEARCH_MAX_RESULTS),
+    db: Session = Depends(get_db),
+):
+    """
+    Published trips whose title, description or location matches every
+    word of `q`, best first. The last word also matches as a prefix ("kas"
+    finds Kasol); misspelled words are corrected ("manaly" finds Manali)
+    and those trips rank after exact matches. Page with `next_offset`.
+    """
+
+    limit = min(limit, SEARCH_MAX_RESULTS - offset)
+    hits = search_trips(db, q, limit + 1, offset)
+    if not hits:
+        return {"items": [], "next_offset": None}
+
+    trips = db.scalars(search_query([trip_id for trip_id, _ in hits])).all()
+    return search_page(hits, trips, limit, offset)
+
+# =====================================================
+# LOCATION AUTOCOMPLETE
+# =====================================================
+
+@router.get("/locations", response_model=list[LocationRead])
+@query_budget(0)
+def autocomplete_locations(
+    q: str = Query("", max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """
+    Locations whose name, or any word of it, starts with `q` (case and
+    accents ignored), served from the in-process location registry.
+    """
+
+    return location_registry.complete(q, limit)
+
+# =====================================================
+# ADVERTISEMENT TRACKING
+# =====================================================
+
+@router.post(
+    "/advertisements/impressions",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+@query_budget(0)
+def record_impressions(data: AdImpressions):
+    """
+    Count an impression of each ad in `ad_ids`, typically every ad a feed
+    page showed. Counted in memory and written behind (core/ad_stats.py);
+    ids matching no advertisement are ignored.
+    """
+
+    ad_stats.impressions(data.ad_ids)
+
+
+@router.post(
+    "/advertisements/{ad_id}/click",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+@query_budget(0)
+def record_click(ad_id: uuid.UUID):
+    ad_stats.click(ad_id)
+
+# =====================================================
+# ADVERTISEMENT MEDIA
+# =====================================================
+
+# A variant URL names the image's digest, so its bytes never change.
+MEDIA_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def media_response(
+    request: Request,
+    asset_id: str,
+    variant: MediaVariant,
+) -> Response:
+    path = variant_path(asset_directory(asset_id, media_store.root), variant)
+    try:
+        # A local stat; FileResponse sends the body from a worker thread.
+        stat_result = os.stat(path)
+    except FileNotFoundError:
+        # Unknown, or not rendered yet: keep caches from holding the miss.
+        raise HTTPException(
+            404, "Media not found", headers={"Cache-Control": "no-store"}
+        )
+
+    etag = f'"{asset_id}-{variant.value}"'
+    headers = {"ETag": etag, "Cache-Control": MEDIA_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    # Range / If-Range requests are answered by FileResponse itself.
+    return FileResponse(
+        path,
+        media_type=VARIANT_MEDIA_TYPE,
+        headers=headers,
+        stat_result=stat_result,
+    )
+
+
+@router.get(
+    "/media/{asset_id}/{variant}",
+    response_class=FileResponse,
+    responses={
+        200: {"content": {VARIANT_MEDIA_TYPE: {}}},
+        304: {"description": "Unchanged (it always is) since the ETag"},
+    },
+)
+@query_budget(0)
+def get_media(
+    request: Request,
+    variant: MediaVariant,
+    asset_id: str = Path(pattern="^[0-9a-f]{64}$"),
+):
+    """
+    An ad image variant as WebP (see the `images` URLs on an ad), cached
+    as immutable. 404 until the image has been rendered.
+    """
+
+    return media_response(request, asset_id, variant)
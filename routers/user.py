@@ -1,24 +1,47 @@
 # app/routers/user.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from datetime import datetime
+import uuid
 
 from core.database import get_db
-from core.dependencies import get_current_user
-from core.security import hash_password
+from core.dependencies import (
+    Principal,
+    get_current_principal,
+    get_current_user,
+    invalidate_principal,
+)
+from core.bookings import (
+    booking_page,
+    bookings_query,
+    cancel_booking,
+    confirm_booking,
+    reserve_seats,
+)
+from core.hashing import hasher
 from models.user import User
 from models.enums import UserRole
 from models.password_reset import PasswordResetOTP
+from models.booking import Booking
 
+from schemas.common import MessageResponse
 from schemas.user import UserRead, UserUpdate, UserCreate
+from schemas.booking import BookingCreate, BookingPage, BookingRead
 from schemas.password_reset import (
     ForgotPasswordRequest,
     VerifyOTPRequest,
     ResetPasswordRequest,
 )
 
-from core.otp import generate_otp, hash_otp, verify_otp, otp_expiry
+from core.otp import claim_attempt, generate_otp, hash_otp, otp_expiry
+from core.outbox import otp_messages
+from core.query_budget import query_budget
+from core.rate_limit import (
+    otp_request_rate_limit,
+    otp_verify_rate_limit,
+    register_rate_limit,
+)
 
 router = APIRouter(
     prefix="/user",
@@ -33,7 +56,9 @@ router = APIRouter(
     "/register",
     response_model=UserRead,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(register_rate_limit)],
 )
+@query_budget(3)
 def register_user(
     data: UserCreate,
     db: Session = Depends(get_db),
@@ -48,7 +73,7 @@ def register_user(
         name=data.name,
         email=data.email,
         phone=data.phone,
-        password_hash=hash_password(data.password),
+        password_hash=hasher.hash_password(data.password),
         role=UserRole.USER,     # 🔒 forced
         is_active=True,
     )
@@ -64,6 +89,7 @@ def register_user(
 # =====================================================
 
 @router.get("/me", response_model=UserRead)
+@query_budget(1)
 def get_my_profile(
     current_user: User = Depends(get_current_user),
 ):
@@ -93,7 +119,7 @@ def update_my_profile(
 # DELETE – Deactivate my account (soft delete)
 # =====================================================
 
-@router.delete("/me")
+@router.delete("/me", response_model=MessageResponse)
 def deactivate_my_account(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -106,6 +132,7 @@ def deactivate_my_account(
 
     current_user.is_active = False
     db.commit()
+    invalidate_principal(current_user.id)
 
     return {"message": "Account deactivated successfully"}
 
@@ -113,7 +140,12 @@ def deactivate_my_account(
 # FORGOT PASSWORD – SEND OTP
 # =====================================================
 
-@router.post("/forgot-password")
+@router.post(
+    "/forgot-password",
+    response_model=MessageResponse,
+    dependencies=[Depends(otp_request_rate_limit)],
+)
+@query_budget(4)
 def forgot_password(
     data: ForgotPasswordRequest,
     db: Session = Depends(get_db),
@@ -124,59 +156,101 @@ def forgot_password(
     if not user:
         return {"message": "If the account exists, OTP has been sent"}
 
+    # Supersede any outstanding OTPs in one UPDATE, same transaction
+    now = datetime.utcnow()
+    db.query(PasswordResetOTP).filter(
+        PasswordResetOTP.user_id == user.id,
+        PasswordResetOTP.is_used == False,
+    ).update(
+        {"is_used": True, "expires_at": now},
+        synchronize_session=False,
+    )
+
     otp = generate_otp()
 
     reset = PasswordResetOTP(
-        user_id=str(user.id),
+        user_id=user.id,
         otp_hash=hash_otp(otp),
         expires_at=otp_expiry(),
     )
 
     db.add(reset)
+    # Sent by the outbox dispatcher once this commits, not on this request.
+    db.add_all(otp_messages(user, otp, reset.expires_at))
     db.commit()
 
-    # TODO: Send via email / SMS
-    print("DEBUG OTP:", otp)  # ❌ REMOVE IN PRODUCTION
-
     return {"message": "OTP sent successfully"}
 
 # =====================================================
 # VERIFY OTP
 # =====================================================
 
-@router.post("/verify-otp")
-def verify_otp_code(
-    data: VerifyOTPRequest,
-    db: Session = Depends(get_db),
-):
-    user = db.query(User).filter(User.email == data.email).first()
-    if not user:
-        raise HTTPException(status_code=400, detail="Invalid OTP")
-
+def check_otp(db: Session, user: User, code: str) -> PasswordResetOTP:
+    """
+    Latest unused OTP for `user` if `code` matches; counts failures. On
+    success the attempt is still claimed in the open transaction: roll
+    back to hand it back.
+    """
     otp_entry = (
         db.query(PasswordResetOTP)
         .filter(
-            PasswordResetOTP.user_id == str(user.id),
+            PasswordResetOTP.user_id == user.id,
             PasswordResetOTP.is_used == False,
         )
         .order_by(PasswordResetOTP.expires_at.desc())
         .first()
     )
 
-    if (
-        not otp_entry
-        or otp_entry.expires_at < datetime.utcnow()
-        or not verify_otp(data.otp, otp_entry.otp_hash)
-    ):
+    if not otp_entry or otp_entry.expires_at < datetime.utcnow():
+        raise HTTPException(status_code=400, detail="Invalid or expired OTP")
+
+    # 🔒 Every guess first takes one of OTP_MAX_ATTEMPTS; once they are
+    # gone the OTP is locked and a new one must be requested
+    result = db.execute(claim_attempt(otp_entry.id))
+    if result.rowcount != 1:
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail="Too many failed attempts, request a new OTP",
+        )
+
+    if not hasher.verify_otp(code, otp_entry.otp_hash):
+        db.commit()
         raise HTTPException(status_code=400, detail="Invalid or expired OTP")
 
+    return otp_entry
+
+
+@router.post(
+    "/verify-otp",
+    response_model=MessageResponse,
+    dependencies=[Depends(otp_verify_rate_limit)],
+)
+@query_budget(3)
+def verify_otp_code(
+    data: VerifyOTPRequest,
+    db: Session = Depends(get_db),
+):
+    user = db.query(User).filter(User.email == data.email).first()
+    if not user:
+        raise HTTPException(status_code=400, detail="Invalid OTP")
+
+    check_otp(db, user, data.otp)
+    # A correct code is not a failed attempt.
+    db.rollback()
+
     return {"message": "OTP verified successfully"}
 
 # =====================================================
 # RESET PASSWORD
 # =====================================================
 
-@router.post("/reset-password")
+@router.post(
+    "/reset-password",
+    response_model=MessageResponse,
+    dependencies=[Depends(otp_verify_rate_limit)],
+)
+@query_budget(5)
 def reset_password(
     data: ResetPasswordRequest,
     db: Session = Depends(get_db),
@@ -185,26 +259,65 @@ def reset_password(
     if not user:
         raise HTTPException(status_code=400, detail="Invalid request")
 
-    otp_entry = (
-        db.query(PasswordResetOTP)
-        .filter(
-            PasswordResetOTP.user_id == str(user.id),
-            PasswordResetOTP.is_used == False,
-        )
-        .order_by(PasswordResetOTP.expires_at.desc())
-        .first()
-    )
-
-    if (
-        not otp_entry
-        or otp_entry.expires_at < datetime.utcnow()
-        or not verify_otp(data.otp, otp_entry.otp_hash)
-    ):
-        raise HTTPException(status_code=400, detail="Invalid or expired OTP")
+    # Hashed before check_otp claims an attempt: the claim holds its row
+    # lock until the commit, and bcrypt must not run under it.
+    password_hash = hasher.hash_password(data.new_password)
+    otp_entry = check_otp(db, user, data.otp)
 
-    user.password_hash = hash_password(data.new_password)
+    user.password_hash = password_hash
     otp_entry.is_used = True
+    otp_entry.expires_at = datetime.utcnow()
 
     db.commit()
 
     return {"message": "Password reset successful"}
+
+# =====================================================
+# BOOKINGS
+# =====================================================
+
+@router.post(
+    "/bookings",
+    response_model=BookingRead,
+    status_code=status.HTTP_201_CREATED,
+)
+@query_budget(3)
+def book_trip(
+    data: BookingCreate,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_principal),
+):
+    """Hold seats on a published trip; confirm before the hold expires."""
+    return reserve_seats(db, data.trip_id, principal.id, data.seats)
+
+
+@router.get("/bookings", response_model=BookingPage)
+@query_budget(2)
+def list_my_bookings(
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_principal),
+):
+    query = bookings_query(cursor, Booking.user_id == principal.id)
+    return booking_page(db.scalars(query.limit(limit + 1)).all(), limit)
+
+
+@router.post("/bookings/{booking_id}/confirm", response_model=BookingRead)
+@query_budget(3)
+def confirm_my_booking(
+    booking_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_principal),
+):
+    return confirm_booking(db, booking_id, Booking.user_id == principal.id)
+
+
+@router.delete("/bookings/{booking_id}", response_model=BookingRead)
+@query_budget(4)
+def cancel_my_booking(
+    booking_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_principal),
+):
+    return cancel_booking(db, booking_id, Booking.user_id == principal.id)
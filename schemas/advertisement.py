@@ -1,7 +1,70 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, computed_field, model_validator
+
+from schemas.media import MediaUrls
 
 
 class AdvertisementCreate(BaseModel):
     title: str
-    image_url: str
-    trip_id: str
+    asset_id: str
+    trip_id: UUID
+
+
+class AdImage(BaseModel):
+    """
+    An ad's image: an uploaded asset (`asset_id`), or only a remote
+    `image_url` for ads created before uploads existed.
+    """
+
+    asset_id: Optional[str] = None
+    image_url: Optional[str] = None
+
+    @model_validator(mode="after")
+    def default_image_url(self):
+        # Clients that only read image_url get the full-size variant.
+        if self.image_url is None and self.asset_id is not None:
+            self.image_url = MediaUrls.for_asset(self.asset_id).full
+        return self
+
+    @computed_field
+    @property
+    def images(self) -> Optional[MediaUrls]:
+        if self.asset_id is None:
+            return None
+        return MediaUrls.for_asset(self.asset_id)
+
+
+class AdvertisementRead(AdImage):
+    id: UUID
+    title: str
+    trip_id: UUID
+    is_active: bool
+
+    class Config:
+        from_attributes = True
+
+
+class AdImpressions(BaseModel):
+    # An ad shown twice is listed twice.
+    ad_ids: list[UUID] = Field(min_length=1, max_length=100)
+
+
+class AdStatsRead(BaseModel):
+    ad_id: UUID
+    trip_id: UUID
+    impressions: int
+    clicks: int
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class TripAdStatsRead(BaseModel):
+    trip_id: UUID
+    ads: int
+    impressions: int
+    clicks: int
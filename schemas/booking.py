@@ -0,0 +1,43 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from core.config import BOOKING_MAX_SEATS
+
+
+class BookingStatus(str, Enum):
+    HELD = "HELD"
+    CONFIRMED = "CONFIRMED"
+    CANCELLED = "CANCELLED"
+    EXPIRED = "EXPIRED"
+
+
+class BookingCreate(BaseModel):
+    trip_id: UUID
+    seats: int = Field(1, ge=1, le=BOOKING_MAX_SEATS)
+
+
+class AgentBookingCreate(BookingCreate):
+    user_id: UUID
+
+
+class BookingRead(BaseModel):
+    id: UUID
+    trip_id: UUID
+    user_id: UUID
+    booked_by_id: Optional[UUID]
+    seats: int
+    status: BookingStatus
+    hold_expires_at: Optional[datetime]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class BookingPage(BaseModel):
+    items: list[BookingRead]
+    next_cursor: Optional[str] = None
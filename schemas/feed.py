@@ -0,0 +1,26 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from schemas.advertisement import AdImage
+from schemas.location import LocationRead
+from schemas.trip import TripRead
+
+
+class FeedAdvertisement(AdImage):
+    id: UUID
+    title: str
+
+    class Config:
+        from_attributes = True
+
+
+class FeedTrip(TripRead):
+    location: LocationRead
+    advertisements: list[FeedAdvertisement]
+
+
+class FeedPage(BaseModel):
+    items: list[FeedTrip]
+    next_cursor: Optional[str] = None
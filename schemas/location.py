@@ -1,5 +1,15 @@
+from uuid import UUID
+
 from pydantic import BaseModel
 
 
 class LocationCreate(BaseModel):
     name: str
+
+
+class LocationRead(BaseModel):
+    id: UUID
+    name: str
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,48 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, computed_field
+
+# Where routers/public.py serves variants from.
+MEDIA_PATH = "/public/media"
+
+
+class MediaStatus(str, Enum):
+    PENDING = "PENDING"
+    READY = "READY"
+    FAILED = "FAILED"
+
+
+class MediaUrls(BaseModel):
+    """One URL per variant; each answers 404 until the asset is READY."""
+
+    thumbnail: str
+    card: str
+    full: str
+
+    @classmethod
+    def for_asset(cls, asset_id: str) -> "MediaUrls":
+        return cls(**{
+            variant: f"{MEDIA_PATH}/{asset_id}/{variant}"
+            for variant in cls.model_fields
+        })
+
+
+class MediaAssetRead(BaseModel):
+    id: str
+    content_type: str
+    size: int
+    width: Optional[int]
+    height: Optional[int]
+    status: MediaStatus
+    error: Optional[str]
+    created_at: datetime
+
+    @computed_field
+    @property
+    def urls(self) -> MediaUrls:
+        return MediaUrls.for_asset(self.id)
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,16 @@
+from typing import Optional
+from pydantic import BaseModel
+
+from schemas.location import LocationRead
+from schemas.trip import TripRead
+
+
+class SearchTrip(TripRead):
+    location: LocationRead
+    # True when the trip only matched after correcting a misspelled term
+    fuzzy: bool = False
+
+
+class SearchPage(BaseModel):
+    items: list[SearchTrip]
+    next_offset: Optional[int] = None
@@ -1,7 +1,8 @@
 from datetime import date
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 from enum import Enum
+from uuid import UUID
 
 
 class TripStatus(str, Enum):
@@ -9,3 +10,94 @@ class TripStatus(str, Enum):
     PUBLISHED = "PUBLISHED"
     COMPLETED = "COMPLETED"
     CANCELLED = "CANCELLED"
+
+
+class TripRead(BaseModel):
+    id: UUID
+    title: str
+    description: str
+    location_id: UUID
+    start_date: date
+    end_date: date
+    price: int
+    capacity: int
+    status: TripStatus
+    is_active: bool
+
+    class Config:
+        from_attributes = True
+
+
+class TripPage(BaseModel):
+    items: list[TripRead]
+    next_cursor: Optional[str] = None
+
+
+class TripFileFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class TripImportRow(BaseModel):
+    """One row of a bulk trip import (CSV or NDJSON)."""
+
+    title: str = Field(min_length=1, max_length=200)
+    description: str = Field(max_length=1000)
+    location_id: UUID
+    start_date: date
+    end_date: date
+    price: int = Field(ge=0)
+    capacity: int = Field(ge=1)
+    status: TripStatus = TripStatus.DRAFT
+    is_active: bool = True
+
+    @model_validator(mode="after")
+    def check_dates(self):
+        if self.end_date < self.start_date:
+            raise ValueError("end_date is before start_date")
+        return self
+
+
+class TripImportError(BaseModel):
+    line: int
+    errors: list[str]
+
+
+class TripImportReport(BaseModel):
+    inserted: int
+    failed: int
+    errors: list[TripImportError]
+
+
+class TripAgentPair(BaseModel):
+    trip_id: UUID
+    agent_id: UUID
+
+
+class TripAgentBatch(BaseModel):
+    assignments: list[TripAgentPair] = Field(min_length=1, max_length=1000)
+
+
+class TripAgentAssigned(BaseModel):
+    assigned: int
+
+
+class TripAgentUnassigned(BaseModel):
+    unassigned: int
+
+
+class AgentTripRead(BaseModel):
+    """An assigned trip with booking aggregates computed in SQL."""
+
+    trip: TripRead = Field(validation_alias="Trip")
+    confirmed_bookings: int
+    confirmed_seats: int
+    held_seats: int
+
+    class Config:
+        from_attributes = True
+
+
+class AgentTripPage(BaseModel):
+    items: list[AgentTripRead]
+    next_cursor: Optional[str] = None
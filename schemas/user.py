@@ -20,7 +20,9 @@ class UserCreate(BaseModel):
 class UserRead(BaseModel):
     id: UUID
     name: str
-    email: EmailStr
+    # As stored: older rows were written without validation, and one
+    # of them must not break every page it appears on.
+    email: str
     phone: Optional[str]
     role: UserRole
     is_active: bool
@@ -29,6 +31,22 @@ class UserRead(BaseModel):
         from_attributes = True
 
 
+class UserPage(BaseModel):
+    items: list[UserRead]
+    next_cursor: Optional[str] = None
+
+
+class AgentCreated(BaseModel):
+    message: str
+    agent_id: UUID
+    email: EmailStr
+
+
+class AgentDeactivated(BaseModel):
+    message: str
+    agent_id: UUID
+
+
 class UserUpdate(BaseModel):
     name: Optional[str] = None
     phone: Optional[str] = None
@@ -0,0 +1,161 @@
+# tests/conftest.py
+"""
+Shared fixtures for the in-process tests: a throwaway SQLite database,
+migrated once per session as a deploy would, and a TestClient on
+main.app.
+
+core.config reads the environment at import, so it is set here, before
+any test imports the app. DB_ASYNC is left to the caller: run the suite
+once per stack.
+"""
+
+import os
+import re
+import sys
+import tempfile
+import uuid
+from datetime import date, timedelta
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+_scratch = tempfile.mkdtemp(prefix="anand_tests_")
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = (
+        f"sqlite:///{os.path.join(_scratch, 'app.db')}"
+    )
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("MEDIA_ROOT", os.path.join(_scratch, "media"))
+os.environ.setdefault("MEDIA_POOL_WORKERS", "0")
+# Any route over its @query_budget fails the test that reaches it.
+os.environ.setdefault("QUERY_BUDGET_MODE", "enforce")
+# Tests dispatch the outbox themselves.
+os.environ.setdefault("OUTBOX_POLL_SECONDS", "0")
+# Tests that exercise rate limits install their own limiter.
+for name in (
+    "RATE_LIMIT_LOGIN_IP",
+    "RATE_LIMIT_LOGIN_ACCOUNT",
+    "RATE_LIMIT_OTP_REQUEST_IP",
+    "RATE_LIMIT_OTP_REQUEST_ACCOUNT",
+    "RATE_LIMIT_OTP_VERIFY_IP",
+    "RATE_LIMIT_OTP_VERIFY_ACCOUNT",
+    "RATE_LIMIT_REGISTER_IP",
+):
+    os.environ.setdefault(name, "0")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: starts a server process; deselect with -m 'not slow'"
+    )
+
+
+@pytest.fixture(scope="session")
+def database():
+    """The test database, migrated and with the default admin."""
+    import cli
+
+    cli.migrate()
+    cli.seed_admin()
+
+
+@pytest.fixture(scope="session")
+def client(database):
+    import main
+    from fastapi.testclient import TestClient
+
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def login(client):
+    def login(email: str, password: str) -> dict:
+        response = client.post(
+            "/auth/login", data={"username": email, "password": password}
+        )
+        assert response.status_code == 200, response.text
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    return login
+
+
+@pytest.fixture(scope="session")
+def admin_headers(login):
+    from core.config import DEFAULT_ADMIN_EMAIL, DEFAULT_ADMIN_PASSWORD
+
+    return login(DEFAULT_ADMIN_EMAIL, DEFAULT_ADMIN_PASSWORD)
+
+
+@pytest.fixture
+def make_trip(client, admin_headers):
+    """Create a published trip (at a new location unless one is named)."""
+
+    def make_trip(
+        title: str = "Ganga Aarti",
+        description: str = "Evening aarti on the ghats",
+        location: str | None = None,
+        capacity: int = 10,
+    ) -> dict:
+        response = client.post(
+            "/admin/locations",
+            params={"name": location or f"Place {uuid.uuid4().hex[:8]}"},
+            headers=admin_headers,
+        )
+        assert response.status_code == 200, response.text
+
+        start = date.today() + timedelta(days=30)
+        response = client.post(
+            "/admin/trips",
+            params={
+                "title": title,
+                "description": description,
+                "location_id": response.json()["id"],
+                "start_date": start.isoformat(),
+                "end_date": (start + timedelta(days=3)).isoformat(),
+                "price": 5000,
+                "capacity": capacity,
+            },
+            headers=admin_headers,
+        )
+        assert response.status_code == 200, response.text
+
+        response = client.put(
+            f"/admin/trips/{response.json()['id']}",
+            params={"status": "PUBLISHED"},
+            headers=admin_headers,
+        )
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    return make_trip
+
+
+@pytest.fixture
+def reset_codes(monkeypatch):
+    """
+    Queue password reset codes for email (no transport is configured),
+    and return a function reading an address's latest code back.
+    """
+    from sqlalchemy import select
+
+    from core import outbox
+    from core.database import SessionLocal
+    from models.outbox import OutboxChannel, OutboxMessage
+
+    monkeypatch.setitem(
+        outbox.transports, OutboxChannel.EMAIL, outbox.ConsoleTransport()
+    )
+
+    def latest_code(email: str) -> str:
+        with SessionLocal() as db:
+            body = db.scalars(
+                select(OutboxMessage.body)
+                .where(OutboxMessage.recipient == email)
+                .order_by(OutboxMessage.created_at.desc())
+            ).first()
+        return re.search(r"\b(\d{6})\b", body).group(1)
+
+    return latest_code
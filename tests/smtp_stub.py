@@ -0,0 +1,76 @@
+# tests/smtp_stub.py
+"""
+Just enough SMTP for smtplib, on a local port, recording what it is
+sent. Used by tests/test_outbox.py and benchmarks/bench_otp_outbox.py.
+"""
+
+import socketserver
+import threading
+import time
+
+
+class SmtpStub(socketserver.ThreadingTCPServer):
+    """
+    Every reply is delayed by `rtt` seconds (a remote mail server). With
+    `fail_every` set, every n-th MAIL FROM is refused with a 451.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port: int, rtt: float = 0.0):
+        self.rtt = rtt
+        self.fail_every = 0
+        self.connections = 0
+        self.transactions = 0
+        self.delivered: list[str] = []
+        self.lock = threading.Lock()
+        super().__init__(("127.0.0.1", port), SmtpHandler)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+
+class SmtpHandler(socketserver.StreamRequestHandler):
+    def reply(self, line: str):
+        time.sleep(self.server.rtt)
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self.reply("220 stub ESMTP")
+        recipient = None
+
+        for raw in self.rfile:
+            command = raw.decode().strip()
+            verb = command[:4].upper()
+            if verb == "EHLO":
+                self.wfile.write(b"250-stub\r\n")
+                self.reply("250 8BITMIME")
+            elif verb == "MAIL":
+                with server.lock:
+                    server.transactions += 1
+                    refuse = (
+                        server.fail_every
+                        and server.transactions % server.fail_every == 0
+                    )
+                self.reply("451 try again later" if refuse else "250 OK")
+            elif verb == "RCPT":
+                recipient = command.split(":", 1)[1].strip(" <>")
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 end with .")
+                for line in self.rfile:
+                    if line in (b".\r\n", b".\n"):
+                        break
+                with server.lock:
+                    server.delivered.append(recipient)
+                self.reply("250 queued")
+            elif verb == "QUIT":
+                self.reply("221 bye")
+                return
+            else:  # RSET, NOOP, HELO
+                self.reply("250 OK")
@@ -0,0 +1,32 @@
+# tests/test_agents.py
+from sqlalchemy import select
+
+from core.database import SessionLocal
+from models.user import User
+
+
+def test_create_agent_rejects_invalid_email(client, admin_headers):
+    response = client.post(
+        "/admin/agents",
+        params={"name": "Agent", "email": "agent1", "password": "Agent@123"},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 422
+    with SessionLocal() as db:
+        assert db.scalar(select(User).where(User.email == "agent1")) is None
+
+
+def test_create_agent(client, admin_headers):
+    response = client.post(
+        "/admin/agents",
+        params={
+            "name": "Agent",
+            "email": "agent.create@example.com",
+            "password": "Agent@123",
+        },
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["email"] == "agent.create@example.com"
@@ -0,0 +1,103 @@
+# tests/test_bookings.py
+import random
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, insert, select
+
+from core.database import SessionLocal
+from core.ids import uuid7
+from core.security import create_access_token
+from models.booking import Booking, BookingStatus
+from models.enums import UserRole
+from models.trip import Trip
+from models.user import User
+
+
+def create_users(count: int) -> list[dict]:
+    """Bearer headers for `count` new users."""
+    user_ids = [uuid7() for _ in range(count)]
+    with SessionLocal() as db:
+        db.execute(insert(User), [
+            {
+                "id": user_id,
+                "name": "Pilgrim",
+                "email": f"{user_id}@bookings.test",
+                "password_hash": "x",
+                "role": UserRole.USER,
+                "is_active": True,
+            }
+            for user_id in user_ids
+        ])
+        db.commit()
+    return [
+        {
+            "Authorization": "Bearer "
+            + create_access_token(str(user_id), UserRole.USER.value)
+        }
+        for user_id in user_ids
+    ]
+
+
+def feed_capacity(client, trip: dict) -> int:
+    response = client.get(
+        "/public/feed", params={"location_id": trip["location_id"]}
+    )
+    assert response.status_code == 200, response.text
+    (item,) = response.json()["items"]
+    return item["capacity"]
+
+
+def test_capacity_change_invalidates_feed(client, admin_headers, make_trip):
+    trip = make_trip(capacity=10)
+    assert feed_capacity(client, trip) == 10
+
+    response = client.put(
+        f"/admin/trips/{trip['id']}",
+        params={"capacity": 20},
+        headers=admin_headers,
+    )
+    assert response.status_code == 200, response.text
+
+    assert feed_capacity(client, trip) == 20
+
+
+def test_concurrent_bookings_never_overbook(client, make_trip):
+    trip = make_trip(capacity=30)
+    rng = random.Random(3)
+    # About twice the capacity, asked for at once.
+    requests = [(headers, rng.randint(1, 3)) for headers in create_users(40)]
+
+    def book(request):
+        headers, seats = request
+        response = client.post(
+            "/user/bookings",
+            json={"trip_id": trip["id"], "seats": seats},
+            headers=headers,
+        )
+        return seats, response.status_code
+
+    # Fewer threads than pooled connections (DB_POOL_SIZE + overflow).
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(book, requests))
+
+    assert {status for _, status in results} <= {201, 409}
+    granted = sum(seats for seats, status in results if status == 201)
+    with SessionLocal() as db:
+        reserved, capacity = db.execute(
+            select(Trip.seats_reserved, Trip.capacity)
+            .where(Trip.id == uuid.UUID(trip["id"]))
+        ).one()
+        held = db.scalar(
+            select(func.sum(Booking.seats)).where(
+                Booking.trip_id == uuid.UUID(trip["id"]),
+                Booking.status.in_(
+                    [BookingStatus.HELD, BookingStatus.CONFIRMED]
+                ),
+            )
+        )
+
+    assert reserved <= capacity
+    assert reserved == held == granted
+    # The trip filled up, so requests really did compete for seats.
+    assert capacity - reserved < 3
@@ -0,0 +1,19 @@
+# tests/test_locations.py
+from core.database import SessionLocal
+from models.location import Location
+
+
+def test_database_rejects_accent_folded_duplicate(client, admin_headers):
+    # Another worker's insert, not yet in this worker's registry.
+    with SessionLocal() as db:
+        db.add(Location(name="Manāli Ghāt"))
+        db.commit()
+
+    response = client.post(
+        "/admin/locations",
+        params={"name": "  manali  ghat "},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "Location already exists"
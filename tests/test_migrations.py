@@ -0,0 +1,265 @@
+# tests/test_migrations.py
+"""
+`cli.py migrate` on databases built by the old create_all at startup.
+
+Each test builds the tables as create_all did at some point before the
+schema moved to Alembic, then migrates in a subprocess (core.config reads
+DATABASE_URL at import) and checks the result against the models.
+"""
+
+import os
+import subprocess
+import sys
+import uuid
+from datetime import date, datetime
+
+import sqlalchemy as sa
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def original_tables(metadata: sa.MetaData, bookings: bool = False):
+    """
+    The first shipped models, plus (with `bookings`) the bookings table as
+    the booking engine first created it, before trips.seats_reserved
+    reached databases whose trips table already existed.
+    """
+    sa.Table(
+        "locations", metadata,
+        sa.Column("id", sa.Uuid, primary_key=True),
+        sa.Column("name", sa.String(100), unique=True, nullable=False),
+    )
+    sa.Table(
+        "users", metadata,
+        sa.Column("id", sa.Uuid, primary_key=True),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column(
+            "email", sa.String(120), unique=True, index=True, nullable=False
+        ),
+        sa.Column("password_hash", sa.String, nullable=False),
+        sa.Column(
+            "role", sa.Enum("ADMIN", "AGENT", "USER", name="userrole"),
+            nullable=False,
+        ),
+        sa.Column("is_active", sa.Boolean, nullable=False),
+    )
+    sa.Table(
+        "password_reset_otps", metadata,
+        sa.Column("id", sa.String, primary_key=True),
+        sa.Column(
+            "user_id", sa.Uuid, sa.ForeignKey("users.id"), nullable=False
+        ),
+        sa.Column("otp_hash", sa.String, nullable=False),
+        sa.Column("expires_at", sa.DateTime, nullable=False),
+        sa.Column("is_used", sa.Boolean, nullable=False),
+    )
+    sa.Table(
+        "trips", metadata,
+        sa.Column("id", sa.String, primary_key=True),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("description", sa.String(1000), nullable=False),
+        sa.Column(
+            "location_id", sa.Uuid, sa.ForeignKey("locations.id"),
+            nullable=False,
+        ),
+        sa.Column("start_date", sa.Date, nullable=False),
+        sa.Column("end_date", sa.Date, nullable=False),
+        sa.Column("price", sa.Integer, nullable=False),
+        sa.Column("capacity", sa.Integer, nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "DRAFT", "PUBLISHED", "COMPLETED", "CANCELLED",
+                name="tripstatus",
+            ),
+            nullable=False,
+        ),
+        sa.Column("is_active", sa.Boolean, nullable=False),
+    )
+    sa.Table(
+        "advertisements", metadata,
+        sa.Column("id", sa.String, primary_key=True),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("image_url", sa.String(500), nullable=False),
+        sa.Column(
+            "trip_id", sa.String, sa.ForeignKey("trips.id"), nullable=False
+        ),
+        sa.Column("is_active", sa.Boolean, nullable=False),
+    )
+    if bookings:
+        sa.Table(
+            "bookings", metadata,
+            sa.Column("id", sa.Uuid, primary_key=True),
+            sa.Column(
+                "trip_id", sa.String, sa.ForeignKey("trips.id"),
+                nullable=False,
+            ),
+            sa.Column(
+                "user_id", sa.Uuid, sa.ForeignKey("users.id"), nullable=False
+            ),
+            sa.Column(
+                "booked_by_id", sa.Uuid, sa.ForeignKey("users.id"),
+                nullable=True,
+            ),
+            sa.Column("seats", sa.Integer, nullable=False),
+            sa.Column(
+                "status",
+                sa.Enum(
+                    "HELD", "CONFIRMED", "CANCELLED", "EXPIRED",
+                    name="bookingstatus",
+                ),
+                nullable=False,
+            ),
+            sa.Column("hold_expires_at", sa.DateTime, nullable=True),
+            sa.Column("created_at", sa.DateTime, nullable=False),
+            sa.Index("ix_bookings_trip_status", "trip_id", "status"),
+        )
+
+
+def create_original_database(url: str, bookings: bool = False) -> dict:
+    metadata = sa.MetaData()
+    original_tables(metadata, bookings)
+    engine = sa.create_engine(url)
+    metadata.create_all(engine)
+
+    ids = {
+        "user": uuid.uuid4(),
+        "location": uuid.uuid4(),
+        "trip": str(uuid.uuid4()),
+    }
+    tables = metadata.tables
+    with engine.begin() as conn:
+        conn.execute(tables["users"].insert().values(
+            id=ids["user"], name="Asha", email="asha@example.com",
+            password_hash="x", role="USER", is_active=True,
+        ))
+        conn.execute(tables["locations"].insert().values(
+            id=ids["location"], name="Rishikesh",
+        ))
+        conn.execute(tables["trips"].insert().values(
+            id=ids["trip"], title="Ganga Aarti", description="Evening",
+            location_id=ids["location"], start_date=date(2026, 11, 1),
+            end_date=date(2026, 11, 3), price=5000, capacity=20,
+            status="PUBLISHED", is_active=True,
+        ))
+        conn.execute(tables["advertisements"].insert().values(
+            id=str(uuid.uuid4()), title="Aarti", image_url="/a.jpg",
+            trip_id=ids["trip"], is_active=True,
+        ))
+        conn.execute(tables["password_reset_otps"].insert().values(
+            id=str(uuid.uuid4()), user_id=ids["user"], otp_hash="h",
+            expires_at=datetime(2026, 1, 1), is_used=False,
+        ))
+        if bookings:
+            for seats, status in ((3, "HELD"), (2, "CONFIRMED"),
+                                  (4, "CANCELLED")):
+                conn.execute(tables["bookings"].insert().values(
+                    id=uuid.uuid4(), trip_id=ids["trip"],
+                    user_id=ids["user"], seats=seats, status=status,
+                    created_at=datetime(2026, 10, 1),
+                ))
+    engine.dispose()
+    return ids
+
+
+def run(url: str, *args: str):
+    env = {
+        **os.environ,
+        "DATABASE_URL": url,
+        "SECRET_KEY": os.environ.get("SECRET_KEY", "test-secret"),
+    }
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, env=env,
+        capture_output=True, text=True,
+    )
+
+
+def migrate_to_head(url: str):
+    result = run(url, "cli.py", "migrate")
+    assert result.returncode == 0, result.stderr
+
+    result = run(url, "-m", "alembic", "current")
+    assert "(head)" in result.stdout, result.stdout + result.stderr
+
+    # Nothing left between the models and the migrated database.
+    result = run(url, "-m", "alembic", "check")
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_migrates_original_database_to_head(tmp_path):
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    ids = create_original_database(url)
+
+    migrate_to_head(url)
+
+    engine = sa.create_engine(url)
+    with engine.connect() as conn:
+        user = conn.execute(sa.text(
+            "SELECT id, phone FROM users WHERE email = 'asha@example.com'"
+        )).one()
+        trip = conn.execute(sa.text(
+            "SELECT seats_reserved FROM trips"
+        )).one()
+        attempts = conn.scalar(sa.text(
+            "SELECT attempts FROM password_reset_otps"
+        ))
+        name_key = conn.scalar(sa.text("SELECT name_key FROM locations"))
+    engine.dispose()
+    # Keys kept their values through the native uuid rebuild.
+    assert uuid.UUID(bytes=user.id) == ids["user"]
+    assert user.phone is None
+    assert trip.seats_reserved == 0
+    assert attempts == 0
+    assert name_key == "rishikesh"
+
+
+def test_migrates_database_with_early_bookings_to_head(tmp_path):
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    create_original_database(url, bookings=True)
+
+    migrate_to_head(url)
+
+    engine = sa.create_engine(url)
+    with engine.connect() as conn:
+        seats_reserved = conn.scalar(sa.text(
+            "SELECT seats_reserved FROM trips"
+        ))
+        indexes = {
+            index["name"]: index["column_names"]
+            for index in sa.inspect(conn).get_indexes("bookings")
+        }
+    engine.dispose()
+    # Held and confirmed seats only.
+    assert seats_reserved == 5
+    assert indexes["ix_bookings_trip_status"] == ["trip_id", "status", "seats"]
+
+
+def test_migrates_database_from_last_create_all(tmp_path):
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    # Everything create_all built just before the move to Alembic, on an
+    # empty database: 0001 and 0001a, without the version table.
+    assert run(url, "-m", "alembic", "upgrade", "0001a").returncode == 0
+    engine = sa.create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(sa.text("DROP TABLE alembic_version"))
+    engine.dispose()
+
+    migrate_to_head(url)
+
+
+def test_accent_folded_duplicate_locations_stop_the_upgrade(tmp_path):
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    assert run(url, "-m", "alembic", "upgrade", "0009").returncode == 0
+    engine = sa.create_engine(url)
+    with engine.begin() as conn:
+        locations = sa.table("locations", sa.column("id"), sa.column("name"))
+        conn.execute(locations.insert(), [
+            {"id": uuid.uuid4().bytes, "name": "Manāli"},
+            {"id": uuid.uuid4().bytes, "name": "manali"},
+        ])
+    engine.dispose()
+
+    result = run(url, "cli.py", "migrate")
+
+    assert result.returncode != 0
+    assert "Manāli / manali" in result.stderr
@@ -0,0 +1,161 @@
+# tests/test_outbox.py
+"""
+OTP delivery through the outbox, against the local SMTP stub: the
+request only queues, dispatch_outbox delivers each message exactly once,
+through refusals and through leases that outlast a slow batch.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, select
+
+from core import outbox
+from core.database import SessionLocal
+from models.outbox import OutboxChannel, OutboxMessage, OutboxStatus
+from smtp_stub import SmtpStub
+
+
+class PerThreadSmtp:
+    """One SmtpTransport per thread: each thread plays a worker process."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.local = threading.local()
+        self.opened = []
+
+    def send(self, message):
+        transport = getattr(self.local, "transport", None)
+        if transport is None:
+            transport = outbox.SmtpTransport(self.url, "test@example.com", 10)
+            self.local.transport = transport
+            self.opened.append(transport)
+        transport.send(message)
+
+    def close(self):
+        for transport in self.opened:
+            transport.close()
+
+
+@pytest.fixture
+def smtp(database, monkeypatch):
+    stub = SmtpStub(0)
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    transport = PerThreadSmtp(f"smtp://127.0.0.1:{stub.port}?starttls=false")
+    monkeypatch.setitem(outbox.transports, OutboxChannel.EMAIL, transport)
+    monkeypatch.setattr(outbox, "OUTBOX_BACKOFF_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(outbox, "OUTBOX_BACKOFF_MAX_SECONDS", 0.05)
+
+    # Only this test's messages.
+    with SessionLocal() as db:
+        db.execute(delete(OutboxMessage))
+        db.commit()
+
+    yield stub
+
+    transport.close()
+    stub.shutdown()
+    stub.server_close()
+
+
+def queued() -> list[OutboxMessage]:
+    with SessionLocal() as db:
+        return db.scalars(select(OutboxMessage)).all()
+
+
+def queue_emails(count: int) -> list[str]:
+    recipients = [f"outbox{n}@example.com" for n in range(count)]
+    expires_at = datetime.utcnow() + timedelta(minutes=5)
+    with SessionLocal() as db:
+        db.add_all(
+            OutboxMessage(
+                channel=OutboxChannel.EMAIL,
+                recipient=recipient,
+                subject="Password reset",
+                body="Your code is 123456",
+                expires_at=expires_at,
+            )
+            for recipient in recipients
+        )
+        db.commit()
+    return recipients
+
+
+def drain():
+    while any(m.status == OutboxStatus.PENDING for m in queued()):
+        outbox.dispatch_outbox()
+        time.sleep(0.02)  # let backed-off messages fall due
+
+
+def test_forgot_password_delivers_otp_through_outbox(client, smtp):
+    email = "outbox.user@example.com"
+    response = client.post(
+        "/user/register",
+        json={"name": "Outbox", "email": email, "password": "Outbox@123"},
+    )
+    assert response.status_code == 201, response.text
+
+    response = client.post("/user/forgot-password", json={"email": email})
+    assert response.status_code == 200, response.text
+    # Queued in the request's commit, not sent by it.
+    assert smtp.delivered == []
+    assert [message.recipient for message in queued()] == [email]
+
+    assert outbox.dispatch_outbox() == 1
+    assert smtp.delivered == [email]
+    assert queued() == []
+
+
+def test_refused_messages_are_retried_once_each(smtp):
+    recipients = queue_emails(6)
+    smtp.fail_every = 3
+
+    drain()
+
+    assert sorted(smtp.delivered) == sorted(recipients)
+    assert queued() == []
+
+
+def test_message_fails_after_max_attempts(smtp, monkeypatch):
+    monkeypatch.setattr(outbox, "OUTBOX_MAX_ATTEMPTS", 2)
+    queue_emails(1)
+    smtp.fail_every = 1
+
+    drain()
+
+    (message,) = queued()
+    assert message.status == OutboxStatus.FAILED
+    assert message.attempts == 2
+    assert message.body is None
+    assert smtp.delivered == []
+
+
+def test_lease_is_renewed_while_a_slow_batch_is_sent(smtp, monkeypatch):
+    # About 0.2 s per message: a batch of 8 takes well past the lease.
+    monkeypatch.setattr(outbox, "OUTBOX_LEASE_SECONDS", 1)
+    smtp.rtt = 0.04
+    recipients = queue_emails(8)
+    delivered = []
+
+    def worker(delay: float):
+        time.sleep(delay)
+        deadline = time.monotonic() + 4
+        while time.monotonic() < deadline:
+            delivered.append(outbox.dispatch_outbox(batch_size=8))
+            time.sleep(0.1)
+
+    # The later workers poll while the first one's batch is under way.
+    workers = [
+        threading.Thread(target=worker, args=(delay,))
+        for delay in (0, 0.2, 1.2)
+    ]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    assert sorted(smtp.delivered) == sorted(recipients)
+    assert sum(delivered) == len(recipients)
+    assert queued() == []
@@ -0,0 +1,54 @@
+# tests/test_password_reset.py
+import uuid
+
+from sqlalchemy import update
+
+from core.database import SessionLocal
+from core.hashing import hasher
+from core.query_budget import exempt_from_budget
+from models.password_reset import PasswordResetOTP
+
+
+def test_new_password_is_hashed_outside_the_otp_claim(
+    client, login, reset_codes, monkeypatch
+):
+    email = f"reset.{uuid.uuid4().hex[:8]}@example.com"
+    response = client.post(
+        "/user/register",
+        json={"name": "Pilgrim", "email": email, "password": "Reset@123"},
+    )
+    assert response.status_code == 201, response.text
+    response = client.post("/user/forgot-password", json={"email": email})
+    assert response.status_code == 200, response.text
+
+    hash_password = hasher.hash_password
+
+    def hash_while_others_write(password: str) -> str:
+        # Fails with "database is locked" if the claim is already held.
+        with exempt_from_budget(), SessionLocal() as db:
+            db.execute(
+                update(PasswordResetOTP)
+                .where(PasswordResetOTP.is_used == False)
+                .values(attempts=PasswordResetOTP.attempts)
+            )
+            db.commit()
+        return hash_password(password)
+
+    async def ahash_while_others_write(password: str) -> str:
+        return hash_while_others_write(password)
+
+    monkeypatch.setattr(hasher, "hash_password", hash_while_others_write)
+    monkeypatch.setattr(hasher, "ahash_password", ahash_while_others_write)
+
+    response = client.post(
+        "/user/reset-password",
+        json={
+            "email": email,
+            "otp": reset_codes(email),
+            "new_password": "Reset@456",
+        },
+    )
+    assert response.status_code == 200, response.text
+
+    monkeypatch.undo()
+    login(email, "Reset@456")
@@ -0,0 +1,82 @@
+# tests/test_pool_metrics.py
+"""
+Drive a server past its connection pool capacity and check that the pool
+metrics report the saturation. The server is a separate uvicorn process
+on the test database, with a deliberately tiny pool (2 + 1 overflow,
+short timeout); deselect with `-m "not slow"`.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from benchmarks.common import free_port, start_server
+from core.config import DEFAULT_ADMIN_EMAIL, DEFAULT_ADMIN_PASSWORD
+
+POOL_SIZE = 2
+MAX_OVERFLOW = 1
+CONCURRENCY = 32
+REQUESTS = 400
+
+
+@pytest.fixture
+def server(database):
+    port = free_port()
+    process = start_server(
+        port,
+        DB_POOL_SIZE=str(POOL_SIZE),
+        DB_MAX_OVERFLOW=str(MAX_OVERFLOW),
+        DB_POOL_TIMEOUT="0.05",
+    )
+    yield f"http://127.0.0.1:{port}"
+    process.terminate()
+    process.wait()
+
+
+async def hammer(base_url: str) -> tuple[dict, dict]:
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        response = await client.post("/auth/login", data={
+            "username": DEFAULT_ADMIN_EMAIL,
+            "password": DEFAULT_ADMIN_PASSWORD,
+        })
+        assert response.status_code == 200, response.text
+        headers = {
+            "Authorization": f"Bearer {response.json()['access_token']}"
+        }
+
+        statuses = {}
+        remaining = REQUESTS
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.get(
+                    "/user/me" if remaining % 2 else "/admin/trips",
+                    params={"limit": 200},
+                    headers=headers,
+                )
+                statuses[response.status_code] = (
+                    statuses.get(response.status_code, 0) + 1
+                )
+
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        response = await client.get("/admin/metrics/pool", headers=headers)
+        assert response.status_code == 200, response.text
+
+    return statuses, response.json()
+
+
+@pytest.mark.slow
+def test_pool_saturation_is_reported(server):
+    statuses, pool = asyncio.run(hammer(server))
+
+    # Only checkouts that gave up after DB_POOL_TIMEOUT may fail.
+    assert statuses[200] > 0 and set(statuses) <= {200, 500}, statuses
+    assert statuses.get(500, 0) <= pool["timeouts"], (statuses, pool)
+    assert pool["checked_out_peak"] == POOL_SIZE + MAX_OVERFLOW, pool
+    assert pool["overflow_connects"] >= 1, pool
+    waits = pool["checkout_wait_seconds"]
+    slow_waits = waits["count"] - waits["buckets"]["0.001"]
+    assert slow_waits > 0 or pool["timeouts"] > 0, pool
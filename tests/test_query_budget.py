@@ -0,0 +1,199 @@
+# tests/test_query_budget.py
+"""
+The suite runs with QUERY_BUDGET_MODE=enforce (see conftest), so a route
+that goes over its @query_budget fails the request that reaches it. This
+walks every budgeted route once, with the principal cache cold before
+each request and then warm: the principal lookup is left out of the
+budgets, so they hold either way.
+"""
+
+import io
+import uuid
+
+import pytest
+from PIL import Image
+
+from core import request_metrics
+from core.dependencies import principal_cache
+from core.query_budget import QueryBudgetExceeded
+
+
+def app_routes():
+    import main
+
+    for module in (main.auth, main.admin, main.agent, main.user, main.public):
+        yield from module.router.routes
+
+
+def budgeted_routes() -> set[tuple[str, str]]:
+    return {
+        (method, route.path)
+        for route in app_routes()
+        if hasattr(route.endpoint, "query_budget")
+        for method in route.methods
+    }
+
+
+@pytest.fixture
+def checked(monkeypatch) -> set[tuple[str, str]]:
+    """The (method, route) pairs checked against their budget."""
+    checked = set()
+    check_request = request_metrics.check_request
+
+    def record(scope, statements):
+        check_request(scope, statements)
+        if hasattr(scope["endpoint"], "query_budget"):
+            checked.add((scope["method"], scope["route"].path))
+
+    monkeypatch.setattr(request_metrics, "check_request", record)
+    return checked
+
+
+def png() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (40, 30)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("principals", ["cold", "warm"])
+def test_budgeted_routes_stay_within_budget(
+    principals, client, login, admin_headers, make_trip, checked, reset_codes
+):
+    def call(method: str, url: str, **kwargs) -> dict | list:
+        if principals == "cold":
+            principal_cache.clear()
+        response = client.request(method, url, **kwargs)
+        assert response.status_code < 400, (url, response.text)
+        content_type = response.headers.get("content-type", "")
+        if response.status_code == 204 or content_type.startswith("image/"):
+            return {}
+        return response.json()
+
+    tag = f"{principals}{uuid.uuid4().hex[:6]}"
+    trip = make_trip(title=f"Kedarnath {tag}", location=f"Kedarnath {tag}")
+
+    # Admin
+    users = call("GET", "/admin/users", headers=admin_headers)
+    user_id = users["items"][0]["id"]
+    call("GET", f"/admin/users/{user_id}", headers=admin_headers)
+    call("GET", "/admin/trips", headers=admin_headers)
+
+    agent_email = f"agent.{tag}@example.com"
+    agent = call(
+        "POST",
+        "/admin/agents",
+        params={
+            "name": "Agent", "email": agent_email, "password": "Agent@123"
+        },
+        headers=admin_headers,
+    )
+    pair = {"trip_id": trip["id"], "agent_id": agent["agent_id"]}
+    call(
+        "POST",
+        "/admin/trip-agents/assign",
+        json={"assignments": [pair]},
+        headers=admin_headers,
+    )
+
+    asset = call(
+        "POST",
+        "/admin/media",
+        content=png(),
+        headers={**admin_headers, "Content-Type": "image/png"},
+    )
+    call("GET", f"/admin/media/{asset['id']}", headers=admin_headers)
+    ad = call(
+        "POST",
+        "/admin/advertisements",
+        params={"title": tag, "asset_id": asset["id"], "trip_id": trip["id"]},
+        headers=admin_headers,
+    )
+    call("GET", "/admin/advertisements", headers=admin_headers)
+    call("GET", "/admin/advertisements/stats", headers=admin_headers)
+    call("GET", "/admin/advertisements/stats/trips", headers=admin_headers)
+
+    # Public
+    call("GET", "/public/feed")
+    call("GET", "/public/search", params={"q": "kedarnath"})
+    call("GET", "/public/locations", params={"q": "ked"})
+    call(
+        "POST",
+        "/public/advertisements/impressions",
+        json={"ad_ids": [ad["id"]]},
+    )
+    call("POST", f"/public/advertisements/{ad['id']}/click")
+    call("GET", f"/public/media/{asset['id']}/card")
+
+    # User
+    email = f"user.{tag}@example.com"
+    user = call(
+        "POST",
+        "/user/register",
+        json={"name": "Pilgrim", "email": email, "password": "User@123"},
+    )
+    user_headers = login(email, "User@123")
+    call("GET", "/user/me", headers=user_headers)
+    booking = call(
+        "POST",
+        "/user/bookings",
+        json={"trip_id": trip["id"]},
+        headers=user_headers,
+    )
+    call("GET", "/user/bookings", headers=user_headers)
+    call(
+        "POST", f"/user/bookings/{booking['id']}/confirm", headers=user_headers
+    )
+    call("DELETE", f"/user/bookings/{booking['id']}", headers=user_headers)
+
+    call("POST", "/user/forgot-password", json={"email": email})
+    otp = reset_codes(email)
+    call("POST", "/user/verify-otp", json={"email": email, "otp": otp})
+    call(
+        "POST",
+        "/user/reset-password",
+        json={"email": email, "otp": otp, "new_password": "User@456"},
+    )
+
+    # Agent
+    agent_headers = login(agent_email, "Agent@123")
+    call("GET", "/agent/assigned-trips", headers=agent_headers)
+    booking = call(
+        "POST",
+        "/agent/bookings",
+        json={"trip_id": trip["id"], "user_id": user["id"]},
+        headers=agent_headers,
+    )
+    call("GET", "/agent/bookings", headers=agent_headers)
+    url = f"/agent/bookings/{booking['id']}"
+    call("POST", f"{url}/confirm", headers=agent_headers)
+    call("DELETE", url, headers=agent_headers)
+
+    call(
+        "POST",
+        "/admin/trip-agents/unassign",
+        json={"assignments": [pair]},
+        headers=admin_headers,
+    )
+    call("POST", "/auth/logout", headers=agent_headers)
+
+    assert checked == budgeted_routes()
+
+
+def test_over_budget_route_fails_the_request(client, login, monkeypatch):
+    (route,) = [
+        route
+        for route in app_routes()
+        if route.path == "/user/me" and "GET" in route.methods
+    ]
+    monkeypatch.setattr(route.endpoint, "query_budget", 0)
+
+    email = f"user.{uuid.uuid4().hex[:8]}@example.com"
+    response = client.post(
+        "/user/register",
+        json={"name": "Pilgrim", "email": email, "password": "User@123"},
+    )
+    assert response.status_code == 201, response.text
+    headers = login(email, "User@123")
+
+    with pytest.raises(QueryBudgetExceeded, match="GET /user/me issued 1"):
+        client.get("/user/me", headers=headers)
@@ -0,0 +1,110 @@
+# tests/test_rate_limit.py
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from core import rate_limit
+from core.cache import MemoryBackend
+from core.rate_limit import (
+    Limit,
+    LocalCounters,
+    RateLimiter,
+    SharedCounters,
+    counter_store,
+)
+
+
+class Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_parse_limit():
+    assert Limit.parse("10/300") == Limit(10, 300)
+    assert Limit.parse("") is None
+    assert Limit.parse("0") is None
+    with pytest.raises(RuntimeError):
+        Limit.parse("10 per minute")
+    with pytest.raises(RuntimeError):
+        Limit.parse("0/60")
+
+
+def test_sliding_window():
+    clock = Clock(30.0)  # halfway through window 0
+    limiter = RateLimiter(LocalCounters(100), clock)
+    limit = Limit(2, 60)
+
+    assert limiter.hit("key", limit) == 0
+    assert limiter.hit("key", limit) == 0
+    # The rejected hit counts too: window 0 ends with 3.
+    assert limiter.hit("key", limit) == pytest.approx(70)
+
+    # 40 s into window 1, window 0 still weighs 3 * 20/60 = 1.
+    clock.now = 100.0
+    assert limiter.hit("key", limit) == 0
+    assert limiter.hit("key", limit) == pytest.approx(50)
+
+    # Two windows on, nothing is left of either.
+    clock.now = 220.0
+    assert limiter.hit("key", limit) == 0
+    # Keys are counted separately.
+    assert limiter.hit("other", limit) == 0
+
+
+def test_shared_store_limits_across_workers():
+    assert counter_store("memory://", 100).shared
+    assert not counter_store("", 100).shared
+
+    clock = Clock(30.0)
+    limit = Limit(3, 60)
+    backend = MemoryBackend()
+    shared = [RateLimiter(SharedCounters(backend), clock) for _ in range(2)]
+    local = [RateLimiter(LocalCounters(100), clock) for _ in range(2)]
+
+    # One budget across both workers...
+    assert [worker.hit("key", limit) for worker in shared * 2] == [
+        0, 0, 0, pytest.approx(60)
+    ]
+    # ...where per-process counters give each worker its own.
+    assert [worker.hit("key", limit) for worker in local * 2] == [0, 0, 0, 0]
+
+
+@pytest.fixture
+def limited_client(monkeypatch):
+    monkeypatch.setattr(
+        rate_limit,
+        "limiter",
+        RateLimiter(SharedCounters(MemoryBackend()), Clock(30.0)),
+    )
+    app = FastAPI()
+    check = rate_limit.rate_limit(
+        "test", ip=Limit(4, 60), account=Limit(2, 60)
+    )
+
+    @app.post("/login", dependencies=[Depends(check)])
+    def login():
+        return {"message": "ok"}
+
+    return TestClient(app)
+
+
+def test_over_limit_is_429_with_retry_after(limited_client):
+    def login(email: str):
+        return limited_client.post("/login", json={"email": email})
+
+    assert login("a@example.com").status_code == 200
+    # Accounts are matched case-insensitively.
+    assert login(" A@example.com").status_code == 200
+
+    response = login("a@example.com")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "70"
+
+    # Another account is fine, until the address reaches its limit of 4.
+    assert login("b@example.com").status_code == 200
+    response = login("c@example.com")
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
@@ -0,0 +1,9 @@
+# tests/test_search.py
+def test_trip_without_indexable_words_is_published(client, make_trip):
+    # No word reaches MIN_WORD_LENGTH, so nothing joins the vocabulary.
+    trip = make_trip(title="Goa", description="fun", location="Goa")
+
+    assert trip["status"] == "PUBLISHED"
+    response = client.get("/public/search", params={"q": "goa"})
+    assert response.status_code == 200, response.text
+    assert [item["id"] for item in response.json()["items"]] == [trip["id"]]
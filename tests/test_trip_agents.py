@@ -0,0 +1,34 @@
+# tests/test_trip_agents.py
+import uuid
+
+
+def assign(client, headers, *pairs):
+    return client.post(
+        "/admin/trip-agents/assign",
+        json={
+            "assignments": [
+                {"trip_id": str(trip_id), "agent_id": str(agent_id)}
+                for trip_id, agent_id in pairs
+            ]
+        },
+        headers=headers,
+    )
+
+
+def test_assign_unknown_trip_is_404(client, admin_headers):
+    trip_id, agent_id = uuid.uuid4(), uuid.uuid4()
+
+    response = assign(client, admin_headers, (trip_id, agent_id))
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == f"Trip not found: {trip_id}"
+
+
+def test_assign_unknown_agent_is_404(client, admin_headers, make_trip):
+    trip = make_trip()
+    agent_id = uuid.uuid4()
+
+    response = assign(client, admin_headers, (trip["id"], agent_id))
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == f"Agent not found: {agent_id}"
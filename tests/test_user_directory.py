@@ -0,0 +1,26 @@
+# tests/test_user_directory.py
+from core.database import SessionLocal
+from core.security import hash_password
+from models.enums import UserRole
+from models.user import User
+
+
+def test_directory_lists_user_with_invalid_stored_email(client, admin_headers):
+    with SessionLocal() as db:
+        db.add(User(
+            name="Legacy Agent",
+            email="legacy-agent",
+            password_hash=hash_password("Legacy@123"),
+            role=UserRole.AGENT,
+            is_active=True,
+        ))
+        db.commit()
+
+    response = client.get(
+        "/admin/users", params={"name": "legacy"}, headers=admin_headers
+    )
+
+    assert response.status_code == 200, response.text
+    assert [user["email"] for user in response.json()["items"]] == [
+        "legacy-agent"
+    ]